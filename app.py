@@ -1,25 +1,179 @@
-from flask import Flask, request, jsonify, render_template
+from flask import Flask, Response, g, request, jsonify, render_template, send_file
+import json
+import logging
+import re
+import time
 import os
 import sys
-from datetime import date, datetime
+from datetime import date
 
 # Add project root to sys.path for module imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from dto.catalog import Catalog
-from service.catalog_service import CatalogService
-from exception.catalog_exception import ValidationError, DataNotFoundError, DatabaseConnectionError
-from utils.validation import validate_alphanumeric_string, validate_date, validate_status, validate_int
+from service.catalog_service import (CatalogService, CATALOG_COLUMNS, SORTABLE_COLUMNS, RELEVANCE_SORT,
+                                     DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, MAX_BULK_ITEMS,
+                                     DEFAULT_CHANGE_LIMIT, MAX_CHANGE_LIMIT, LIST_FILTERS)
+from service.catalog_import import CatalogImporter, IMPORT_FORMATS, describe_import
+from service.maintenance import start_scheduler, start_cache_sync
+from exception.catalog_exception import (ValidationError, DataNotFoundError, DatabaseConnectionError,
+                                        ChangeTokenExpiredError)
+from utils.validation import (catalog_validator, validate_catalog_payload, validate_status, validate_int,
+                              validate_limit, validate_choice, validate_fields, validate_change_token,
+                              validate_filter_date)
+from utils.pagination import encode_cursor, decode_cursor
+from utils.cache import compute_etag
+from utils.export import ndjson_chunks, csv_chunks, gzip_chunks, json_array_chunks, row_encoder
+from utils.db_get_connection import get_pool, load_config
+from utils.metrics import metrics, start_request_profile, finish_request_profile
+from utils.routing import get_router, pin_reads_to_primary
+from utils.change_feed import StreamSlots
+from utils.migrations import unapplied_migrations
 
 app = Flask(__name__)
 # Use an environment variable for secret key in production, fallback for development
 app.secret_key = os.getenv('FLASK_SECRET_KEY', 'dev_secret_key_please_change')
 
+server_logger = logging.getLogger('catalog.server')
+
 catalog_service = CatalogService()
+stream_slots = StreamSlots()
+
+BULK_MODES = ('atomic', 'best_effort')
+IMPORT_ID_PATTERN = re.compile(r'^[0-9a-f]{32}$')
+EXPORT_FORMATS = {
+    'ndjson': (ndjson_chunks, 'application/x-ndjson'),
+    'csv': (csv_chunks, 'text/csv')
+}
+WRITE_METHODS = ('POST', 'PUT', 'DELETE')
+PRIMARY_PIN_COOKIE = 'catalog_primary_until' # Epoch seconds until which the client's reads use the primary
+
+def collect_service_gauges() -> list:
+    """Reports connection pool, cache and change-stream counters as gauges on each /metrics scrape."""
+    gauges = []
+    for key, value in catalog_service.get_pool_stats().items():
+        gauges.append(('catalog_db_pool', "Connection pool state and counters.", {'stat': key}, value))
+    for key, value in catalog_service.get_cache_stats().items():
+        if isinstance(value, (int, float)):
+            gauges.append(('catalog_cache', "Catalog cache counters.", {'stat': key}, value))
+    for node, stats in catalog_service.get_node_stats().items():
+        labels = {'node': node, 'role': stats['role']}
+        gauges.append(('catalog_db_node_queries', "Queries served by each database node.", labels, stats['queries']))
+        gauges.append(('catalog_db_node_healthy', "1 if the node is taking queries.", labels, int(stats['healthy'])))
+        gauges.append(('catalog_db_node_in_use', "Connections checked out per node.", labels, stats['in_use']))
+        if stats['lag_seconds'] is not None:
+            gauges.append(('catalog_db_replica_lag_seconds', "Replication lag at the last health check.",
+                           labels, stats['lag_seconds']))
+    gauges.append(('catalog_change_streams_open', "Change streams open in this worker.", {'pid': os.getpid()},
+                   stream_slots.open))
+    return gauges
+
+metrics.add_collector(collect_service_gauges)
+
+def warm_up() -> dict:
+    """
+    Prepares a freshly started worker process before it takes traffic, so its first requests don't
+    pay one-off costs: opens the connection pool's idle connections, runs the payload validator once
+    (so today's date is cached), compiles the JSON row encoder for full list pages and compiles the
+    templates. Also starts the worker's replica health checks, maintenance scheduler and, for a
+    per-process cache, its sync with the change log. A database outage is logged rather than raised;
+    requests then fail and retry as usual.
+    Returns the seconds spent on each step.
+    """
+    timings = {}
+    started = time.perf_counter()
+    get_router() # Starts replica health checks
+    start_scheduler(catalog_service)
+    pool = get_pool()
+    connections = []
+    try:
+        for _ in range(pool.pool_size):
+            connections.append(pool.acquire())
+    except DatabaseConnectionError as e:
+        server_logger.warning("Worker %d could not reach the database during warm-up: %s", os.getpid(), e)
+    finally:
+        for conn in connections:
+            pool.release(conn)
+    catalog_service.get_cache_stats() # Builds the configured cache backend
+    start_cache_sync(catalog_service)
+    timings['database'] = time.perf_counter() - started
+
+    mark = time.perf_counter()
+    today = date.today().isoformat()
+    validate_catalog_payload({'name': 'Warm up', 'description': 'Warm up', 'start_date': today,
+                              'end_date': today, 'status': 'active'})
+    row_encoder(CATALOG_COLUMNS) # Compiles the encoder for full-width list pages
+    timings['validators'] = time.perf_counter() - mark
+
+    mark = time.perf_counter()
+    for template in ('index.html', '404.html', '500.html'):
+        app.jinja_env.get_template(template)
+    timings['templates'] = time.perf_counter() - mark
+    return timings
+
+@app.before_request
+def start_request_timer() -> None:
+    """Starts timing the request and, for a sampled fraction of requests, a profiler."""
+    g.request_started = time.perf_counter()
+    g.profiler = start_request_profile()
+
+@app.before_request
+def route_reads_after_writes() -> None:
+    """Serves reads from the primary while the client's read-your-writes window is open, so it sees its own changes."""
+    try:
+        pinned = float(request.cookies.get(PRIMARY_PIN_COOKIE, 0)) > time.time()
+    except ValueError:
+        pinned = False
+    pin_reads_to_primary(pinned)
+
+@app.after_request
+def open_read_your_writes_window(response):
+    """After a successful write, pins the client's reads to the primary for read_your_writes_seconds."""
+    if request.method in WRITE_METHODS and response.status_code < 400 and get_router().replicas:
+        window = load_config().getfloat('routing', 'read_your_writes_seconds', fallback=5.0)
+        response.set_cookie(PRIMARY_PIN_COOKIE, f"{time.time() + window:.3f}", max_age=max(1, round(window)),
+                            httponly=True, samesite='Lax')
+    return response
 
-def api_response(data: any = None, message: str = "Success", status_code: int = 200) -> tuple[jsonify, int]:
-    """Centralized function for consistent API responses."""
-    return jsonify({"message": message, "data": data}), status_code
+@app.after_request
+def record_request_metrics(response):
+    """Records route latency and status code; streamed responses are timed up to their first byte."""
+    route = request.url_rule.rule if request.url_rule else 'unmatched'
+    elapsed = time.perf_counter() - g.request_started
+    metrics.observe('catalog_http_request_duration_seconds', elapsed, route=route, method=request.method)
+    metrics.inc('catalog_http_requests_total', route=route, method=request.method, status=response.status_code)
+    if g.profiler is not None:
+        finish_request_profile(g.profiler, f"{request.method} {route}")
+    return response
+
+def timed_serialization(build_data):
+    """Runs a payload builder and records how long serialization took for the current route."""
+    started = time.perf_counter()
+    data = build_data()
+    route = request.url_rule.rule if request.url_rule else 'unmatched'
+    metrics.observe('catalog_serialization_duration_seconds', time.perf_counter() - started, route=route)
+    return data
+
+def api_response(data: any = None, message: str = "Success", status_code: int = 200, meta: dict = None) -> tuple[jsonify, int]:
+    """Centralized function for consistent API responses. Pagination details go in the optional meta block."""
+    payload = {"message": message, "data": data}
+    if meta is not None:
+        payload["meta"] = meta
+    return jsonify(payload), status_code
+
+def api_list_response(columns: list, rows: list, meta: dict = None, message: str = "Success") -> tuple[Response, int]:
+    """
+    Same payload as api_response() for a list of row tuples, but each row is encoded once by a
+    compiled row encoder instead of being turned into a dict and passed through jsonify.
+    """
+    def build_body() -> str:
+        parts = ['{"message":', json.dumps(message), ',"data":']
+        parts.extend(json_array_chunks(columns, rows))
+        if meta is not None:
+            parts += [',"meta":', json.dumps(meta)]
+        parts.append('}')
+        # Pages are capped at MAX_PAGE_SIZE, so one body with a Content-Length beats a chunked stream
+        return ''.join(parts)
+    return app.response_class(timed_serialization(build_body), mimetype='application/json'), 200
 
 def api_error_response(message: str, status_code: int, details: Exception = None) -> tuple[jsonify, int]:
     """Centralized function for consistent API error responses."""
@@ -28,16 +182,124 @@ def api_error_response(message: str, status_code: int, details: Exception = None
         error_payload['details'] = str(details)
     return jsonify(error_payload), status_code
 
-def serialize_catalog_for_json(catalog_data: dict) -> dict:
-    """Converts catalog database row to JSON-serializable dictionary, formatting dates."""
-    if not catalog_data:
-        return None
-    # Create a copy to modify without affecting original DB fetched dict
-    serialized_data = catalog_data.copy()
-    for key in ['start_date', 'end_date']:
-        if key in serialized_data and isinstance(serialized_data[key], (date, datetime)):
-            serialized_data[key] = serialized_data[key].strftime('%Y-%m-%d')
-    return serialized_data
+def conditional_api_response(entries: list, build_response) -> tuple[jsonify, int]:
+    """
+    Answers a conditional GET from the validators of the cache entries behind a response.
+    Returns 304 without building the payload when the client's copy is current; otherwise
+    calls build_response() for the (response, status) pair and attaches ETag and Last-Modified headers.
+    """
+    etag = entries[0].etag if len(entries) == 1 else compute_etag(tuple(entry.etag for entry in entries))
+    last_modified = max(entry.last_modified for entry in entries)
+    if request.if_none_match:
+        not_modified = request.if_none_match.contains(etag)
+    else:
+        not_modified = request.if_modified_since is not None and last_modified <= request.if_modified_since
+
+    if not_modified:
+        response, status_code = app.response_class(status=304), 304
+    else:
+        response, status_code = build_response()
+    response.set_etag(etag)
+    response.last_modified = last_modified
+    response.headers['Cache-Control'] = 'no-cache' # Clients may store it but must revalidate
+    return response, status_code
+
+def parse_list_filters() -> dict:
+    """
+    Reads the status, starts_after/starts_before and ends_after/ends_before query parameters shared by
+    the list and export endpoints into a filters dict for CatalogService. Date bounds are inclusive.
+    """
+    filters = {}
+    for name in LIST_FILTERS:
+        value = request.args.get(name, '').strip()
+        if value:
+            filters[name] = validate_status(value) if name == 'status' else validate_filter_date(value, name)
+    for lower, upper in (('starts_after', 'starts_before'), ('ends_after', 'ends_before')):
+        if lower in filters and upper in filters and filters[lower] > filters[upper]:
+            raise ValidationError(f"{lower} cannot be later than {upper}.")
+    return filters
+
+def parse_bulk_id(value) -> int:
+    """Validates a catalog ID given in a bulk request as a JSON number or string."""
+    if isinstance(value, bool):
+        raise ValidationError("ID must be a positive integer.")
+    return validate_int(str(value) if value is not None else None)
+
+def run_bulk_request(parse_items, write_items, success_status: int = 200) -> tuple[jsonify, int]:
+    """
+    Shared handler for the bulk endpoints. Expects {"items": [...], "mode": "atomic"|"best_effort"}.
+    All items are validated at once with parse_items(items), which returns one (catalog_id or None, value)
+    pair or ValidationError per item; valid values are written with write_items(values, atomic).
+    Responds with one result per input item, in order.
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict) or not isinstance(data.get('items'), list) or not data['items']:
+        return api_error_response('Request body must be a JSON object with a non-empty "items" array.', 400)
+    items = data['items']
+    if len(items) > MAX_BULK_ITEMS:
+        return api_error_response(f"A bulk request may contain at most {MAX_BULK_ITEMS} items.", 413)
+    try:
+        atomic = validate_choice(data.get('mode'), "Mode", BULK_MODES, 'atomic') == 'atomic'
+    except ValidationError as e:
+        return api_error_response(str(e), 400, e)
+
+    results = [None] * len(items)
+    valid_indexes = []
+    values = []
+    seen_ids = set()
+    for index, parsed in enumerate(parse_items(items)):
+        try:
+            if isinstance(parsed, ValidationError):
+                raise parsed
+            catalog_id, value = parsed
+            if catalog_id is not None:
+                if catalog_id in seen_ids:
+                    raise ValidationError(f"Duplicate catalog_id {catalog_id} in request.")
+                seen_ids.add(catalog_id)
+            valid_indexes.append(index)
+            values.append(value)
+        except ValidationError as e:
+            results[index] = {'index': index, 'status': 'failed', 'error': str(e)}
+
+    if atomic and len(values) < len(items):
+        for index in valid_indexes:
+            results[index] = {'index': index, 'status': 'skipped'}
+        return api_response({'results': results, 'succeeded': 0, 'failed': len(items) - len(values)},
+                            "Validation failed; no changes were made.", 400)
+
+    try:
+        written = write_items(values, atomic) if values else []
+    except DatabaseConnectionError as e:
+        return api_error_response("Failed to connect to the database. Please try again later.", 500, e)
+    except Exception as e:
+        return api_error_response("An unexpected error occurred while processing the bulk request.", 500, e)
+
+    for index, result in zip(valid_indexes, written):
+        results[index] = {'index': index, **result}
+    failed = sum(1 for result in results if result['status'] == 'failed')
+    succeeded = sum(1 for result in results if result['status'] in ('created', 'updated', 'deleted'))
+    summary = {'results': results, 'succeeded': succeeded, 'failed': failed}
+    if failed == 0:
+        return api_response(summary, f"{succeeded} item(s) processed successfully.", success_status)
+    if atomic:
+        return api_response(summary, "Some items could not be processed; no changes were made.", 404)
+    return api_response(summary, f"{succeeded} item(s) processed, {failed} failed.", 207)
+
+def serialize_changes(result: dict) -> dict:
+    """Converts a CatalogService.get_changes() result to a JSON-serializable dictionary."""
+    return {
+        'changes': [{**change, 'catalog': change['catalog'].to_dict()} if change['op'] == 'upsert'
+                    else change for change in result['changes']],
+        'token': str(result['token']),
+        'has_more': result['has_more']
+    }
+
+def format_sse(event: str, data: dict, event_id: int = None) -> str:
+    """Formats one server-sent event; the id is what EventSource sends back as Last-Event-ID on reconnect."""
+    lines = [f"id: {event_id}"] if event_id is not None else []
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, separators=(',', ':'))}")
+    return '\n'.join(lines) + '\n\n'
 
 @app.route('/')
 def index_page() -> str:
@@ -46,24 +308,189 @@ def index_page() -> str:
 
 @app.route('/api/catalogs', methods=['GET'])
 def get_all_catalogs_api() -> tuple[jsonify, int]:
-    """API endpoint to retrieve all catalog entries with optional search."""
+    """
+    API endpoint to retrieve one page of catalog entries with optional search.
+    Query parameters: limit, after (cursor from meta.next_cursor), sort, order, fields, total (approx|exact),
+    status and the inclusive date bounds starts_after, starts_before, ends_after and ends_before (YYYY-MM-DD).
+    sort=relevance ranks search matches and returns only the top `limit` results.
+    meta.change_token is the change-feed token the page was read at; replay /api/catalogs/changes from it
+    to bring the page up to date.
+    """
     search_term = request.args.get('search', '').strip()
     try:
-        catalogs_data = catalog_service.get_all_catalog(search_term)
-        serialized_catalogs = [serialize_catalog_for_json(c) for c in catalogs_data]
-        return api_response(serialized_catalogs)
+        limit = validate_limit(request.args.get('limit'), DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
+        sort = validate_choice(request.args.get('sort'), "Sort", SORTABLE_COLUMNS + (RELEVANCE_SORT,), 'catalog_id')
+        if sort == RELEVANCE_SORT and not search_term:
+            raise ValidationError("Sorting by relevance requires a search term.")
+        order = validate_choice(request.args.get('order'), "Order", ('asc', 'desc'), 'asc')
+        fields = validate_fields(request.args.get('fields'), CATALOG_COLUMNS)
+        total_mode = validate_choice(request.args.get('total'), "Total", ('approx', 'exact'), None)
+        filters = parse_list_filters()
+        after = decode_cursor(request.args.get('after'), sort, order)
+
+        page_entry = catalog_service.get_catalog_page_entry(
+            search_term, limit=limit, after=after, sort=sort, descending=order == 'desc', fields=fields,
+            filters=filters)
+        entries = [page_entry]
+        columns, rows, next_keyset, change_token = page_entry.value
+        meta = {
+            'limit': limit,
+            'next_cursor': encode_cursor(sort, order, next_keyset) if next_keyset else None,
+            'change_token': str(change_token)
+        }
+        if total_mode:
+            count_entry = catalog_service.count_catalogs_entry(search_term, approximate=total_mode == 'approx',
+                                                               filters=filters)
+            entries.append(count_entry)
+            meta['total'] = count_entry.value
+        return conditional_api_response(entries, lambda: api_list_response(columns, rows, meta))
+    except ValidationError as e:
+        return api_error_response(str(e), 400, e)
     except DatabaseConnectionError as e:
         return api_error_response("Failed to connect to the database. Please try again later.", 500, e)
     except Exception as e:
         return api_error_response("An unexpected error occurred while fetching catalogs.", 500, e)
 
+@app.route('/api/catalogs/export', methods=['GET'])
+def export_catalogs_api() -> Response:
+    """
+    API endpoint to stream every catalog entry as NDJSON or CSV.
+    Query parameters: format (ndjson|csv), search, fields, compress=gzip and the list filters
+    (status, starts_after, starts_before, ends_after, ends_before).
+    """
+    search_term = request.args.get('search', '').strip()
+    try:
+        export_format = validate_choice(request.args.get('format'), "Format", tuple(EXPORT_FORMATS), 'ndjson')
+        filters = parse_list_filters()
+        fields = validate_fields(request.args.get('fields'), CATALOG_COLUMNS)
+        compress = validate_choice(request.args.get('compress'), "Compress", ('gzip',), None)
+
+        chunks = catalog_service.stream_catalogs(search_term, filters=filters, fields=fields)
+        # Pull the first chunk now so connection and query errors still produce an error response
+        first_chunk = next(chunks, None)
+    except ValidationError as e:
+        return api_error_response(str(e), 400, e)
+    except DatabaseConnectionError as e:
+        return api_error_response("Failed to connect to the database. Please try again later.", 500, e)
+    except Exception as e:
+        return api_error_response("An unexpected error occurred while exporting catalogs.", 500, e)
+
+    def row_chunks():
+        if first_chunk is not None:
+            yield first_chunk
+            yield from chunks
+
+    format_chunks, mimetype = EXPORT_FORMATS[export_format]
+    columns = [c for c in CATALOG_COLUMNS if c in fields] if fields else list(CATALOG_COLUMNS)
+    body = format_chunks(columns, row_chunks())
+    filename = f"catalogs.{export_format}"
+    if compress:
+        body = gzip_chunks(body)
+        mimetype = 'application/gzip'
+        filename += '.gz'
+    response = Response(body, mimetype=mimetype)
+    response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+@app.route('/api/catalogs/changes', methods=['GET'])
+def get_catalog_changes_api() -> tuple[jsonify, int]:
+    """
+    API endpoint for delta sync. Without `since` it returns only the current token; with since=<token>
+    it returns every catalog created, updated or deleted after that token, one entry per catalog, and
+    the token to send next. Query parameters: since and limit. Responds 410 when the token has expired.
+    """
+    try:
+        limit = validate_limit(request.args.get('limit'), DEFAULT_CHANGE_LIMIT, MAX_CHANGE_LIMIT)
+        if request.args.get('since') is None:
+            result = {'changes': [], 'token': catalog_service.get_change_token(), 'has_more': False}
+        else:
+            result = catalog_service.get_changes(validate_change_token(request.args['since']), limit)
+        return api_response(timed_serialization(lambda: serialize_changes(result)))
+    except ValidationError as e:
+        return api_error_response(str(e), 400, e)
+    except ChangeTokenExpiredError as e:
+        return api_error_response(str(e), 410, e)
+    except DatabaseConnectionError as e:
+        return api_error_response("Failed to connect to the database. Please try again later.", 500, e)
+    except Exception as e:
+        return api_error_response("An unexpected error occurred while fetching catalog changes.", 500, e)
+
+def close_streams() -> None:
+    """Ends every open change stream within a poll interval; called when the worker starts shutting down."""
+    stream_slots.closing.set()
+    catalog_service.change_notifier.notify() # Wakes streams waiting for a write
+
+@app.route('/api/catalogs/stream', methods=['GET'])
+def stream_catalog_changes_api() -> Response:
+    """
+    Server-sent events feed of catalog changes, starting after `since`, the Last-Event-ID header an
+    EventSource sends when it reconnects, or the current token. Sends 'ready' with the starting token,
+    then a 'changes' event (the /api/catalogs/changes payload) as writes commit, and 'reset' before
+    closing if the token expires. Writes in this process are pushed at once; writes in other worker
+    processes are picked up every poll_seconds. Streams close after max_stream_seconds, or as soon as
+    the worker shuts down, and the browser reconnects from the last event ID. Each open stream holds a
+    request thread, so at most max_streams_per_worker are open at once; beyond that the request gets 503,
+    which EventSource does not retry, and the SPA falls back to refetching after its own writes.
+    """
+    config = load_config()
+    poll_seconds = config.getfloat('changes', 'poll_seconds', fallback=2.0)
+    heartbeat_seconds = config.getfloat('changes', 'heartbeat_seconds', fallback=15.0)
+    max_stream_seconds = config.getfloat('changes', 'max_stream_seconds', fallback=300.0)
+    max_streams = config.getint('changes', 'max_streams_per_worker', fallback=8)
+    try:
+        since = request.args.get('since') or request.headers.get('Last-Event-ID')
+        start_token = validate_change_token(since) if since else catalog_service.get_change_token()
+    except ValidationError as e:
+        return api_error_response(str(e), 400, e)
+    except DatabaseConnectionError as e:
+        return api_error_response("Failed to connect to the database. Please try again later.", 500, e)
+    except Exception as e:
+        return api_error_response("An unexpected error occurred while opening the change stream.", 500, e)
+    if not stream_slots.acquire(max_streams):
+        response, status_code = api_error_response("Too many open change streams; try again later.", 503)
+        response.headers['Retry-After'] = str(int(max_stream_seconds))
+        return response, status_code
+
+    notifier = catalog_service.change_notifier
+
+    def events():
+        token = start_token
+        yield f"retry: {int(poll_seconds * 1000)}\n" + format_sse('ready', {'token': str(token)}, token)
+        deadline = time.monotonic() + max_stream_seconds
+        last_sent = time.monotonic()
+        seen = notifier.version # Read before querying so a commit during the query is not missed
+        while time.monotonic() < deadline and not stream_slots.closing.is_set():
+            try:
+                result = catalog_service.get_changes(token)
+            except ChangeTokenExpiredError as e:
+                yield format_sse('reset', {'error': str(e)})
+                return
+            except DatabaseConnectionError:
+                return # The client reconnects and resumes from its last event ID
+            if result['changes']:
+                token = result['token']
+                yield format_sse('changes', serialize_changes(result), token)
+                last_sent = time.monotonic()
+                if result['has_more']:
+                    continue
+            elif time.monotonic() - last_sent >= heartbeat_seconds:
+                yield ": keep-alive\n\n" # Comment line; keeps proxies from closing an idle stream
+                last_sent = time.monotonic()
+            seen = notifier.wait(seen, poll_seconds)
+
+    response = Response(events(), mimetype='text/event-stream')
+    # Runs when the server closes the response, even if the client left before the first event
+    response.call_on_close(stream_slots.release)
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no' # Stop nginx from buffering events
+    return response
+
 @app.route('/api/catalogs/<int:catalog_id>', methods=['GET'])
 def get_catalog_by_id_api(catalog_id: int) -> tuple[jsonify, int]:
     """API endpoint to retrieve a single catalog by ID."""
     try:
-        catalog_data = catalog_service.get_catalog_by_id(catalog_id)
-        serialized_catalog = serialize_catalog_for_json(catalog_data)
-        return api_response(serialized_catalog)
+        entry = catalog_service.get_catalog_entry(catalog_id)
+        return conditional_api_response([entry], lambda: api_response(timed_serialization(entry.value.to_dict)))
     except DataNotFoundError as e:
         return api_error_response(str(e), 404, e)
     except DatabaseConnectionError as e:
@@ -79,19 +506,7 @@ def add_catalog_api() -> tuple[jsonify, int]:
         return api_error_response("Invalid JSON data in request body.", 400)
 
     try:
-        # Input validation using utility functions
-        name = validate_alphanumeric_string(data.get('name'), "Name", max_length=30)
-        description = validate_alphanumeric_string(data.get('description'), "Description", max_length=50)
-        start_date = validate_date(data.get('start_date'))
-        end_date = validate_date(data.get('end_date'))
-        status = validate_status(data.get('status'))
-
-        if datetime.strptime(start_date, '%Y-%m-%d') > datetime.strptime(end_date, '%Y-%m-%d'):
-            raise ValidationError("End Date cannot be before Start Date.")
-
-        new_catalog = Catalog(name=name, description=description,
-                              start_date=start_date, end_date=end_date, status=status)
-        
+        new_catalog = validate_catalog_payload(data)
         catalog_id = catalog_service.create_catalog(new_catalog)
         return api_response({'catalog_id': catalog_id}, 'Catalog created successfully.', 201)
     except ValidationError as e:
@@ -109,18 +524,7 @@ def update_catalog_api(catalog_id: int) -> tuple[jsonify, int]:
         return api_error_response("Invalid JSON data in request body.", 400)
 
     try:
-        # Input validation using utility functions
-        name = validate_alphanumeric_string(data.get('name'), "Name", max_length=30)
-        description = validate_alphanumeric_string(data.get('description'), "Description", max_length=50)
-        start_date = validate_date(data.get('start_date'))
-        end_date = validate_date(data.get('end_date'))
-        status = validate_status(data.get('status'))
-
-        if datetime.strptime(start_date, '%Y-%m-%d') > datetime.strptime(end_date, '%Y-%m-%d'):
-            raise ValidationError("End Date cannot be before Start Date.")
-
-        updated_catalog = Catalog(name=name, description=description,
-                                  start_date=start_date, end_date=end_date, status=status)
+        updated_catalog = validate_catalog_payload(data)
 
         catalog_service.update_catalog_by_id(catalog_id, updated_catalog)
         return api_response(message=f'Catalog ID {catalog_id} updated successfully.')
@@ -146,6 +550,136 @@ def delete_catalog_api(catalog_id: int) -> tuple[jsonify, int]:
     except Exception as e:
         return api_error_response(f"An unexpected error occurred during catalog deletion: {e}", 500)
 
+@app.route('/api/catalogs/bulk', methods=['POST'])
+def bulk_add_catalogs_api() -> tuple[jsonify, int]:
+    """API endpoint to create many catalog entries; items are catalog objects."""
+    def parse_items(items):
+        return [result if isinstance(result, ValidationError) else (None, result)
+                for result in catalog_validator.validate_batch(items)]
+    return run_bulk_request(parse_items, catalog_service.bulk_create_catalogs, 201)
+
+@app.route('/api/catalogs/bulk', methods=['PUT'])
+def bulk_update_catalogs_api() -> tuple[jsonify, int]:
+    """API endpoint to update many catalog entries; items are catalog objects that include catalog_id."""
+    def parse_items(items):
+        parsed = []
+        for item, result in zip(items, catalog_validator.validate_batch(items)):
+            try:
+                if isinstance(result, ValidationError):
+                    raise result
+                catalog_id = parse_bulk_id(item.get('catalog_id'))
+                parsed.append((catalog_id, (catalog_id, result)))
+            except ValidationError as e:
+                parsed.append(e)
+        return parsed
+    return run_bulk_request(parse_items, catalog_service.bulk_update_catalogs)
+
+@app.route('/api/catalogs/bulk', methods=['DELETE'])
+def bulk_delete_catalogs_api() -> tuple[jsonify, int]:
+    """API endpoint to delete many catalog entries; items are catalog IDs."""
+    def parse_items(items):
+        parsed = []
+        for item in items:
+            try:
+                catalog_id = parse_bulk_id(item)
+                parsed.append((catalog_id, catalog_id))
+            except ValidationError as e:
+                parsed.append(e)
+        return parsed
+    return run_bulk_request(parse_items, catalog_service.bulk_delete_catalogs)
+
+def get_importer() -> CatalogImporter:
+    """Builds a CatalogImporter from the [import] section of config.ini."""
+    config = load_config()
+    report_dir = config.get('import', 'report_dir', fallback='imports')
+    if not os.path.isabs(report_dir):
+        report_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), report_dir)
+    return CatalogImporter(catalog_service, report_dir, config.getint('import', 'batch_size', fallback=1000))
+
+def validate_import_id(value: str) -> str:
+    """Validates an import ID as issued by POST /api/imports."""
+    if not value or not IMPORT_ID_PATTERN.match(value):
+        raise ValidationError("Import ID must be a 32-character hexadecimal string.")
+    return value
+
+@app.route('/api/imports', methods=['POST'])
+def import_catalogs_api() -> tuple[jsonify, int]:
+    """
+    API endpoint to import catalogs from a CSV or NDJSON file, sent either as a multipart 'file'
+    field or as the raw request body. Query parameters: format (csv|ndjson, otherwise inferred from
+    the file name) and resume (ID of an interrupted import; send the same file again).
+    Form-encoded bodies are rejected with 415, since parsing them as a form would consume the data.
+    """
+    if request.mimetype == 'application/x-www-form-urlencoded':
+        return api_error_response(
+            "Form-encoded bodies cannot be imported. Send the file as multipart/form-data, or as the raw body "
+            "with Content-Type text/csv or application/x-ndjson.", 415)
+    # Only multipart bodies are parsed into request.files; anything else is read as the raw stream
+    upload = request.files.get('file') if request.mimetype == 'multipart/form-data' else None
+    source_name = upload.filename if upload and upload.filename else 'request body'
+    try:
+        if request.mimetype == 'multipart/form-data' and upload is None:
+            raise ValidationError("Multipart imports must send the file in a 'file' field.")
+        default_format = 'csv' if source_name.lower().endswith('.csv') or request.mimetype == 'text/csv' else 'ndjson'
+        import_format = validate_choice(request.args.get('format'), "Format", IMPORT_FORMATS, default_format)
+        resume_id = validate_import_id(request.args['resume']) if request.args.get('resume') else None
+        importer = get_importer()
+        job = importer.start(source_name, import_format, resume_id)
+    except ValidationError as e:
+        return api_error_response(str(e), 400, e)
+    except DataNotFoundError as e:
+        return api_error_response(str(e), 404, e)
+    except DatabaseConnectionError as e:
+        return api_error_response("Failed to connect to the database. Please try again later.", 500, e)
+    except Exception as e:
+        return api_error_response("An unexpected error occurred while starting the import.", 500, e)
+
+    import_id = job['import_id']
+    try:
+        job = importer.run(job, upload.stream if upload else request.stream)
+    except ValidationError as e:
+        return api_error_response(f"Import {import_id} stopped: {e}", 400, e)
+    except Exception as e:
+        return api_error_response(
+            f"Import {import_id} stopped after its last committed batch. Send the file again with resume={import_id}.",
+            500, e)
+    summary = describe_import(job)
+    if job['rows_rejected']:
+        summary['rejected_report'] = f"/api/imports/{import_id}/rejected"
+    return api_response(summary, f"Imported {job['rows_imported']} catalog(s), rejected {job['rows_rejected']}.", 201)
+
+@app.route('/api/imports/<import_id>', methods=['GET'])
+def get_import_api(import_id: str) -> tuple[jsonify, int]:
+    """API endpoint to poll the progress and throughput of an import."""
+    try:
+        job = catalog_service.get_import_job(validate_import_id(import_id))
+        return api_response(describe_import(job))
+    except ValidationError as e:
+        return api_error_response(str(e), 400, e)
+    except DataNotFoundError as e:
+        return api_error_response(str(e), 404, e)
+    except DatabaseConnectionError as e:
+        return api_error_response("Failed to connect to the database. Please try again later.", 500, e)
+    except Exception as e:
+        return api_error_response(f"An unexpected error occurred while fetching import {import_id}.", 500, e)
+
+@app.route('/api/imports/<import_id>/rejected', methods=['GET'])
+def get_import_rejections_api(import_id: str):
+    """API endpoint to download the rejected-records report of an import as CSV."""
+    try:
+        report_path = get_importer().report_path(validate_import_id(import_id))
+    except ValidationError as e:
+        return api_error_response(str(e), 400, e)
+    if not os.path.exists(report_path):
+        return api_error_response(f"No rejected records report for import {import_id}.", 404)
+    return send_file(report_path, mimetype='text/csv', as_attachment=True,
+                     download_name=f"import-{import_id}-rejected.csv")
+
+@app.route('/metrics', methods=['GET'])
+def metrics_api() -> Response:
+    """Exposes request, query, pool and cache metrics in the Prometheus text format."""
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
 @app.errorhandler(404)
 def page_not_found(e) -> tuple[str, int]:
     """Custom error handler for 404 Not Found errors."""
@@ -157,11 +691,24 @@ def internal_server_error(e) -> tuple[str, int]:
     return render_template('500.html'), 500
 
 if __name__ == '__main__':
+    # Development server only; use serve.py for a multi-worker production server
     # Initial check for config file existence
     config_path_check = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config', 'config.ini')
     if not os.path.exists(config_path_check):
         print(f"FATAL ERROR: Database configuration file not found at '{config_path_check}'.")
         print("Please ensure 'config.ini' exists in the 'config' directory and is properly configured.")
         sys.exit(1)
+    # Every endpoint fails against a database that lacks the migrations this code relies on
+    try:
+        pending_migrations = unapplied_migrations()
+    except DatabaseConnectionError as e:
+        pending_migrations = []
+        print(f"WARNING: Could not check the database schema: {e}")
+    if pending_migrations:
+        print(f"FATAL ERROR: The database is missing migrations {', '.join(pending_migrations)}.")
+        print("Apply them with: python -m utils.migrations")
+        sys.exit(1)
 
+    start_scheduler(catalog_service)
+    start_cache_sync(catalog_service)
     app.run(debug=True)
\ No newline at end of file
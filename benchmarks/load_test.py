@@ -0,0 +1,423 @@
+"""
+Reproducible load test for the catalog API.
+
+Needs a MySQL server reachable with config/config.ini. Any local MySQL 8 works; for a
+throwaway one:
+
+    docker run -d --name catalog-bench -p 3306:3306 -e MYSQL_ROOT_PASSWORD=<password> \\
+        -e MYSQL_DATABASE=e_commerce mysql:8
+
+Then:
+
+    python benchmarks/load_test.py seed --rows 100000
+    python benchmarks/load_test.py run --concurrency 1,8,32 --duration 30 \\
+        --mix list=40,search=20,get=25,create=5,update=5,delete=5 --output before.json
+    python benchmarks/load_test.py run ... --output after.json --baseline before.json
+
+`run` drives the Flask app in-process through its test client unless --url points at a
+running server. Traffic can also be replayed from a JSON-lines file with one request per
+line, {"op": "get", "method": "GET", "path": "/api/catalogs/12", "json": null}; the
+`traffic` command writes such a file from a mix, so the same run can be repeated exactly.
+Results are saved as JSON. With --baseline, throughput drops and p95/p99 increases beyond
+--tolerance are reported and the command exits with status 1.
+"""
+import argparse
+import http.client
+import json
+import math
+import os
+import random
+import re
+import subprocess
+import sys
+import threading
+import time
+from datetime import date, timedelta
+from urllib.parse import urlsplit
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import resource
+except ImportError: # Not available on Windows
+    resource = None
+
+OPERATIONS = ('list', 'search', 'get', 'create', 'update', 'delete')
+DEFAULT_MIX = 'list=40,search=20,get=25,create=5,update=5,delete=5'
+SEARCH_WORDS = ['summer', 'winter', 'spring', 'autumn', 'sale', 'collection', 'holiday', 'classic', 'outdoor', 'gift']
+STATUSES = ['active', 'inactive', 'upcoming', 'expired']
+PID_LABEL = re.compile(r'pid="(\d+)"')
+
+def parse_mix(value: str) -> dict:
+    """Parses 'list=40,get=60' into operation weights."""
+    mix = {}
+    for part in value.split(','):
+        op, _, weight = part.partition('=')
+        if op.strip() not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f"Unknown operation '{op}'. Choose from: {', '.join(OPERATIONS)}.")
+        mix[op.strip()] = float(weight or 1)
+    return mix
+
+def random_catalog(rng: random.Random) -> dict:
+    start = date.today() + timedelta(days=rng.randint(1, 365))
+    return {
+        'name': f"{rng.choice(SEARCH_WORDS).title()} {rng.randint(1, 99999)}",
+        'description': ' '.join(rng.choice(SEARCH_WORDS) for _ in range(4)),
+        'start_date': start.isoformat(),
+        'end_date': (start + timedelta(days=rng.randint(1, 90))).isoformat(),
+        'status': rng.choice(STATUSES)
+    }
+
+class WorkloadGenerator:
+    """Produces requests for a weighted operation mix against a known catalog ID range."""
+    def __init__(self, mix: dict, id_range: tuple, seed: int):
+        self.ops = list(mix)
+        self.weights = [mix[op] for op in self.ops]
+        self.id_range = id_range
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.created_ids = [] # Delete only what this run created, so the dataset stays comparable
+
+    def next_request(self) -> tuple:
+        with self.lock:
+            op = self.rng.choices(self.ops, self.weights)[0]
+            if op == 'delete' and not self.created_ids:
+                op = 'create'
+            low, high = self.id_range
+            if op == 'list':
+                return op, 'GET', '/api/catalogs?limit=50', None
+            if op == 'search':
+                return op, 'GET', f"/api/catalogs?search={self.rng.choice(SEARCH_WORDS)}&limit=50", None
+            if op == 'get':
+                return op, 'GET', f"/api/catalogs/{self.rng.randint(low, high)}", None
+            if op == 'create':
+                return op, 'POST', '/api/catalogs', random_catalog(self.rng)
+            if op == 'update':
+                return op, 'PUT', f"/api/catalogs/{self.rng.randint(low, high)}", random_catalog(self.rng)
+            catalog_id = self.created_ids.pop(self.rng.randrange(len(self.created_ids)))
+            return op, 'DELETE', f"/api/catalogs/{catalog_id}", None
+
+    def observe(self, op: str, status: int, body) -> None:
+        if op == 'create' and status == 201 and body:
+            with self.lock:
+                self.created_ids.append(body['data']['catalog_id'])
+
+class TrafficReplay:
+    """Replays requests from a JSON-lines traffic file, looping when it runs out."""
+    def __init__(self, path: str):
+        with open(path, encoding='utf-8') as f:
+            self.requests = [json.loads(line) for line in f if line.strip()]
+        if not self.requests:
+            raise ValueError(f"Traffic file {path} is empty.")
+        self.position = 0
+        self.lock = threading.Lock()
+
+    def next_request(self) -> tuple:
+        with self.lock:
+            item = self.requests[self.position % len(self.requests)]
+            self.position += 1
+        return item.get('op', item['method'].lower()), item['method'], item['path'], item.get('json')
+
+    def observe(self, op: str, status: int, body) -> None:
+        pass
+
+class InProcessClient:
+    """
+    Calls the Flask app through its test client: measures the app and database without HTTP.
+    Peak memory is that of this process, so it includes the load generator itself.
+    """
+    def __init__(self):
+        from app import app, catalog_service
+        self.client = app.test_client()
+        self.catalog_service = catalog_service
+
+    def request(self, method: str, path: str, payload) -> tuple:
+        response = self.client.open(path, method=method, json=payload)
+        body = response.get_json(silent=True)
+        return response.status_code, body
+
+    def server_stats(self) -> dict:
+        """Returns {'connections_opened': {pid: count}, 'peak_rss_bytes': {pid: bytes}} for this process."""
+        pid = os.getpid()
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024 if resource else 0
+        return {'connections_opened': {pid: self.catalog_service.get_pool_stats()['connections_opened']},
+                'peak_rss_bytes': {pid: rss}}
+
+class HttpClient:
+    """Calls a running server over HTTP with one keep-alive connection per thread."""
+    def __init__(self, url: str):
+        parts = urlsplit(url)
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.local = threading.local()
+
+    def _connection(self) -> http.client.HTTPConnection:
+        if not hasattr(self.local, 'conn'):
+            self.local.conn = http.client.HTTPConnection(self.host, self.port, timeout=60)
+        return self.local.conn
+
+    def request(self, method: str, path: str, payload) -> tuple:
+        body = json.dumps(payload) if payload is not None else None
+        headers = {'Content-Type': 'application/json'} if body else {}
+        conn = self._connection()
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            raw = response.read()
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            del self.local.conn
+            raise
+        try:
+            return response.status, json.loads(raw) if raw else None
+        except ValueError:
+            return response.status, None
+
+    def server_stats(self) -> dict:
+        """
+        Reads pool and memory gauges from /metrics, per worker process. serve.py merges every worker's
+        gauges into each scrape, labelled by pid; a single-process server reports its own under pid None.
+        """
+        conn = http.client.HTTPConnection(self.host, self.port, timeout=10)
+        try:
+            conn.request('GET', '/metrics')
+            text = conn.getresponse().read().decode('utf-8')
+        finally:
+            conn.close()
+        stats = {'connections_opened': {}, 'peak_rss_bytes': {}}
+        for line in text.splitlines():
+            name, _, rest = line.partition('{')
+            if name == 'catalog_db_pool' and 'stat="connections_opened"' in rest:
+                stat = 'connections_opened'
+            elif name == 'catalog_process_max_rss_bytes':
+                stat = 'peak_rss_bytes'
+            else:
+                continue
+            pid = PID_LABEL.search(rest)
+            stats[stat][pid and int(pid.group(1))] = int(float(line.rsplit(' ', 1)[1]))
+        return stats
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = math.ceil(fraction * len(sorted_values))
+    return sorted_values[max(0, rank - 1)]
+
+def summarize(latencies: list) -> dict:
+    latencies = sorted(latencies)
+    return {
+        'count': len(latencies),
+        'mean_ms': round(sum(latencies) / len(latencies), 3) if latencies else None,
+        'p50_ms': percentile(latencies, 0.50),
+        'p95_ms': percentile(latencies, 0.95),
+        'p99_ms': percentile(latencies, 0.99)
+    }
+
+def run_level(client, source, concurrency: int, duration: float, max_requests: int) -> dict:
+    """Runs `concurrency` worker threads for `duration` seconds (or max_requests) and aggregates results."""
+    samples = [] # (op, latency ms, ok)
+    samples_lock = threading.Lock()
+    issued = [0]
+    deadline = time.perf_counter() + duration
+
+    def worker():
+        local = []
+        while time.perf_counter() < deadline:
+            with samples_lock:
+                if max_requests and issued[0] >= max_requests:
+                    break
+                issued[0] += 1
+            op, method, path, payload = source.next_request()
+            started = time.perf_counter()
+            try:
+                status, body = client.request(method, path, payload)
+                ok = status < 500
+            except Exception:
+                status, body, ok = 0, None, False
+            local.append((op, (time.perf_counter() - started) * 1000, ok))
+            source.observe(op, status, body)
+        with samples_lock:
+            samples.extend(local)
+
+    before = client.server_stats()
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    after = client.server_stats()
+
+    by_operation = {}
+    for op in sorted({s[0] for s in samples}):
+        by_operation[op] = summarize([s[1] for s in samples if s[0] == op])
+    return {
+        'concurrency': concurrency,
+        'requests': len(samples),
+        'errors': sum(1 for s in samples if not s[2]),
+        'elapsed_s': round(elapsed, 3),
+        'throughput_rps': round(len(samples) / elapsed, 2) if elapsed else None,
+        'latency': summarize([s[1] for s in samples]),
+        'by_operation': by_operation,
+        # Summed over worker processes; a worker replaced during the level counts from its first scrape
+        'db_connections_opened': sum(count - before['connections_opened'].get(pid, 0)
+                                     for pid, count in after['connections_opened'].items()),
+        'peak_rss_bytes': sum(after['peak_rss_bytes'].values())
+    }
+
+def discover_id_range(client) -> tuple:
+    """Finds the lowest and highest catalog IDs through the list API."""
+    _, first = client.request('GET', '/api/catalogs?limit=1&fields=catalog_id', None)
+    _, last = client.request('GET', '/api/catalogs?limit=1&fields=catalog_id&order=desc', None)
+    if not first or not first.get('data'):
+        raise SystemExit("The catalog table is empty; run the 'seed' command first.")
+    return first['data'][0]['catalog_id'], last['data'][0]['catalog_id']
+
+def compare(baseline: dict, current: dict, tolerance: float) -> list:
+    """Lists regressions of current against baseline, per concurrency level."""
+    regressions = []
+    baseline_levels = {level['concurrency']: level for level in baseline['levels']}
+    for level in current['levels']:
+        old = baseline_levels.get(level['concurrency'])
+        if not old:
+            continue
+        label = f"concurrency {level['concurrency']}"
+        if old['throughput_rps'] and level['throughput_rps'] < old['throughput_rps'] * (1 - tolerance):
+            regressions.append(f"{label}: throughput {old['throughput_rps']} -> {level['throughput_rps']} req/s")
+        for key in ('p95_ms', 'p99_ms'):
+            before, after = old['latency'][key], level['latency'][key]
+            if before and after and after > before * (1 + tolerance):
+                regressions.append(f"{label}: {key} {before:.2f} -> {after:.2f}")
+    return regressions
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+def command_seed(args) -> None:
+    from dto.catalog import Catalog
+    from service.catalog_service import CatalogService, MAX_BULK_ITEMS
+    from utils.migrations import apply_migrations
+    apply_migrations()
+    service = CatalogService()
+    rng = random.Random(args.seed)
+    created = 0
+    while created < args.rows:
+        batch = [Catalog(**random_catalog(rng)) for _ in range(min(MAX_BULK_ITEMS, args.rows - created))]
+        service.bulk_create_catalogs(batch, atomic=True)
+        created += len(batch)
+        print(f"\rSeeded {created}/{args.rows} catalogs", end='', flush=True)
+    print()
+
+def command_traffic(args) -> None:
+    generator = WorkloadGenerator(args.mix, (args.min_id, args.max_id), args.seed)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        for _ in range(args.requests):
+            op, method, path, payload = generator.next_request()
+            if op == 'create':
+                # Without a live server there is no generated ID; assume IDs continue after max_id
+                generator.created_ids.append(generator.id_range[1] + len(generator.created_ids) + 1)
+            f.write(json.dumps({'op': op, 'method': method, 'path': path, 'json': payload}) + '\n')
+    print(f"Wrote {args.requests} requests to {args.output}")
+
+def command_run(args) -> None:
+    client = HttpClient(args.url) if args.url else InProcessClient()
+    if args.traffic:
+        make_source = lambda: TrafficReplay(args.traffic)
+    else:
+        id_range = discover_id_range(client)
+        make_source = lambda: WorkloadGenerator(args.mix, id_range, args.seed)
+
+    levels = []
+    for concurrency in args.concurrency:
+        level = run_level(client, make_source(), concurrency, args.duration, args.max_requests)
+        levels.append(level)
+        print(f"concurrency {concurrency:>4}: {level['throughput_rps']:>9} req/s  "
+              f"p50 {level['latency']['p50_ms']:.2f} ms  p95 {level['latency']['p95_ms']:.2f} ms  "
+              f"p99 {level['latency']['p99_ms']:.2f} ms  errors {level['errors']}  "
+              f"db connections opened {level['db_connections_opened']}")
+
+    result = {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'revision': git_revision(),
+            'target': args.url or 'in-process',
+            'mix': args.mix if not args.traffic else None,
+            'traffic': args.traffic,
+            'duration_s': args.duration,
+            'seed': args.seed,
+            'python': sys.version.split()[0]
+        },
+        'levels': levels
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=2)
+    print(f"Results saved to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = compare(json.load(f), result, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions beyond {args.tolerance:.0%} against {args.baseline}")
+
+def command_compare(args) -> None:
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    with open(args.current, encoding='utf-8') as f:
+        current = json.load(f)
+    regressions = compare(baseline, current, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    sys.exit(1 if regressions else 0)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    seed = commands.add_parser('seed', help="Apply migrations and insert random catalogs.")
+    seed.add_argument('--rows', type=int, default=10000)
+    seed.add_argument('--seed', type=int, default=42)
+    seed.set_defaults(handler=command_seed)
+
+    traffic = commands.add_parser('traffic', help="Write a replayable JSON-lines traffic file from a mix.")
+    traffic.add_argument('--mix', type=parse_mix, default=parse_mix(DEFAULT_MIX))
+    traffic.add_argument('--requests', type=int, default=10000)
+    traffic.add_argument('--min-id', type=int, default=1)
+    traffic.add_argument('--max-id', type=int, required=True)
+    traffic.add_argument('--seed', type=int, default=42)
+    traffic.add_argument('--output', default='traffic.jsonl')
+    traffic.set_defaults(handler=command_traffic)
+
+    run = commands.add_parser('run', help="Run the workload at each concurrency level and save results.")
+    run.add_argument('--url', help="Base URL of a running server, e.g. http://127.0.0.1:5000. Default: in-process.")
+    run.add_argument('--mix', type=parse_mix, default=parse_mix(DEFAULT_MIX))
+    run.add_argument('--traffic', help="Replay this JSON-lines traffic file instead of generating a mix.")
+    run.add_argument('--concurrency', type=lambda v: [int(n) for n in v.split(',')], default=[1, 8, 32])
+    run.add_argument('--duration', type=float, default=30.0, help="Seconds per concurrency level.")
+    run.add_argument('--max-requests', type=int, default=0, help="Stop a level after this many requests.")
+    run.add_argument('--seed', type=int, default=42)
+    run.add_argument('--output', default=os.path.join('benchmarks', 'results', f"load-{time.strftime('%Y%m%d-%H%M%S')}.json"))
+    run.add_argument('--baseline', help="Earlier results file to check for regressions.")
+    run.add_argument('--tolerance', type=float, default=0.10, help="Allowed relative change, default 0.10.")
+    run.set_defaults(handler=command_run)
+
+    compare_parser = commands.add_parser('compare', help="Check a results file against a baseline.")
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--tolerance', type=float, default=0.10)
+    compare_parser.set_defaults(handler=command_compare)
+
+    args = parser.parse_args()
+    args.handler(args)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""
+Compares ?search= latency of the original double-wildcard LIKE scan against the FULLTEXT path
+as the table grows. Seeds a scratch table (catalog_search_bench) in the configured database and
+drops it afterwards.
+
+    python benchmarks/search_benchmark.py --rows 1000,10000,100000 --repeat 20
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.db_get_connection import get_connection
+from utils.search import build_search_condition
+
+BENCH_TABLE = 'catalog_search_bench'
+WORDS = ['summer', 'winter', 'spring', 'autumn', 'sale', 'collection', 'holiday', 'classic', 'outdoor',
+         'kids', 'sports', 'premium', 'basics', 'denim', 'linen', 'festival', 'clearance', 'gift', 'home', 'travel']
+QUERIES = ['summer', 'coll', 'winter sale', 'premium denim gift', 'nomatch']
+
+def _random_text(rng: random.Random, words: int, max_length: int) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(words))[:max_length]
+
+def _create_table(cursor) -> None:
+    cursor.execute(f"DROP TABLE IF EXISTS {BENCH_TABLE}")
+    cursor.execute(f"""
+        CREATE TABLE {BENCH_TABLE} (
+            catalog_id INT AUTO_INCREMENT PRIMARY KEY,
+            catalog_name VARCHAR(30) NOT NULL,
+            catalog_description VARCHAR(50) NOT NULL,
+            start_date DATE NOT NULL,
+            end_date DATE NOT NULL,
+            status VARCHAR(10) NOT NULL,
+            FULLTEXT INDEX ft_bench_name_description (catalog_name, catalog_description)
+        ) ENGINE=InnoDB
+    """)
+
+def _seed(conn, cursor, rng: random.Random, count: int, chunk_size: int = 5000) -> None:
+    query = (f"INSERT INTO {BENCH_TABLE} (catalog_name, catalog_description, start_date, end_date, status) "
+             f"VALUES (%s, %s, '2030-01-01', '2030-12-31', 'active')")
+    for start in range(0, count, chunk_size):
+        rows = [(_random_text(rng, 2, 30), _random_text(rng, 5, 50)) for _ in range(min(chunk_size, count - start))]
+        cursor.executemany(query, rows)
+        conn.commit()
+
+def _time_query(cursor, query: str, params: tuple, repeat: int) -> dict:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        cursor.execute(query, params)
+        rows = cursor.fetchall()
+        samples.append((time.perf_counter() - started) * 1000)
+    return {'median_ms': statistics.median(samples), 'max_ms': max(samples), 'rows': len(rows)}
+
+def run(row_counts: list, repeat: int, min_token_size: int, seed: int) -> list:
+    rng = random.Random(seed)
+    conn = get_connection()
+    cursor = conn.cursor()
+    results = []
+    try:
+        _create_table(cursor)
+        seeded = 0
+        for target in sorted(row_counts):
+            _seed(conn, cursor, rng, target - seeded)
+            seeded = target
+            cursor.execute(f"ANALYZE TABLE {BENCH_TABLE}")
+            cursor.fetchall()
+            for term in QUERIES:
+                like = _time_query(
+                    cursor,
+                    f"SELECT * FROM {BENCH_TABLE} WHERE catalog_name LIKE %s OR catalog_description LIKE %s",
+                    (f"%{term}%", f"%{term}%"), repeat)
+                condition, params = build_search_condition(term, 'fulltext', min_token_size)
+                fulltext = _time_query(cursor, f"SELECT * FROM {BENCH_TABLE} WHERE {condition}", params, repeat)
+                results.append({'rows': target, 'term': term, 'like': like, 'fulltext': fulltext})
+    finally:
+        cursor.execute(f"DROP TABLE IF EXISTS {BENCH_TABLE}")
+        cursor.close()
+        conn.close()
+    return results
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', default='1000,10000,100000', help="Comma-separated table sizes to measure.")
+    parser.add_argument('--repeat', type=int, default=20, help="Executions per query; the median is reported.")
+    parser.add_argument('--min-token-size', type=int, default=3, help="Server innodb_ft_min_token_size.")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    results = run([int(n) for n in args.rows.split(',')], args.repeat, args.min_token_size, args.seed)
+    print(f"{'rows':>9}  {'term':<20} {'LIKE ms':>9} {'FULLTEXT ms':>12} {'speedup':>8} {'matches':>8}")
+    for r in results:
+        speedup = r['like']['median_ms'] / r['fulltext']['median_ms'] if r['fulltext']['median_ms'] else float('inf')
+        print(f"{r['rows']:>9}  {r['term']:<20} {r['like']['median_ms']:>9.2f} {r['fulltext']['median_ms']:>12.2f} "
+              f"{speedup:>7.1f}x {r['fulltext']['rows']:>8}")
+
+if __name__ == '__main__':
+    main()
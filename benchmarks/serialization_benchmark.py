@@ -0,0 +1,133 @@
+"""
+Measures the per-row CPU cost of turning catalog rows into JSON and of validating catalog
+payloads, comparing the original implementations with the current ones. No database is
+needed: rows are generated in memory in the shapes the cursor returns (dicts before, tuples now).
+
+    python benchmarks/serialization_benchmark.py --rows 500 --repeat 50
+
+The "before" functions are copies of the code they replaced, kept here so the comparison stays runnable.
+"""
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import time
+import tracemalloc
+from datetime import date, datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dto.catalog import Catalog
+from exception.catalog_exception import ValidationError
+from utils.export import json_array_chunks
+from utils.validation import catalog_validator, validate_catalog_payload
+from benchmarks.load_test import random_catalog
+
+CATALOG_COLUMNS = Catalog.COLUMNS[:-1] # As listed by the API, without version
+
+def legacy_serialize_catalog(catalog_data: dict) -> dict:
+    serialized_data = catalog_data.copy()
+    for key in ['start_date', 'end_date']:
+        if key in serialized_data and isinstance(serialized_data[key], (date, datetime)):
+            serialized_data[key] = serialized_data[key].strftime('%Y-%m-%d')
+    return serialized_data
+
+def legacy_validate_date(value: str) -> str:
+    if not value:
+        raise ValidationError("Date cannot be empty.")
+    try:
+        date_obj = datetime.strptime(value, "%Y-%m-%d")
+        if date_obj < datetime.today().replace(hour=0, minute=0, second=0, microsecond=0):
+            raise ValidationError("Date cannot be in the past.")
+        return value
+    except ValueError:
+        raise ValidationError("Invalid date format.")
+
+def legacy_validate_text(value: str, field_name: str, max_length: int) -> str:
+    if not value:
+        raise ValidationError(f"{field_name} cannot be empty.")
+    if not re.match(r'^[A-Za-z0-9\s.,!?-]+$', value):
+        raise ValidationError(f"{field_name} must contain only letters, numbers, spaces, and common punctuation (.,!?-).")
+    if max_length and len(value) > max_length:
+        raise ValidationError(f"{field_name} cannot exceed {max_length} characters.")
+    return value.strip()
+
+def legacy_validate_payload(data: dict) -> Catalog:
+    name = legacy_validate_text(data.get('name'), "Name", 30)
+    description = legacy_validate_text(data.get('description'), "Description", 50)
+    start_date = legacy_validate_date(data.get('start_date'))
+    end_date = legacy_validate_date(data.get('end_date'))
+    status = data.get('status').strip().lower()
+    if status not in ['active', 'inactive', 'upcoming', 'expired']:
+        raise ValidationError("Invalid status.")
+    if datetime.strptime(start_date, '%Y-%m-%d') > datetime.strptime(end_date, '%Y-%m-%d'):
+        raise ValidationError("End Date cannot be before Start Date.")
+    return Catalog(name=name, description=description, start_date=start_date, end_date=end_date, status=status)
+
+def _make_rows(rng: random.Random, count: int) -> list:
+    rows = []
+    for catalog_id in range(1, count + 1):
+        fields = random_catalog(rng)
+        rows.append((catalog_id, fields['name'], fields['description'], date.fromisoformat(fields['start_date']),
+                     date.fromisoformat(fields['end_date']), fields['status']))
+    return rows
+
+def _best_per_row_us(func, rows: int, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best / rows * 1e6
+
+def _bytes_per_row(build, rows: int) -> float:
+    tracemalloc.start()
+    kept = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return size / rows
+
+def run(row_count: int, repeat: int, seed: int) -> list:
+    rng = random.Random(seed)
+    tuples = _make_rows(rng, row_count)
+    dicts = [dict(zip(CATALOG_COLUMNS, row)) for row in tuples]
+    payloads = [random_catalog(rng) for _ in range(row_count)]
+    full_rows = [row + (1,) for row in tuples]
+
+    def serialize_before():
+        return json.dumps({'message': "Success", 'data': [legacy_serialize_catalog(c) for c in dicts]})
+
+    def serialize_after():
+        return '{"message":"Success","data":' + ''.join(json_array_chunks(CATALOG_COLUMNS, tuples)) + '}'
+
+    # Both paths must produce the same document
+    assert json.loads(serialize_before()) == json.loads(serialize_after())
+    return [
+        ('list page to JSON (us/row)', _best_per_row_us(serialize_before, row_count, repeat),
+         _best_per_row_us(serialize_after, row_count, repeat)),
+        ('payload validation (us/row)',
+         _best_per_row_us(lambda: [legacy_validate_payload(p) for p in payloads], row_count, repeat),
+         _best_per_row_us(lambda: [validate_catalog_payload(p) for p in payloads], row_count, repeat)),
+        ('batch validation (us/row)',
+         _best_per_row_us(lambda: [legacy_validate_payload(p) for p in payloads], row_count, repeat),
+         _best_per_row_us(lambda: catalog_validator.validate_batch(payloads), row_count, repeat)),
+        ('row held in memory (bytes/row)', _bytes_per_row(lambda: [dict(zip(Catalog.COLUMNS, row)) for row in full_rows], row_count),
+         _bytes_per_row(lambda: [Catalog.from_row(row) for row in full_rows], row_count))
+    ]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=500, help="Rows per run; 500 is the largest list page.")
+    parser.add_argument('--repeat', type=int, default=50, help="Runs per measurement; the fastest is reported.")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"{'measurement':<32} {'before':>10} {'after':>10} {'ratio':>8}")
+    for label, before, after in run(args.rows, args.repeat, args.seed):
+        print(f"{label:<32} {before:>10.2f} {after:>10.2f} {before / after:>7.1f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+"""
+Compares throughput of the development server (`python app.py`) with the production launcher
+(`serve.py`) at the same concurrency, driving both over HTTP with the load_test.py workload.
+
+    python benchmarks/load_test.py seed --rows 100000
+    python benchmarks/serve_comparison.py --concurrency 8,32 --duration 30 --workers 4 --threads 16
+
+Each server is started on a free local port, measured at every concurrency level and then stopped
+with SIGTERM. The dev server runs as `python app.py` does, with the debugger on; only the reloader
+is disabled, since it would fork a second copy. Results are printed as a table and saved as JSON.
+--threads defaults to [server] threads; serve.py refuses to start unless it exceeds
+[changes] max_streams_per_worker.
+"""
+import argparse
+import http.client
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from configparser import ConfigParser
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from load_test import DEFAULT_MIX, HttpClient, WorkloadGenerator, discover_id_range, git_revision, parse_mix, run_level
+
+def configured_threads() -> int:
+    """Returns [server] threads from config.ini, the value serve.py uses without --threads."""
+    config = ConfigParser()
+    config.read(os.path.join(ROOT, 'config', 'config.ini'))
+    return config.getint('server', 'threads', fallback=16)
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+def wait_until_ready(port: int, process: subprocess.Popen, timeout: float = 60.0) -> None:
+    """Polls /metrics until the server answers, failing if it exits or takes longer than timeout."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise SystemExit(f"Server exited with status {process.returncode} before accepting requests.")
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=2)
+            conn.request('GET', '/metrics')
+            conn.getresponse().read()
+            conn.close()
+            return
+        except OSError:
+            time.sleep(0.25)
+    raise SystemExit(f"Server did not start listening on port {port} within {timeout:.0f} s.")
+
+def server_commands(port: int, workers: int, threads: int) -> dict:
+    dev = (f"from app import app; "
+           f"app.run(host='127.0.0.1', port={port}, debug=True, use_reloader=False)")
+    return {
+        'dev': [sys.executable, '-c', dev],
+        'serve': [sys.executable, os.path.join(ROOT, 'serve.py'), '--bind', f"127.0.0.1:{port}",
+                  '--workers', str(workers), '--threads', str(threads)]
+    }
+
+def measure(name: str, command: list, port: int, args: argparse.Namespace) -> list:
+    process = subprocess.Popen(command, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_until_ready(port, process)
+        client = HttpClient(f"http://127.0.0.1:{port}")
+        id_range = discover_id_range(client)
+        levels = []
+        for concurrency in args.concurrency:
+            # Same seed for both servers, so they see the same request sequence
+            source = WorkloadGenerator(args.mix, id_range, args.seed)
+            level = run_level(client, source, concurrency, args.duration, 0)
+            levels.append(level)
+            print(f"{name:>6} concurrency {concurrency:>4}: {level['throughput_rps']:>9} req/s  "
+                  f"p95 {level['latency']['p95_ms']:.2f} ms  errors {level['errors']}")
+        return levels
+    finally:
+        process.send_signal(signal.SIGTERM)
+        try:
+            process.wait(timeout=60)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--concurrency', type=lambda v: [int(n) for n in v.split(',')], default=[8, 32])
+    parser.add_argument('--duration', type=float, default=30.0, help="Seconds per concurrency level.")
+    parser.add_argument('--mix', type=parse_mix, default=parse_mix(DEFAULT_MIX))
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="serve.py worker processes.")
+    parser.add_argument('--threads', type=int, default=configured_threads(),
+                        help="serve.py threads per worker. Default: [server] threads from config.ini.")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default=os.path.join('benchmarks', 'results', f"serve-{time.strftime('%Y%m%d-%H%M%S')}.json"))
+    args = parser.parse_args()
+
+    results = {}
+    for name in ('dev', 'serve'):
+        port = free_port()
+        results[name] = measure(name, server_commands(port, args.workers, args.threads)[name], port, args)
+
+    print(f"\n{'concurrency':>11} {'dev req/s':>10} {'serve req/s':>12} {'speedup':>8} {'dev p95 ms':>11} {'serve p95 ms':>13}")
+    for dev, serve in zip(results['dev'], results['serve']):
+        speedup = serve['throughput_rps'] / dev['throughput_rps'] if dev['throughput_rps'] else float('inf')
+        print(f"{dev['concurrency']:>11} {dev['throughput_rps']:>10} {serve['throughput_rps']:>12} {speedup:>7.1f}x "
+              f"{dev['latency']['p95_ms']:>11.2f} {serve['latency']['p95_ms']:>13.2f}")
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump({'meta': {'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'), 'revision': git_revision(),
+                            'workers': args.workers, 'threads': args.threads, 'duration_s': args.duration,
+                            'mix': args.mix, 'seed': args.seed},
+                   'dev': results['dev'], 'serve': results['serve']}, f, indent=2)
+    print(f"Results saved to {args.output}")
+
+if __name__ == '__main__':
+    main()
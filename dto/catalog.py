@@ -1,23 +1,52 @@
+from datetime import date
+
 class Catalog:
     """
     Data Transfer Object (DTO) for a Catalog item.
     Encapsulates catalog properties for consistent data structure.
+    Uses __slots__, so instances are small and can be built straight from cursor tuples with from_row().
     """
-    def __init__(self, name: str, description: str, start_date: str, end_date: str, status: str, catalog_id: int = None):
+    __slots__ = ('catalog_id', 'name', 'description', 'start_date', 'end_date', 'status', 'version')
+
+    # Database columns in the order from_row() expects them
+    COLUMNS = ('catalog_id', 'catalog_name', 'catalog_description', 'start_date', 'end_date', 'status', 'version')
+
+    def __init__(self, name: str, description: str, start_date, end_date, status: str, catalog_id: int = None,
+                 version: int = None):
         self.catalog_id = catalog_id
         self.name = name
         self.description = description
         self.start_date = start_date
         self.end_date = end_date
         self.status = status
+        self.version = version
+
+    @classmethod
+    def from_row(cls, row: tuple) -> 'Catalog':
+        """Builds a Catalog from a raw cursor tuple in COLUMNS order, without an intermediate dict."""
+        catalog = cls.__new__(cls)
+        (catalog.catalog_id, catalog.name, catalog.description, catalog.start_date, catalog.end_date,
+         catalog.status, catalog.version) = row
+        return catalog
+
+    def as_row(self) -> tuple:
+        """Returns the fields as a tuple in COLUMNS order."""
+        return (self.catalog_id, self.name, self.description, self.start_date, self.end_date, self.status,
+                self.version)
+
+    def __repr__(self) -> str:
+        # Content-based, so cache ETags (derived from repr) are stable across processes
+        return f"Catalog{self.as_row()!r}"
 
     def to_dict(self) -> dict:
-        """Converts the Catalog object to a dictionary for JSON serialization."""
+        """Converts the Catalog object to a dictionary for JSON serialization, with dates as YYYY-MM-DD."""
+        start_date, end_date = self.start_date, self.end_date
         return {
             'catalog_id': self.catalog_id,
             'catalog_name': self.name,
             'catalog_description': self.description,
-            'start_date': self.start_date,
-            'end_date': self.end_date,
-            'status': self.status
+            'start_date': start_date.isoformat() if isinstance(start_date, date) else start_date,
+            'end_date': end_date.isoformat() if isinstance(end_date, date) else end_date,
+            'status': self.status,
+            'version': self.version
         }
\ No newline at end of file
@@ -8,4 +8,8 @@ class DatabaseConnectionError(Exception):
 
 class DataNotFoundError(Exception):
     """Custom exception when a requested data entity is not found."""
+    pass
+
+class ChangeTokenExpiredError(Exception):
+    """Custom exception when a change token predates the retained change history."""
     pass
\ No newline at end of file
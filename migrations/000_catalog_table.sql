@@ -0,0 +1,9 @@
+-- Base catalog table; a no-op on databases created before migrations existed
+CREATE TABLE IF NOT EXISTS catalog (
+    catalog_id INT AUTO_INCREMENT PRIMARY KEY,
+    catalog_name VARCHAR(30) NOT NULL,
+    catalog_description VARCHAR(50) NOT NULL,
+    start_date DATE NOT NULL,
+    end_date DATE NOT NULL,
+    status VARCHAR(10) NOT NULL
+) ENGINE=InnoDB;
@@ -0,0 +1,2 @@
+-- FULLTEXT index backing ?search= when [search] mode = fulltext
+ALTER TABLE catalog ADD FULLTEXT INDEX ft_catalog_name_description (catalog_name, catalog_description);
@@ -0,0 +1,15 @@
+-- Progress and resume checkpoints for streaming catalog imports (POST /api/imports)
+CREATE TABLE IF NOT EXISTS catalog_import (
+    import_id CHAR(32) PRIMARY KEY,
+    source_name VARCHAR(255) NOT NULL,
+    format VARCHAR(10) NOT NULL,
+    status VARCHAR(10) NOT NULL,
+    records_committed BIGINT NOT NULL DEFAULT 0,
+    rows_imported BIGINT NOT NULL DEFAULT 0,
+    rows_rejected BIGINT NOT NULL DEFAULT 0,
+    report_bytes BIGINT NOT NULL DEFAULT 0,
+    active_seconds DOUBLE NOT NULL DEFAULT 0,
+    error VARCHAR(500) NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+);
@@ -0,0 +1,23 @@
+-- Change tracking for GET /api/catalogs/changes and the /api/catalogs/stream change feed.
+-- Every write transaction takes the next number from catalog_change_seq. The row stays locked
+-- until commit, so change numbers become visible in commit order. catalog.version holds the
+-- number of a row's last change; catalog_change keeps one row per changed catalog, and rows
+-- with operation 'delete' are the tombstones of deleted catalogs.
+ALTER TABLE catalog ADD COLUMN version BIGINT NOT NULL DEFAULT 0;
+
+CREATE TABLE IF NOT EXISTS catalog_change_seq (
+    id TINYINT PRIMARY KEY,
+    seq BIGINT NOT NULL,
+    pruned_through BIGINT NOT NULL DEFAULT 0
+);
+
+INSERT INTO catalog_change_seq (id, seq) VALUES (1, 0);
+
+CREATE TABLE IF NOT EXISTS catalog_change (
+    seq BIGINT NOT NULL,
+    catalog_id INT NOT NULL,
+    operation VARCHAR(6) NOT NULL,
+    changed_at TIMESTAMP(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+    PRIMARY KEY (seq, catalog_id),
+    INDEX idx_catalog_change_changed_at (changed_at)
+);
@@ -0,0 +1,10 @@
+-- Indexes for the status and date-range filters of GET /api/catalogs and the status transition job.
+-- InnoDB appends catalog_id to every secondary index, so each one also serves keyset pagination:
+-- (status) orders a status filter by ID, (status, start_date) and (status, end_date) serve a status
+-- plus a date range or sort, and the single-date ones serve date filters and sort=start_date/end_date.
+ALTER TABLE catalog
+    ADD INDEX idx_catalog_status (status),
+    ADD INDEX idx_catalog_status_start_date (status, start_date),
+    ADD INDEX idx_catalog_status_end_date (status, end_date),
+    ADD INDEX idx_catalog_start_date (start_date),
+    ADD INDEX idx_catalog_end_date (end_date);
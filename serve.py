@@ -0,0 +1,154 @@
+"""
+Production entry point: serves the app with gunicorn's pre-forking server.
+
+    python -m utils.migrations           # after installing or upgrading; applies migrations/*.sql
+    python serve.py                      # settings from the [server] section of config/config.ini
+    python serve.py --workers 8 --threads 16 --bind 0.0.0.0:8000
+
+config.ini and the database schema are checked once here, before any worker starts, and the app is imported once in the
+master so workers share its code pages. Each worker then warms up (database pool, validators,
+templates) before it accepts connections and is recycled after max_requests requests. On SIGTERM
+workers stop accepting, finish in-flight requests for up to graceful_timeout seconds and exit.
+Open change streams are ended as soon as a worker starts stopping, so they never hold it for the
+full graceful_timeout; browsers reconnect to another worker.
+
+Each /api/catalogs/stream connection holds one request thread. [changes] max_streams_per_worker
+must stay below threads, so API requests always have threads left however many tabs are open.
+SIGHUP reloads workers one by one without dropping connections.
+
+Workers share nothing in memory, so two things are set up for more than one worker: /metrics
+merges snapshots every worker writes to a temporary directory, and the local cache backend is
+refused, since a write would only invalidate the cache of the worker that handled it. Use
+[cache] backend = redis or enabled = false with several workers.
+
+`python app.py` remains the single-process development server with the debugger and reloader.
+"""
+import argparse
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from configparser import Error as ConfigError
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from gunicorn.app.base import BaseApplication
+from utils.db_get_connection import CONFIG_PATH, load_config
+from utils.migrations import unapplied_migrations
+from exception.catalog_exception import DatabaseConnectionError
+from utils.metrics import metrics
+
+REQUIRED_SETTINGS = {'mysql': ('host', 'user', 'password', 'database')}
+
+def check_config() -> None:
+    """Fails fast, before forking anything, when config.ini is missing or lacks database settings."""
+    try:
+        config = load_config()
+    except FileNotFoundError:
+        sys.exit(f"FATAL ERROR: Database configuration file not found at '{CONFIG_PATH}'.\n"
+                 "Please ensure 'config.ini' exists in the 'config' directory and is properly configured.")
+    except ConfigError as e:
+        sys.exit(f"FATAL ERROR: Could not parse '{CONFIG_PATH}': {e}")
+    for section, keys in REQUIRED_SETTINGS.items():
+        missing = [key for key in keys if not config.has_option(section, key)]
+        if missing:
+            sys.exit(f"FATAL ERROR: '{CONFIG_PATH}' is missing [{section}] {', '.join(missing)}.")
+    check_schema()
+
+def check_schema() -> None:
+    """
+    Fails fast when the database lacks migrations the code relies on, since every endpoint would then
+    fail. An unreachable database only warns; workers start and retry as they do after an outage.
+    """
+    try:
+        pending = unapplied_migrations()
+    except DatabaseConnectionError as e:
+        print(f"WARNING: Could not check the database schema: {e}", file=sys.stderr)
+        return
+    if pending:
+        sys.exit(f"FATAL ERROR: The database is missing migrations {', '.join(pending)}. "
+                 "Apply them with: python -m utils.migrations")
+
+def server_options(args: argparse.Namespace) -> dict:
+    """Builds gunicorn settings from the [server] section of config.ini, overridden by command-line flags."""
+    config = load_config()
+    workers = args.workers or config.getint('server', 'workers', fallback=0) or multiprocessing.cpu_count()
+    threads = args.threads or config.getint('server', 'threads', fallback=16)
+    max_streams = config.getint('changes', 'max_streams_per_worker', fallback=8)
+    if max_streams >= threads:
+        sys.exit(f"FATAL ERROR: [changes] max_streams_per_worker ({max_streams}) must be lower than the "
+                 f"{threads} request threads per worker, or change streams can block every API request.")
+    if (workers > 1 and config.getboolean('cache', 'enabled', fallback=False)
+            and config.get('cache', 'backend', fallback='local') == 'local'):
+        sys.exit(f"FATAL ERROR: [cache] backend = local keeps a separate cache in each of the {workers} workers, "
+                 "so they would serve stale catalogs after writes handled by another worker. "
+                 "Use backend = redis, set enabled = false, or run with --workers 1.")
+    return {
+        'bind': args.bind or config.get('server', 'bind', fallback='127.0.0.1:8000'),
+        'workers': workers,
+        'threads': threads,
+        'worker_class': 'gthread' if threads > 1 else 'sync',
+        'max_requests': config.getint('server', 'max_requests', fallback=10000),
+        'max_requests_jitter': config.getint('server', 'max_requests_jitter', fallback=1000),
+        'graceful_timeout': config.getint('server', 'graceful_timeout', fallback=30),
+        'timeout': config.getint('server', 'timeout', fallback=60),
+        'keepalive': config.getint('server', 'keepalive', fallback=5),
+        'preload_app': True,
+        'post_worker_init': warm_worker,
+        'accesslog': config.get('server', 'access_log', fallback=None) or None,
+        'errorlog': '-'
+    }
+
+def _close_streams_on_stop(worker) -> None:
+    # gunicorn clears worker.alive on SIGTERM, SIGQUIT and max_requests, then waits for in-flight requests
+    from app import close_streams
+    while worker.alive:
+        time.sleep(1)
+    close_streams()
+
+def warm_worker(worker) -> None:
+    """gunicorn hook run in each new worker after forking and before it accepts connections."""
+    from app import warm_up
+    metrics.start_snapshots(load_config().getfloat('metrics', 'snapshot_seconds', fallback=5.0))
+    threading.Thread(target=_close_streams_on_stop, args=(worker,), name='stream-closer', daemon=True).start()
+    started = time.perf_counter()
+    timings = warm_up()
+    worker.log.info("Worker %d warmed up in %.0f ms (%s)", worker.pid, (time.perf_counter() - started) * 1000,
+                    ', '.join(f"{step} {seconds * 1000:.0f} ms" for step, seconds in timings.items()))
+
+class CatalogServer(BaseApplication):
+    """Runs the Flask app under gunicorn with settings passed in code rather than a gunicorn config file."""
+    def __init__(self, options: dict):
+        self.options = options
+        super().__init__()
+
+    def load_config(self) -> None:
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        from app import app
+        return app
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--bind', help="Address to listen on, e.g. 0.0.0.0:8000.")
+    parser.add_argument('--workers', type=int, help="Worker processes. Default: one per CPU core.")
+    parser.add_argument('--threads', type=int, help="Request threads per worker.")
+    args = parser.parse_args()
+
+    check_config()
+    options = server_options(args)
+    print(f"Starting {options['workers']} worker(s) x {options['threads']} thread(s) on {options['bind']}")
+    metrics_dir = tempfile.mkdtemp(prefix='catalog-metrics-')
+    metrics.share_across_processes(metrics_dir) # Before the app is loaded and workers fork
+    try:
+        CatalogServer(options).run()
+    finally:
+        shutil.rmtree(metrics_dir, ignore_errors=True)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,180 @@
+import codecs
+import csv
+import io
+import json
+import os
+import time
+import uuid
+from itertools import islice
+from service.catalog_service import CatalogService
+from exception.catalog_exception import ValidationError
+from utils.validation import catalog_validator
+
+IMPORT_FORMATS = ('csv', 'ndjson')
+
+# Export column names are accepted too, so an export can be re-imported as is
+FIELD_ALIASES = {'catalog_name': 'name', 'catalog_description': 'description'}
+
+def _decoded_lines(binary_stream):
+    try:
+        yield from codecs.iterdecode(binary_stream, 'utf-8-sig')
+    except UnicodeDecodeError as e:
+        raise ValidationError(f"File is not valid UTF-8: {e}")
+
+def iter_records(binary_stream, import_format: str):
+    """
+    Parses an uploaded file incrementally, yielding (record_number, data, error) per record.
+    data is a dict of fields, or None with a parse error message. Only one line is held in memory.
+    For CSV the first row is the header; for NDJSON each non-blank line is one JSON object.
+    """
+    lines = _decoded_lines(binary_stream)
+    if import_format == 'csv':
+        reader = csv.reader(lines)
+        try:
+            header = [FIELD_ALIASES.get(name.strip().lower(), name.strip().lower()) for name in next(reader, [])]
+        except csv.Error as e:
+            raise ValidationError(f"Malformed CSV header: {e}")
+        number = 0
+        while True:
+            try:
+                row = next(reader)
+            except StopIteration:
+                break
+            except csv.Error as e:
+                raise ValidationError(f"Malformed CSV after record {number}: {e}")
+            number += 1
+            if len(row) != len(header):
+                yield number, None, f"Expected {len(header)} fields, found {len(row)}."
+            else:
+                yield number, dict(zip(header, row)), None
+    else:
+        number = 0
+        for line in lines:
+            if not line.strip():
+                continue
+            number += 1
+            try:
+                data = json.loads(line)
+            except ValueError as e:
+                yield number, None, f"Invalid JSON: {e}"
+                continue
+            if isinstance(data, dict):
+                data = {FIELD_ALIASES.get(key, key): value for key, value in data.items()}
+            yield number, data, None
+
+class CatalogImporter:
+    """
+    Streams catalog records from a CSV or NDJSON upload into the database.
+    Records are read and validated batch_size at a time. Each batch's valid records are inserted and
+    committed together with the import's checkpoint, and rejected ones are appended to a CSV report
+    (record number, reason, data) under report_dir.
+    """
+    def __init__(self, catalog_service: CatalogService, report_dir: str, batch_size: int = 1000):
+        self.catalog_service = catalog_service
+        self.report_dir = report_dir
+        self.batch_size = batch_size
+
+    def report_path(self, import_id: str) -> str:
+        """Returns the path of the rejected-records report for an import."""
+        return os.path.join(self.report_dir, f"{import_id}.rejected.csv")
+
+    def start(self, source_name: str, import_format: str, resume_id: str = None) -> dict:
+        """
+        Registers a new import, or loads the checkpoint of an unfinished one when resume_id is given.
+        Returns the job record. Raises ValidationError if the import to resume already completed.
+        """
+        if resume_id:
+            job = self.catalog_service.get_import_job(resume_id)
+            if job['status'] == 'completed':
+                raise ValidationError(f"Import {resume_id} has already completed.")
+            if job['format'] != import_format:
+                raise ValidationError(f"Import {resume_id} was started as {job['format']}, not {import_format}.")
+            return job
+        import_id = uuid.uuid4().hex
+        self.catalog_service.create_import_job(import_id, source_name, import_format)
+        return self.catalog_service.get_import_job(import_id)
+
+    def run(self, job: dict, binary_stream) -> dict:
+        """
+        Imports records from binary_stream for the given job, skipping records committed by an
+        earlier attempt. Marks the job completed, or failed if an error stops it part-way, and
+        returns its final record.
+        """
+        import_id = job['import_id']
+        checkpoint = {
+            'records_committed': job['records_committed'],
+            'rows_imported': job['rows_imported'],
+            'rows_rejected': job['rows_rejected'],
+            'report_bytes': job['report_bytes'],
+            'active_seconds': job['active_seconds']
+        }
+        os.makedirs(self.report_dir, exist_ok=True)
+        report_path = self.report_path(import_id)
+        try:
+            with open(report_path, 'ab') as report:
+                # Drop rejections written after the last checkpoint; they will be found again
+                report.truncate(checkpoint['report_bytes'])
+                report.seek(checkpoint['report_bytes'])
+                self._import_records(import_id, binary_stream, job['format'], checkpoint, report)
+        except Exception as e:
+            self.catalog_service.finish_import_job(import_id, 'failed', str(e))
+            raise
+        self.catalog_service.finish_import_job(import_id, 'completed')
+        return self.catalog_service.get_import_job(import_id)
+
+    def _import_records(self, import_id: str, binary_stream, import_format: str, checkpoint: dict, report) -> None:
+        records = iter_records(binary_stream, import_format)
+        # Skip what a previous attempt already committed
+        records = islice(records, checkpoint['records_committed'], None)
+        line_buffer = io.StringIO()
+        report_writer = csv.writer(line_buffer, lineterminator='\n')
+
+        started = time.perf_counter()
+        while True:
+            chunk = list(islice(records, self.batch_size))
+            if not chunk:
+                break
+            validated = iter(catalog_validator.validate_batch([data for _, data, error in chunk if not error]))
+            batch = []
+            for number, data, error in chunk:
+                result = ValidationError(error) if error else next(validated)
+                if isinstance(result, ValidationError):
+                    report_writer.writerow([number, str(result), json.dumps(data) if data is not None else ''])
+                else:
+                    batch.append(result)
+            started = self._commit(import_id, batch, len(chunk), len(chunk) - len(batch), started,
+                                   checkpoint, report, line_buffer)
+
+    def _commit(self, import_id: str, batch: list, pending: int, pending_rejected: int, started: float,
+                checkpoint: dict, report, line_buffer: io.StringIO) -> float:
+        """Flushes rejections to the report, then commits the batch with the advanced checkpoint."""
+        report.write(line_buffer.getvalue().encode('utf-8'))
+        report.flush()
+        line_buffer.seek(0)
+        line_buffer.truncate()
+
+        now = time.perf_counter()
+        advanced = {
+            'records_committed': checkpoint['records_committed'] + pending,
+            'rows_imported': checkpoint['rows_imported'] + len(batch),
+            'rows_rejected': checkpoint['rows_rejected'] + pending_rejected,
+            'report_bytes': report.tell(),
+            'active_seconds': checkpoint['active_seconds'] + (now - started)
+        }
+        self.catalog_service.import_catalog_batch(import_id, batch, advanced)
+        checkpoint.update(advanced)
+        return now
+
+def describe_import(job: dict) -> dict:
+    """Summarizes an import record for API responses, including throughput in records per second."""
+    return {
+        'import_id': job['import_id'],
+        'source_name': job['source_name'],
+        'format': job['format'],
+        'status': job['status'],
+        'records_processed': job['records_committed'],
+        'rows_imported': job['rows_imported'],
+        'rows_rejected': job['rows_rejected'],
+        'records_per_second': round(job['records_committed'] / job['active_seconds'], 1) if job['active_seconds'] else None,
+        'error': job['error']
+    }
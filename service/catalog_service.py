@@ -1,93 +1,859 @@
 import mysql.connector
-from utils.db_get_connection import get_connection
+import time
+from contextlib import contextmanager
+from datetime import date
+from utils.db_get_connection import get_pool, load_config
+from utils.routing import PRIMARY, get_router, reads_pinned_to_primary
+from utils.search import build_search_condition, build_relevance_expression, parse_stopwords
+from utils.cache import BaseCache, CacheEntry, create_cache
+from utils.metrics import record_query
+from utils.change_feed import ChangeNotifier
 from dto.catalog import Catalog
-from exception.catalog_exception import DataNotFoundError, DatabaseConnectionError
+from exception.catalog_exception import DataNotFoundError, DatabaseConnectionError, ChangeTokenExpiredError
+
+CATALOG_COLUMNS = ('catalog_id', 'catalog_name', 'catalog_description', 'start_date', 'end_date', 'status')
+SORTABLE_COLUMNS = ('catalog_id', 'catalog_name', 'start_date', 'end_date', 'status')
+RELEVANCE_SORT = 'relevance'
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+BULK_CHUNK_SIZE = 500
+MAX_BULK_ITEMS = 5000
+EXPORT_CHUNK_SIZE = 1000
+DEFAULT_CHANGE_LIMIT = 500
+MAX_CHANGE_LIMIT = 5000
+# List filter -> (column, operator); date bounds are inclusive
+LIST_FILTERS = {
+    'status': ('status', '='),
+    'starts_after': ('start_date', '>='),
+    'starts_before': ('start_date', '<='),
+    'ends_after': ('end_date', '>='),
+    'ends_before': ('end_date', '<=')
+}
+
+class _RollbackRequested(Exception):
+    """Raised inside _transaction() to abandon an all-or-nothing bulk write."""
+    pass
+
+class _TimedCursor:
+    """
+    Wraps the cursor of a _transaction() block so every statement is reported to utils.metrics with
+    its own SQL, parameters, phase timings and row count, like the queries of _execute_query().
+    A statement is recorded when the next one starts or the block ends, so its fetches are included.
+    """
+    def __init__(self, cursor, connect_seconds: float):
+        self._cursor = cursor
+        self._query = None
+        self._params = None
+        self._phases = {'connect': connect_seconds} # Charged to the block's first statement
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name) # lastrowid, rowcount, ...
+
+    def execute(self, query: str, params=()) -> None:
+        self.flush()
+        self._query, self._params = query, params
+        started = time.perf_counter()
+        try:
+            self._cursor.execute(query, params)
+        finally:
+            self._phases['execute'] = time.perf_counter() - started
+
+    def _fetch(self, method):
+        started = time.perf_counter()
+        try:
+            return method()
+        finally:
+            self._phases['fetch'] = self._phases.get('fetch', 0.0) + time.perf_counter() - started
+
+    def fetchone(self):
+        return self._fetch(self._cursor.fetchone)
+
+    def fetchall(self):
+        return self._fetch(self._cursor.fetchall)
+
+    def flush(self) -> None:
+        """Records the pending statement, if any."""
+        if self._query is None:
+            return
+        # Rows fetched for a SELECT, rows affected otherwise
+        record_query(self._query, self._params, self._phases, max(self._cursor.rowcount, 0),
+                     sum(self._phases.values()))
+        self._query = None
+        self._phases = {}
+
+def _is_row_error(e: DatabaseConnectionError) -> bool:
+    """True when a database error was caused by the data in a row rather than the connection."""
+    return isinstance(e.__cause__, (mysql.connector.IntegrityError, mysql.connector.DataError))
 
 class CatalogService:
     """
     Service layer for Catalog operations, interacting with the database.
     Encapsulates business logic and abstracts database access.
+    Reads go through a read-through cache that the write methods invalidate.
+    Every write is also logged to catalog_change for delta sync, and wakes change-feed listeners.
+    Writes and transactions use the primary; queries marked read_only may be served by a read replica.
     """
 
-    def _execute_query(self, query: str, params: tuple = None, fetch_one: bool = False, fetch_all: bool = False, commit: bool = False):
+    def __init__(self, cache: BaseCache = None):
+        self._cache = cache
+        self._synced_seq = None # Change number sync_cache_with_changes() last caught up to
+        self.change_notifier = ChangeNotifier()
+
+    @property
+    def cache(self) -> BaseCache:
+        """The cache backend, built from the [cache] section of config.ini on first use."""
+        if self._cache is None:
+            self._cache = create_cache(load_config())
+        return self._cache
+
+    def _acquire(self, read_only: bool = False) -> tuple:
+        """
+        Borrows a pooled connection and returns (pool, connection). Read-only work goes to a healthy
+        replica when there is one; if the replica's checkout fails it is taken out of rotation until
+        its next health check passes, and the primary serves the read instead.
+        """
+        router = get_router()
+        node, pool = router.read_pool() if read_only else (PRIMARY, router.primary)
+        try:
+            conn = pool.acquire()
+        except DatabaseConnectionError as e:
+            if node == PRIMARY:
+                raise
+            router.mark_unhealthy(node, e)
+            node, pool = PRIMARY, router.primary
+            conn = pool.acquire()
+        router.count_query(node)
+        return pool, conn
+
+    def _execute_query(self, query: str, params: tuple = None, fetch_one: bool = False, fetch_all: bool = False,
+                       commit: bool = False, read_only: bool = False, dictionary: bool = True):
         """
-        Internal helper to execute database queries, manage connections,
-        and handle common database exceptions.
+        Internal helper to execute database queries, borrow and return pooled
+        connections, and handle common database exceptions.
+        read_only queries may be routed to a read replica; only pass it for reads that tolerate replication lag.
+        Fetched rows are dicts, or plain tuples in SELECT order with dictionary=False.
         """
+        pool = None
         conn = None
         cursor = None
+        discard = False
+        phases = {} # connect/execute/fetch timings reported to utils.metrics
+        rows = 0
+        started = time.perf_counter()
         try:
-            conn = get_connection()
+            pool, conn = self._acquire(read_only)
+            mark = time.perf_counter()
+            phases['connect'] = mark - started
             # Use dictionary=True for fetching rows as dictionaries
-            cursor = conn.cursor(dictionary=True) if fetch_one or fetch_all else conn.cursor()
+            cursor = conn.cursor(dictionary=dictionary) if fetch_one or fetch_all else conn.cursor()
             cursor.execute(query, params or ()) # Pass params as tuple, empty if None
+            now = time.perf_counter()
+            phases['execute'] = now - mark
+            mark = now
 
             if commit:
-                conn.commit()
+                # Pooled connections autocommit, so the statement committed as it executed
+                rows = cursor.rowcount
                 # Return lastrowid for INSERTs, rowcount for UPDATE/DELETE
                 return cursor.lastrowid if 'INSERT' in query.upper() else cursor.rowcount
             elif fetch_one:
-                return cursor.fetchone()
+                result = cursor.fetchone()
+                phases['fetch'] = time.perf_counter() - mark
+                rows = 1 if result else 0
+                return result
             elif fetch_all:
-                return cursor.fetchall()
+                result = cursor.fetchall()
+                phases['fetch'] = time.perf_counter() - mark
+                rows = len(result)
+                return result
             return None # For non-fetching queries that don't commit (e.g., SELECT without return)
         except mysql.connector.Error as e:
-            if conn and commit: # Only rollback if transaction was intended (commit=True)
-                conn.rollback()
-            raise DatabaseConnectionError(f"Database error during operation: {e}")
+            # Connection-level failures leave the socket unusable; don't hand it back to the pool
+            discard = isinstance(e, (mysql.connector.InterfaceError, mysql.connector.OperationalError))
+            raise DatabaseConnectionError(f"Database error during operation: {e}") from e
+        except DatabaseConnectionError:
+            raise
         except Exception as e:
             # Catch unexpected errors to prevent raw exceptions from propagating
             raise Exception(f"An unexpected error occurred in service layer: {e}")
         finally:
-            # Ensure resources are closed
+            # Return the connection to the pool instead of closing it
             if cursor:
-                cursor.close()
+                try:
+                    cursor.close()
+                except mysql.connector.Error:
+                    discard = True
             if conn:
-                conn.close()
+                pool.release(conn, discard=discard)
+            record_query(query, params, phases, rows, time.perf_counter() - started)
+
+    @contextmanager
+    def _transaction(self, read_only: bool = False):
+        """
+        Borrows a pooled connection, starts a transaction on it and yields (conn, cursor).
+        Commits when the block completes and rolls back if it raises; database errors
+        surface as DatabaseConnectionError chained to the original mysql.connector error.
+        A read_only transaction may run on a replica and reads every statement from one consistent snapshot.
+        """
+        started = time.perf_counter()
+        pool, conn = self._acquire(read_only)
+        cursor = None
+        discard = False
+        try:
+            # Pooled connections autocommit, so every transaction starts explicitly
+            if read_only:
+                conn.start_transaction(consistent_snapshot=True, readonly=True)
+            else:
+                conn.start_transaction()
+            cursor = _TimedCursor(conn.cursor(), time.perf_counter() - started)
+            yield conn, cursor
+            cursor.flush()
+            mark = time.perf_counter()
+            conn.commit()
+            elapsed = time.perf_counter() - mark
+            record_query("COMMIT", None, {'commit': elapsed}, 0, elapsed)
+        except mysql.connector.Error as e:
+            discard = isinstance(e, (mysql.connector.InterfaceError, mysql.connector.OperationalError))
+            if not discard:
+                try:
+                    conn.rollback()
+                except mysql.connector.Error:
+                    discard = True
+            raise DatabaseConnectionError(f"Database error during operation: {e}") from e
+        except BaseException:
+            try:
+                conn.rollback()
+            except mysql.connector.Error:
+                discard = True
+            raise
+        finally:
+            if cursor:
+                try:
+                    cursor.flush()
+                    cursor.close()
+                except mysql.connector.Error:
+                    discard = True
+            pool.release(conn, discard=discard)
+
+    def _search_settings(self) -> tuple[str, int, frozenset]:
+        """Returns the configured search mode, FULLTEXT minimum token size and stopwords."""
+        config = load_config()
+        return (config.get('search', 'mode', fallback='like'), config.getint('search', 'min_token_size', fallback=3),
+                parse_stopwords(config.get('search', 'stopwords', fallback='default')))
+
+    def _search_condition(self, search_term: str) -> tuple[str, tuple]:
+        """Compiles a search term into a WHERE fragment using the configured search mode."""
+        return build_search_condition(search_term, *self._search_settings())
+
+    def _filter_conditions(self, search_term: str, filters: dict = None) -> tuple[list, list]:
+        """Compiles a search term and LIST_FILTERS values into WHERE conditions and their parameters."""
+        conditions = []
+        params = []
+        search_condition, search_params = self._search_condition(search_term)
+        if search_condition:
+            conditions.append(search_condition)
+            params += search_params
+        for name, value in (filters or {}).items():
+            column, op = LIST_FILTERS[name]
+            conditions.append(f"{column} {op} %s")
+            params.append(value)
+        return conditions, params
+
+    @staticmethod
+    def _filter_key(filters: dict) -> tuple:
+        """Order-independent cache key part for a filters dict."""
+        return tuple(sorted(filters.items())) if filters else None
+
+    def get_pool_stats(self) -> dict:
+        """Returns in-use, idle and wait-time counters for the process-wide primary connection pool."""
+        return get_pool().stats()
+
+    def get_node_stats(self) -> dict:
+        """Returns health, replication lag and query counts for the primary and each read replica."""
+        return get_router().stats()
+
+    def get_cache_stats(self) -> dict:
+        """Returns hit, miss and eviction counters for the catalog cache."""
+        return self.cache.stats()
+
+    def _invalidate(self, catalog_id: int) -> None:
+        """Drops the cached row for catalog_id and every cached list, page and count, then wakes change-feed listeners."""
+        self.cache.delete(f"catalog:{catalog_id}")
+        self.cache.bump_list_generation()
+        self.change_notifier.notify()
+
+    def sync_cache_with_changes(self) -> int:
+        """
+        Drops cached entries for catalogs that other processes changed since the last call, read from
+        catalog_change: a write handled by another worker, or status transitions run by another worker's
+        scheduler or by `python -m service.maintenance` from cron. Only a per-process cache needs it.
+        The first call just records the current change number. Returns the number of catalogs dropped.
+        """
+        horizon = self._execute_query("SELECT seq, pruned_through FROM catalog_change_seq WHERE id = 1",
+                                      fetch_one=True)
+        synced, self._synced_seq = self._synced_seq, horizon['seq']
+        if synced is None or horizon['seq'] == synced:
+            return 0
+        if horizon['pruned_through'] > synced:
+            self.cache.clear() # Changes were pruned before we read them
+            return 0
+        rows = self._execute_query("SELECT DISTINCT catalog_id FROM catalog_change WHERE seq > %s AND seq <= %s",
+                                   (synced, horizon['seq']), fetch_all=True)
+        for row in rows:
+            self.cache.delete(f"catalog:{row['catalog_id']}")
+        self.cache.bump_list_generation()
+        return len(rows)
+
+    def _record_changes(self, cursor, results: list) -> None:
+        """
+        Logs the catalogs written by the caller's transaction to catalog_change and stamps upserted rows
+        with the change number; call it last, just before the transaction commits. The number comes from
+        a single sequence row that stays locked until commit, so numbers become visible in commit order
+        and a changes reader can never skip a transaction that commits late. Taking it last keeps that
+        lock short.
+        """
+        changes = [(r['catalog_id'], 'delete' if r['status'] == 'deleted' else 'upsert')
+                   for r in results if r['status'] in ('created', 'updated', 'deleted')]
+        if not changes:
+            return
+        # LAST_INSERT_ID(expr) hands the new value back through the OK packet, saving a SELECT
+        cursor.execute("UPDATE catalog_change_seq SET seq = LAST_INSERT_ID(seq + 1) WHERE id = 1")
+        seq = cursor.lastrowid
+        placeholders = ", ".join(["(%s, %s, %s)"] * len(changes))
+        cursor.execute(f"INSERT INTO catalog_change (seq, catalog_id, operation) VALUES {placeholders}",
+                       [v for catalog_id, operation in changes for v in (seq, catalog_id, operation)])
+        upserted = [catalog_id for catalog_id, operation in changes if operation == 'upsert']
+        if upserted:
+            placeholders = ", ".join(["%s"] * len(upserted))
+            cursor.execute(f"UPDATE catalog SET version = %s WHERE catalog_id IN ({placeholders})", [seq] + upserted)
 
     def create_catalog(self, catalog: Catalog) -> int:
         """Adds a new catalog entry to the database."""
-        query = """
-            INSERT INTO catalog (catalog_name, catalog_description, start_date, end_date, status)
-            VALUES (%s, %s, %s, %s, %s)
-        """
-        params = (catalog.name, catalog.description, catalog.start_date, catalog.end_date, catalog.status)
-        catalog_id = self._execute_query(query, params, commit=True)
+        with self._transaction() as (conn, cursor):
+            results = self._insert_chunk(cursor, [catalog])
+            self._record_changes(cursor, results)
+        catalog_id = results[0]['catalog_id']
+        # The new ID may have been cached as missing by an earlier lookup
+        self._invalidate(catalog_id)
         return catalog_id
 
-    def get_catalog_by_id(self, catalog_id: int) -> dict:
-        """Retrieves a single catalog entry by its ID."""
-        catalog_data = self._execute_query("SELECT * FROM catalog WHERE catalog_id = %s", (catalog_id,), fetch_one=True)
-        if not catalog_data:
+    def _autoincrement_step(self, cursor) -> int:
+        """
+        Returns auto_increment_increment, the gap between the IDs of consecutive rows of one INSERT.
+        A multi-row VALUES list is a "simple insert" (row count known up front), which InnoDB gives
+        consecutive IDs in every innodb_autoinc_lock_mode, including the interleaved default of MySQL 8.
+        """
+        if not hasattr(self, '_autoinc_step'):
+            cursor.execute("SELECT @@auto_increment_increment")
+            self._autoinc_step = int(cursor.fetchone()[0])
+        return self._autoinc_step
+
+    def _insert_chunk(self, cursor, catalogs: list) -> list:
+        """Inserts a chunk of catalogs with one multi-row INSERT inside the caller's transaction and returns per-item results."""
+        step = self._autoincrement_step(cursor)
+        placeholders = ", ".join(["(%s, %s, %s, %s, %s)"] * len(catalogs))
+        params = [v for c in catalogs for v in (c.name, c.description, c.start_date, c.end_date, c.status)]
+        cursor.execute(f"INSERT INTO catalog (catalog_name, catalog_description, start_date, end_date, status) "
+                       f"VALUES {placeholders}", params)
+        # lastrowid is the ID of the first row of a multi-row INSERT
+        ids = [cursor.lastrowid + i * step for i in range(len(catalogs))]
+        return [{'status': 'created', 'catalog_id': catalog_id} for catalog_id in ids]
+
+    def _lock_existing_ids(self, cursor, catalog_ids: list) -> set:
+        """Locks and returns which of the given catalog IDs exist."""
+        placeholders = ", ".join(["%s"] * len(catalog_ids))
+        cursor.execute(f"SELECT catalog_id FROM catalog WHERE catalog_id IN ({placeholders}) FOR UPDATE", catalog_ids)
+        return {row[0] for row in cursor.fetchall()}
+
+    def _update_chunk(self, cursor, updates: list) -> list:
+        """Applies a chunk of (catalog_id, Catalog) updates as one multi-id UPDATE and returns per-item results."""
+        found = self._lock_existing_ids(cursor, [catalog_id for catalog_id, _ in updates])
+        present = [(catalog_id, c) for catalog_id, c in updates if catalog_id in found]
+        if present:
+            assignments = []
+            params = []
+            for column, attribute in (('catalog_name', 'name'), ('catalog_description', 'description'),
+                                      ('start_date', 'start_date'), ('end_date', 'end_date'), ('status', 'status')):
+                assignments.append(f"{column} = CASE catalog_id {' '.join(['WHEN %s THEN %s'] * len(present))} END")
+                params += [v for catalog_id, c in present for v in (catalog_id, getattr(c, attribute))]
+            placeholders = ", ".join(["%s"] * len(present))
+            cursor.execute(f"UPDATE catalog SET {', '.join(assignments)} WHERE catalog_id IN ({placeholders})",
+                           params + [catalog_id for catalog_id, _ in present])
+        return [{'status': 'updated', 'catalog_id': catalog_id} if catalog_id in found else
+                {'status': 'failed', 'catalog_id': catalog_id, 'error': f"Catalog with ID {catalog_id} not found for update."}
+                for catalog_id, _ in updates]
+
+    def _delete_chunk(self, cursor, catalog_ids: list) -> list:
+        """Deletes a chunk of catalog IDs with one multi-id DELETE and returns per-item results."""
+        found = self._lock_existing_ids(cursor, catalog_ids)
+        if found:
+            placeholders = ", ".join(["%s"] * len(found))
+            cursor.execute(f"DELETE FROM catalog WHERE catalog_id IN ({placeholders})", list(found))
+        return [{'status': 'deleted', 'catalog_id': catalog_id} if catalog_id in found else
+                {'status': 'failed', 'catalog_id': catalog_id, 'error': f"Catalog with ID {catalog_id} not found for deletion."}
+                for catalog_id in catalog_ids]
+
+    def _run_bulk(self, items: list, atomic: bool, write_chunk) -> list:
+        """
+        Runs write_chunk(cursor, chunk) over items in chunks of BULK_CHUNK_SIZE and returns one result per item.
+        Atomic mode uses a single transaction and rolls everything back if any item fails, reporting the
+        others as 'rolled_back'. Best-effort mode commits each chunk and retries a chunk that hits a data
+        error row by row, so only the offending rows fail.
+        """
+        chunks = [items[i:i + BULK_CHUNK_SIZE] for i in range(0, len(items), BULK_CHUNK_SIZE)]
+        results = []
+        if atomic:
+            try:
+                with self._transaction() as (conn, cursor):
+                    for chunk in chunks:
+                        chunk_results = write_chunk(cursor, chunk)
+                        results += chunk_results
+                        if any(r['status'] == 'failed' for r in chunk_results):
+                            raise _RollbackRequested()
+                    self._record_changes(cursor, results)
+            except _RollbackRequested:
+                results += [{'status': 'rolled_back'}] * (len(items) - len(results))
+                return [r if r['status'] == 'failed' else {'status': 'rolled_back'} for r in results]
+            return results
+
+        for position, chunk in enumerate(chunks):
+            try:
+                with self._transaction() as (conn, cursor):
+                    chunk_results = write_chunk(cursor, chunk)
+                    self._record_changes(cursor, chunk_results)
+                results += chunk_results
+            except DatabaseConnectionError as e:
+                if not _is_row_error(e):
+                    # Earlier chunks are committed; report everything from here on as failed
+                    remaining = sum(len(c) for c in chunks[position:])
+                    return results + [{'status': 'failed', 'error': str(e)}] * remaining
+                # Retry the chunk row by row so only the offending rows fail
+                for item in chunk:
+                    try:
+                        with self._transaction() as (conn, cursor):
+                            item_results = write_chunk(cursor, [item])
+                            self._record_changes(cursor, item_results)
+                        results += item_results
+                    except DatabaseConnectionError as row_error:
+                        results.append({'status': 'failed', 'error': str(row_error)})
+        return results
+
+    def _cached(self, key: str, loader) -> CacheEntry:
+        """
+        Read-through cache lookup; loader(read_only) queries the value on a miss, from a replica when
+        one is healthy. A replica may not yet have applied the write that just invalidated the key, and
+        nothing would invalidate its stale copy once it caught up, so while replicas are configured
+        entries live at most [routing] max_lag_seconds: no longer than a healthy replica can trail the
+        primary. Requests pinned to the primary after a write skip the cached copy and store a fresh one.
+        """
+        pinned = reads_pinned_to_primary()
+        ttl = None
+        if not pinned and get_router().replicas:
+            ttl = load_config().getfloat('routing', 'max_lag_seconds', fallback=10.0)
+        return self.cache.get_or_load(key, lambda: loader(True), refresh=pinned, ttl=ttl)
+
+    def get_catalog_entry(self, catalog_id: int) -> CacheEntry:
+        """Retrieves a single catalog entry by its ID as a cache entry carrying its ETag."""
+        def load(read_only: bool) -> Catalog:
+            row = self._execute_query(f"SELECT {', '.join(Catalog.COLUMNS)} FROM catalog WHERE catalog_id = %s",
+                                      (catalog_id,), fetch_one=True, read_only=read_only, dictionary=False)
+            return Catalog.from_row(row) if row else None
+        entry = self._cached(f"catalog:{catalog_id}", load)
+        if not entry.value:
             raise DataNotFoundError(f"Catalog with ID {catalog_id} not found.")
-        return catalog_data
+        return entry
+
+    def get_catalog_by_id(self, catalog_id: int) -> Catalog:
+        """Retrieves a single catalog entry by its ID."""
+        return self.get_catalog_entry(catalog_id).value
+
+    def get_catalog_page_entry(self, search_term: str = '', limit: int = DEFAULT_PAGE_SIZE, after: tuple = None,
+                               sort: str = 'catalog_id', descending: bool = False, fields: list = None,
+                               filters: dict = None) -> CacheEntry:
+        """
+        Retrieves one page of catalogs ordered by the sort column, then catalog_id, using keyset pagination,
+        as a cache entry whose value is (columns, rows, next keyset, change token).
+        `after` is the (sort value, catalog_id) of the last row already seen. Projections always include
+        catalog_id and the sort column. Rows are tuples in `columns` order. The next keyset is None on
+        the last page, and the change token is the one the page was read at: the page holds every change
+        up to that token and none after it.
+        Sorting by relevance ranks search matches and returns only the top `limit` rows, without a next page.
+        `filters` maps LIST_FILTERS names to a status or a date.
+        """
+        key = self.cache.list_key('page', search_term, limit, after, sort, descending, fields, self._filter_key(filters))
+        return self._cached(key, lambda read_only: self._load_catalog_page(
+            search_term, limit, after, sort, descending, fields, filters, read_only))
+
+    def _load_catalog_page(self, search_term: str, limit: int, after: tuple, sort: str, descending: bool,
+                           fields: list, filters: dict = None, read_only: bool = True) -> tuple[list, list, tuple, int]:
+        """Queries one page of catalogs for get_catalog_page_entry(), bypassing the cache."""
+        if sort == RELEVANCE_SORT:
+            columns, query, params = self._ranked_matches_query(search_term, limit, fields, filters)
+        else:
+            columns, query, params = self._page_query(search_term, limit, after, sort, descending, fields, filters)
+
+        with self._transaction(read_only=read_only) as (conn, cursor):
+            # Read in the page's snapshot, so the token matches exactly the changes the page reflects
+            cursor.execute("SELECT seq FROM catalog_change_seq WHERE id = 1")
+            change_token = int(cursor.fetchone()[0])
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+        if sort == RELEVANCE_SORT or len(rows) <= limit:
+            return columns, rows, None, change_token
+        rows = rows[:limit]
+        # catalog_id is always the first column
+        return columns, rows, (rows[-1][columns.index(sort)], rows[-1][0]), change_token
+
+    def _page_query(self, search_term: str, limit: int, after: tuple, sort: str, descending: bool,
+                    fields: list, filters: dict) -> tuple[list, str, tuple]:
+        """Builds the keyset-paginated page query; returns its columns, SQL and parameters."""
+        if sort not in SORTABLE_COLUMNS:
+            raise ValueError(f"Unsupported sort column: {sort}")
+        if fields:
+            columns = [c for c in CATALOG_COLUMNS if c in fields or c in ('catalog_id', sort)]
+        else:
+            columns = list(CATALOG_COLUMNS)
+
+        conditions, params = self._filter_conditions(search_term, filters)
+        op = '<' if descending else '>'
+        if after is not None:
+            if sort == 'catalog_id':
+                conditions.append(f"catalog_id {op} %s")
+                params.append(after[1])
+            else:
+                # Expanded row comparison so MySQL can range-scan an index on (sort, catalog_id)
+                conditions.append(f"({sort} {op} %s OR ({sort} = %s AND catalog_id {op} %s))")
+                params += [after[0], after[0], after[1]]
+
+        direction = 'DESC' if descending else 'ASC'
+        order_by = f"catalog_id {direction}" if sort == 'catalog_id' else f"{sort} {direction}, catalog_id {direction}"
+        query = f"SELECT {', '.join(columns)} FROM catalog"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += f" ORDER BY {order_by} LIMIT %s"
+        params.append(limit + 1) # One extra row tells us whether another page exists
+        return columns, query, tuple(params)
+
+    def _ranked_matches_query(self, search_term: str, limit: int, fields: list, filters: dict) -> tuple[list, str, tuple]:
+        """
+        Builds the query for the best `limit` search matches, most relevant first, with their relevance
+        score; returns its columns, SQL and parameters.
+        """
+        if not self._search_condition(search_term)[0]:
+            raise ValueError("Sorting by relevance requires a search term.")
+        conditions, condition_params = self._filter_conditions(search_term, filters)
+        score, score_params = build_relevance_expression(search_term, *self._search_settings())
+        columns = [c for c in CATALOG_COLUMNS if not fields or c in fields or c == 'catalog_id']
+        query = (f"SELECT {', '.join(columns)}, {score} AS relevance FROM catalog WHERE {' AND '.join(conditions)} "
+                 f"ORDER BY relevance DESC, catalog_id ASC LIMIT %s")
+        return columns + ['relevance'], query, tuple(score_params) + tuple(condition_params) + (limit,)
+
+    def stream_catalogs(self, search_term: str = '', filters: dict = None, fields: list = None,
+                        chunk_size: int = EXPORT_CHUNK_SIZE):
+        """
+        Yields every matching catalog as row tuples in `fields` order (all columns by default),
+        chunk_size rows at a time, ordered by catalog_id. Rows come from an unbuffered cursor so the
+        result set is never held in memory; the pooled connection is held until the generator is
+        exhausted or closed, and is discarded if the caller stops early. Exports read from a replica when one is healthy.
+        """
+        columns = [c for c in CATALOG_COLUMNS if c in fields] if fields else list(CATALOG_COLUMNS)
+        conditions, params = self._filter_conditions(search_term, filters)
+        query = f"SELECT {', '.join(columns)} FROM catalog"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY catalog_id"
+
+        pool, conn = self._acquire(read_only=True)
+        cursor = None
+        finished = False
+        discard = False
+        try:
+            cursor = conn.cursor(buffered=False)
+            cursor.execute(query, tuple(params))
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield rows
+            finished = True
+        except mysql.connector.Error as e:
+            discard = True
+            raise DatabaseConnectionError(f"Database error during export: {e}") from e
+        finally:
+            if not finished:
+                # Unread rows would have to be drained first; dropping the connection is cheaper
+                discard = True
+            elif cursor:
+                try:
+                    cursor.close()
+                except mysql.connector.Error:
+                    discard = True
+            pool.release(conn, discard=discard)
+
+    def count_catalogs_entry(self, search_term: str = '', approximate: bool = True, filters: dict = None) -> CacheEntry:
+        """
+        Counts catalog entries matching the search term and filters, as a cache entry whose value is the
+        count. Unfiltered approximate counts come from table statistics instead of a full COUNT(*) scan.
+        """
+        return self._cached(self.cache.list_key('count', search_term, approximate, self._filter_key(filters)),
+                            lambda read_only: self._load_count(search_term, approximate, filters, read_only))
+
+    def _load_count(self, search_term: str, approximate: bool, filters: dict = None, read_only: bool = True) -> int:
+        """Queries the count for count_catalogs_entry(), bypassing the cache."""
+        if approximate and not search_term and not filters:
+            row = self._execute_query(
+                "SELECT TABLE_ROWS AS total FROM information_schema.TABLES "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'catalog'", fetch_one=True, read_only=read_only)
+            if row and row['total'] is not None:
+                return int(row['total'])
+        query = "SELECT COUNT(*) AS total FROM catalog"
+        conditions, params = self._filter_conditions(search_term, filters)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        return int(self._execute_query(query, tuple(params), fetch_one=True, read_only=read_only)['total'])
+
+    def _invalidate_many(self, results: list) -> None:
+        """Drops cached rows for every catalog written by a bulk operation, retires cached lists and wakes change-feed listeners."""
+        for result in results:
+            if result['status'] in ('created', 'updated', 'deleted'):
+                self.cache.delete(f"catalog:{result['catalog_id']}")
+        self.cache.bump_list_generation()
+        self.change_notifier.notify()
+
+    def bulk_create_catalogs(self, catalogs: list, atomic: bool = True) -> list:
+        """
+        Adds many catalog entries using chunked multi-row INSERTs.
+        Returns one result per catalog, in order, with the generated catalog_id of each created row.
+        """
+        results = self._run_bulk(catalogs, atomic, self._insert_chunk)
+        self._invalidate_many(results)
+        return results
 
-    def get_all_catalog(self, search_term: str = '') -> list:
-        """Retrieves all catalog entries, with optional filtering by name or description."""
-        query = "SELECT * FROM catalog"
-        params = ()
-        if search_term:
-            query += " WHERE catalog_name LIKE %s OR catalog_description LIKE %s"
-            params = (f"%{search_term}%", f"%{search_term}%")
-        return self._execute_query(query, params, fetch_all=True)
+    def bulk_update_catalogs(self, updates: list, atomic: bool = True) -> list:
+        """
+        Updates many catalog entries from (catalog_id, Catalog) pairs using chunked multi-id UPDATEs.
+        Catalog IDs must be unique within one call. Returns one result per pair, in order.
+        """
+        results = self._run_bulk(updates, atomic, self._update_chunk)
+        self._invalidate_many(results)
+        return results
+
+    def bulk_delete_catalogs(self, catalog_ids: list, atomic: bool = True) -> list:
+        """Deletes many catalog entries by ID using chunked multi-id DELETEs. Returns one result per ID, in order."""
+        results = self._run_bulk(catalog_ids, atomic, self._delete_chunk)
+        self._invalidate_many(results)
+        return results
+
+    def create_import_job(self, import_id: str, source_name: str, import_format: str) -> None:
+        """Records a new streaming import so its progress can be polled and resumed."""
+        self._execute_query(
+            "INSERT INTO catalog_import (import_id, source_name, format, status) VALUES (%s, %s, %s, 'running')",
+            (import_id, source_name[:255], import_format), commit=True)
+
+    def get_import_job(self, import_id: str) -> dict:
+        """Retrieves the progress record of an import by its ID."""
+        job = self._execute_query("SELECT * FROM catalog_import WHERE import_id = %s", (import_id,), fetch_one=True)
+        if not job:
+            raise DataNotFoundError(f"Import {import_id} not found.")
+        return job
+
+    def import_catalog_batch(self, import_id: str, catalogs: list, checkpoint: dict) -> list:
+        """
+        Inserts one batch of validated import records and advances the import's checkpoint in the
+        same transaction, so a restarted import resumes exactly after the last committed batch.
+        checkpoint holds records_committed, rows_imported, rows_rejected, report_bytes and active_seconds.
+        """
+        results = []
+        with self._transaction() as (conn, cursor):
+            for i in range(0, len(catalogs), BULK_CHUNK_SIZE):
+                results += self._insert_chunk(cursor, catalogs[i:i + BULK_CHUNK_SIZE])
+            cursor.execute("""
+                UPDATE catalog_import
+                SET records_committed = %s, rows_imported = %s, rows_rejected = %s,
+                    report_bytes = %s, active_seconds = %s, status = 'running', error = NULL
+                WHERE import_id = %s
+            """, (checkpoint['records_committed'], checkpoint['rows_imported'], checkpoint['rows_rejected'],
+                  checkpoint['report_bytes'], checkpoint['active_seconds'], import_id))
+            self._record_changes(cursor, results)
+        if results:
+            self._invalidate_many(results)
+        return results
+
+    def finish_import_job(self, import_id: str, status: str, error: str = None) -> None:
+        """Marks an import as completed or failed."""
+        self._execute_query("UPDATE catalog_import SET status = %s, error = %s WHERE import_id = %s",
+                            (status, error[:500] if error else None, import_id), commit=True)
 
     def update_catalog_by_id(self, catalog_id: int, catalog: Catalog) -> bool:
         """Updates an existing catalog entry identified by its ID."""
-        query = """
-            UPDATE catalog
-            SET catalog_name = %s, catalog_description = %s,
-                start_date = %s, end_date = %s, status = %s
-            WHERE catalog_id = %s
-        """
-        params = (catalog.name, catalog.description, catalog.start_date, catalog.end_date, catalog.status, catalog_id)
-        row_count = self._execute_query(query, params, commit=True)
-        if row_count == 0:
-            raise DataNotFoundError(f"Catalog with ID {catalog_id} not found for update.")
+        with self._transaction() as (conn, cursor):
+            result = self._update_chunk(cursor, [(catalog_id, catalog)])[0]
+            self._record_changes(cursor, [result])
+        self._invalidate(catalog_id)
+        if result['status'] == 'failed':
+            raise DataNotFoundError(result['error'])
         return True
 
     def delete_catalog_by_id(self, catalog_id: int) -> bool:
         """Deletes a catalog entry by its ID."""
-        row_count = self._execute_query("DELETE FROM catalog WHERE catalog_id = %s", (catalog_id,), commit=True)
-        if row_count == 0:
-            raise DataNotFoundError(f"Catalog with ID {catalog_id} not found for deletion.")
-        return True
\ No newline at end of file
+        with self._transaction() as (conn, cursor):
+            result = self._delete_chunk(cursor, [catalog_id])[0]
+            self._record_changes(cursor, [result])
+        self._invalidate(catalog_id)
+        if result['status'] == 'failed':
+            raise DataNotFoundError(result['error'])
+        return True
+
+    def apply_status_transitions(self, today: date = None, chunk_size: int = BULK_CHUNK_SIZE) -> dict:
+        """
+        Moves catalogs forward through upcoming -> active -> expired as their dates pass. Each chunk is
+        one transaction that locks up to chunk_size matching IDs, updates their ID range with a single
+        UPDATE (re-checking the condition), logs the changes and commits; its rows are then dropped from
+        the cache. Statuses only move forward, and 'inactive' is never touched.
+        Returns the number of catalogs moved per transition, e.g. {'upcoming->active': 12}.
+        """
+        today = today or date.today()
+        transitions = (
+            # Catalogs whose whole run has passed skip 'active'
+            ('upcoming', 'expired', "end_date < %s", (today,)),
+            ('upcoming', 'active', "start_date <= %s", (today,)),
+            ('active', 'expired', "end_date < %s", (today,))
+        )
+        moved = {}
+        for old_status, new_status, condition, condition_params in transitions:
+            count = 0
+            last_id = 0
+            while True:
+                with self._transaction() as (conn, cursor):
+                    cursor.execute(
+                        f"SELECT catalog_id FROM catalog WHERE status = %s AND {condition} AND catalog_id > %s "
+                        f"ORDER BY catalog_id LIMIT %s FOR UPDATE",
+                        (old_status, *condition_params, last_id, chunk_size))
+                    ids = [row[0] for row in cursor.fetchall()]
+                    results = [{'status': 'updated', 'catalog_id': catalog_id} for catalog_id in ids]
+                    if ids:
+                        # Every matching row in the range is locked above, so this updates exactly `ids`
+                        cursor.execute(
+                            f"UPDATE catalog SET status = %s "
+                            f"WHERE catalog_id BETWEEN %s AND %s AND status = %s AND {condition}",
+                            (new_status, ids[0], ids[-1], old_status, *condition_params))
+                        self._record_changes(cursor, results)
+                if not ids:
+                    break
+                self._invalidate_many(results)
+                count += len(ids)
+                last_id = ids[-1]
+                if len(ids) < chunk_size:
+                    break
+            if count:
+                moved[f"{old_status}->{new_status}"] = count
+        return moved
+
+    @contextmanager
+    def named_lock(self, name: str):
+        """
+        Holds a MySQL named lock (GET_LOCK) on the primary for the duration of the block and yields
+        whether it was obtained, without waiting. Lets a job scheduled in every worker run in one at a time.
+        """
+        pool, conn = self._acquire()
+        cursor = None
+        discard = False
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT GET_LOCK(%s, 0)", (name,))
+            acquired = cursor.fetchone()[0] == 1
+            try:
+                yield acquired
+            finally:
+                if acquired:
+                    cursor.execute("SELECT RELEASE_LOCK(%s)", (name,))
+                    cursor.fetchone()
+        except mysql.connector.Error as e:
+            # The server releases a named lock when its session ends
+            discard = True
+            raise DatabaseConnectionError(f"Database error during operation: {e}") from e
+        finally:
+            if cursor:
+                try:
+                    cursor.close()
+                except mysql.connector.Error:
+                    discard = True
+            pool.release(conn, discard=discard)
+
+    def get_change_token(self) -> int:
+        """Returns the number of the latest committed change; a new delta-sync client starts from it."""
+        return int(self._execute_query("SELECT seq FROM catalog_change_seq WHERE id = 1", fetch_one=True)['seq'])
+
+    def get_changes(self, since: int, limit: int = DEFAULT_CHANGE_LIMIT) -> dict:
+        """
+        Returns the catalogs changed after change token `since`, one entry per catalog in change order:
+        {'op': 'upsert', 'catalog_id', 'catalog': current Catalog} or {'op': 'delete', 'catalog_id'}.
+        The result also holds 'token', to pass as `since` next time, and 'has_more'. A page never
+        splits the changes of one transaction, so when a transaction alone exceeds limit the page holds
+        all of it: up to MAX_BULK_ITEMS entries for an atomic bulk call, an import's batch_size, or a
+        status-transition chunk.
+        Raises ChangeTokenExpiredError when the token predates the retained change log.
+        """
+        horizon = self._execute_query("SELECT seq, pruned_through FROM catalog_change_seq WHERE id = 1", fetch_one=True)
+        if since < horizon['pruned_through'] or since > horizon['seq']:
+            raise ChangeTokenExpiredError(f"Change token {since} has expired; reload the catalog list.")
+        if since == horizon['seq']:
+            return {'changes': [], 'token': since, 'has_more': False}
+
+        query = "SELECT seq, catalog_id, operation FROM catalog_change WHERE seq > %s ORDER BY seq, catalog_id LIMIT %s"
+        rows = self._execute_query(query, (since, limit + 1), fetch_all=True)
+        has_more = len(rows) > limit
+        if has_more:
+            # A token must follow a complete change number, so leave a partly fetched one for the next page
+            boundary = rows[limit]['seq']
+            rows = [row for row in rows[:limit] if row['seq'] != boundary]
+            if not rows:
+                rows = self._execute_query(
+                    "SELECT seq, catalog_id, operation FROM catalog_change WHERE seq = %s ORDER BY catalog_id",
+                    (boundary,), fetch_all=True)
+        if not rows:
+            return {'changes': [], 'token': since, 'has_more': False}
+
+        latest = {} # catalog_id -> last operation, ordered by that operation
+        for row in rows:
+            latest.pop(row['catalog_id'], None)
+            latest[row['catalog_id']] = row['operation']
+        upserted = [catalog_id for catalog_id, operation in latest.items() if operation == 'upsert']
+        current = {}
+        if upserted:
+            placeholders = ", ".join(["%s"] * len(upserted))
+            query = f"SELECT {', '.join(Catalog.COLUMNS)} FROM catalog WHERE catalog_id IN ({placeholders})"
+            for row in self._execute_query(query, tuple(upserted), fetch_all=True, dictionary=False):
+                catalog = Catalog.from_row(row)
+                current[catalog.catalog_id] = catalog
+        changes = []
+        for catalog_id, operation in latest.items():
+            if operation == 'upsert' and catalog_id in current:
+                changes.append({'op': 'upsert', 'catalog_id': catalog_id, 'catalog': current[catalog_id]})
+            else:
+                # Rows deleted by a later change are reported as deleted now
+                changes.append({'op': 'delete', 'catalog_id': catalog_id})
+        return {'changes': changes, 'token': rows[-1]['seq'], 'has_more': has_more}
+
+    def prune_changes(self, retention_days: float, chunk_size: int = BULK_CHUNK_SIZE) -> int:
+        """
+        Deletes change-log entries older than retention_days and returns how many were removed.
+        The retention horizon is raised first, so clients holding a token from the pruned range get
+        ChangeTokenExpiredError and must reload; the rows are then deleted chunk_size per transaction.
+        """
+        with self._transaction() as (conn, cursor):
+            cursor.execute("SELECT MAX(seq) FROM catalog_change WHERE changed_at < NOW(6) - INTERVAL %s SECOND",
+                           (int(retention_days * 86400),))
+            through = cursor.fetchone()[0]
+            if through is None:
+                return 0
+            cursor.execute("UPDATE catalog_change_seq SET pruned_through = GREATEST(pruned_through, %s) WHERE id = 1",
+                           (through,))
+        removed = 0
+        while True:
+            with self._transaction() as (conn, cursor):
+                cursor.execute("DELETE FROM catalog_change WHERE seq <= %s ORDER BY seq LIMIT %s", (through, chunk_size))
+                deleted = cursor.rowcount
+            removed += deleted
+            if deleted < chunk_size:
+                return removed
\ No newline at end of file
@@ -0,0 +1,107 @@
+import json
+import logging
+import os
+import threading
+import time
+from service.catalog_service import CatalogService, BULK_CHUNK_SIZE
+from utils.db_get_connection import load_config
+
+MAINTENANCE_LOCK = 'catalog_maintenance'
+
+logger = logging.getLogger('catalog.maintenance')
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+_cache_sync = None
+_cache_sync_pid = None
+
+def run_maintenance(catalog_service: CatalogService) -> dict:
+    """
+    Runs the scheduled batch jobs once: status transitions, then change-log pruning.
+    Returns what was done, or None when another process is already running them.
+    """
+    config = load_config()
+    with catalog_service.named_lock(MAINTENANCE_LOCK) as acquired:
+        if not acquired:
+            return None
+        transitions = catalog_service.apply_status_transitions(
+            chunk_size=config.getint('maintenance', 'chunk_size', fallback=BULK_CHUNK_SIZE))
+        pruned = catalog_service.prune_changes(config.getfloat('changes', 'retention_days', fallback=7.0),
+                                               config.getint('maintenance', 'chunk_size', fallback=BULK_CHUNK_SIZE))
+    return {'status_transitions': transitions, 'changes_pruned': pruned}
+
+class MaintenanceScheduler:
+    """
+    Calls run_maintenance() on a daemon thread every interval seconds, starting immediately.
+    Every worker process runs one; the named lock makes sure only one of them does the work at a time.
+    """
+    def __init__(self, catalog_service: CatalogService, interval: float):
+        self.catalog_service = catalog_service
+        self.interval = interval
+        self.pid = os.getpid()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='catalog-maintenance', daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                result = run_maintenance(self.catalog_service)
+            except Exception:
+                logger.exception("Scheduled maintenance failed; retrying in %.0f s", self.interval)
+            else:
+                if result and (result['status_transitions'] or result['changes_pruned']):
+                    logger.info("Maintenance: %s", result)
+            if self._stopped.wait(self.interval):
+                return
+
+def start_scheduler(catalog_service: CatalogService) -> MaintenanceScheduler:
+    """
+    Starts this process's maintenance scheduler if [maintenance] enabled is true, and returns it.
+    Calling it again in the same process returns the running scheduler.
+    """
+    global _scheduler
+    config = load_config()
+    if not config.getboolean('maintenance', 'enabled', fallback=True):
+        return None
+    with _scheduler_lock:
+        if _scheduler is None or _scheduler.pid != os.getpid():
+            _scheduler = MaintenanceScheduler(catalog_service,
+                                              config.getfloat('maintenance', 'interval_seconds', fallback=300.0))
+            _scheduler.start()
+        return _scheduler
+
+def _sync_cache(catalog_service: CatalogService, interval: float) -> None:
+    while True:
+        try:
+            catalog_service.sync_cache_with_changes()
+        except Exception:
+            logger.exception("Cache sync with the change log failed; retrying in %.0f s", interval)
+        time.sleep(interval)
+
+def start_cache_sync(catalog_service: CatalogService) -> threading.Thread:
+    """
+    For a per-process cache, starts a daemon thread that drops entries changed by other processes every
+    [changes] poll_seconds, and returns it. Shared and disabled caches need no thread; returns None.
+    """
+    global _cache_sync, _cache_sync_pid
+    if not catalog_service.cache.per_process:
+        return None
+    with _scheduler_lock:
+        if _cache_sync is None or _cache_sync_pid != os.getpid():
+            interval = load_config().getfloat('changes', 'poll_seconds', fallback=2.0)
+            _cache_sync = threading.Thread(target=_sync_cache, args=(catalog_service, interval),
+                                           name='catalog-cache-sync', daemon=True)
+            _cache_sync_pid = os.getpid()
+            _cache_sync.start()
+        return _cache_sync
+
+if __name__ == '__main__':
+    # One-off run, e.g. from cron when the in-process scheduler is disabled: python -m service.maintenance
+    logging.basicConfig(level=logging.INFO)
+    print(json.dumps(run_maintenance(CatalogService())))
@@ -30,6 +30,9 @@ document.addEventListener('DOMContentLoaded', () => {
         noCatalogsMessage: getById('noCatalogsMessage'),
         messageContainer: getById('message-container'),
         loadingSpinner: getById('loadingSpinner'),
+        prevPageBtn: getById('prevPageBtn'),
+        nextPageBtn: getById('nextPageBtn'),
+        pageInfo: getById('pageInfo'),
         // Form specific error spans
         catalogNameError: getById('catalogNameError'),
         catalogDescriptionError: getById('catalogDescriptionError'),
@@ -41,6 +44,13 @@ document.addEventListener('DOMContentLoaded', () => {
     // --- State Variables ---
     let currentDeleteCatalogId = null;
     let currentActionType = null; // 'update', 'delete', 'view'
+    const PAGE_SIZE = 50;
+    let currentSearchTerm = '';
+    let pageCursors = [null]; // Cursor that starts each visited page; index 0 is the first page
+    let nextPageCursor = null;
+    let showingSingleCatalog = false; // True while the table shows one catalog looked up by ID
+    let changeFeed = null; // EventSource on /api/catalogs/stream, or null when unsupported
+    let feedToken = null; // Change token the feed has delivered up to, as a BigInt
 
     // --- UI Feedback & Modal Management ---
 
@@ -111,42 +121,119 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     };
 
-    /** Fetches and displays all catalogs, with optional search. */
-    const fetchAndDisplayAllCatalogs = async (searchTerm = '') => {
+    /** Fills a table row with the cells of one catalog. */
+    const fillCatalogRow = (row, catalog) => {
+        row.setAttribute('data-id', catalog.catalog_id);
+        row.innerHTML = `
+            <td data-label="ID">${catalog.catalog_id}</td>
+            <td data-label="Name">${catalog.catalog_name}</td>
+            <td data-label="Description">${catalog.catalog_description}</td>
+            <td data-label="Start Date">${catalog.start_date}</td>
+            <td data-label="End Date">${catalog.end_date}</td>
+            <td data-label="Status">${catalog.status}</td>
+            <td class="actions">
+                <button class="btn-small btn-edit-color" data-id="${catalog.catalog_id}">Edit</button>
+                <button class="btn-small btn-danger-color" data-id="${catalog.catalog_id}">Delete</button>
+            </td>
+        `;
+    };
+
+    /** Appends one catalog as a row of the table. */
+    const appendCatalogRow = (catalog) => fillCatalogRow(ui.catalogTableBody.insertRow(), catalog);
+
+    /** Returns the table row showing a catalog, or null if it is not on screen. */
+    const findCatalogRow = (catalogId) => ui.catalogTableBody.querySelector(`tr[data-id="${catalogId}"]`);
+
+    /**
+     * Applies change-feed deltas to the rows on screen: updated rows are redrawn in place, deleted rows
+     * removed, and new catalogs appended when the unfiltered list is on its last page.
+     */
+    const applyCatalogChanges = (changes) => {
+        changes.forEach((change) => {
+            const row = findCatalogRow(change.catalog_id);
+            if (change.op === 'delete') {
+                if (row) row.remove();
+            } else if (row) {
+                fillCatalogRow(row, change.catalog);
+            } else if (!showingSingleCatalog && !currentSearchTerm && !nextPageCursor) {
+                const rows = ui.catalogTableBody.rows;
+                const lastId = rows.length ? Number(rows[rows.length - 1].dataset.id) : 0;
+                if (change.catalog_id > lastId) appendCatalogRow(change.catalog); // Rows are ordered by ID
+            }
+        });
+        ui.noCatalogsMessage.style.display = ui.catalogTableBody.rows.length ? 'none' : 'block';
+    };
+
+    /** True while the change feed is connected, so the table stays current without refetching. */
+    const changeFeedConnected = () => changeFeed !== null && changeFeed.readyState === EventSource.OPEN;
+
+    /**
+     * Brings a freshly loaded page up to the feed's position. A page can be read at an older token than
+     * the feed has reached (another worker's cache, a lagging replica), and the feed only delivers changes
+     * after its own token, so the gap is replayed from the changes API.
+     */
+    const catchUpPage = async (pageToken) => {
+        if (!pageToken || feedToken === null || BigInt(pageToken) >= feedToken) return;
+        let since = pageToken;
+        try {
+            let more = true;
+            while (more) {
+                const result = await apiRequest(`/api/catalogs/changes?since=${since}`);
+                applyCatalogChanges(result.data.changes);
+                since = result.data.token;
+                more = result.data.has_more && BigInt(since) < feedToken;
+            }
+        } catch (error) {
+            // Error already shown by apiRequest; the next page load catches up again
+        }
+    };
+
+    /** Enables or disables the pager buttons for the current page. */
+    const updatePager = () => {
+        const pageNumber = pageCursors.length;
+        ui.prevPageBtn.disabled = pageNumber <= 1;
+        ui.nextPageBtn.disabled = !nextPageCursor;
+        ui.pageInfo.textContent = `Page ${pageNumber}`;
+    };
+
+    /** Fetches and displays one page of catalogs, with optional search. */
+    const fetchCatalogPage = async (cursor = null) => {
+        showingSingleCatalog = false;
         try {
-            const url = searchTerm ? `/api/catalogs?search=${encodeURIComponent(searchTerm)}` : '/api/catalogs';
-            const result = await apiRequest(url);
+            const params = new URLSearchParams({ limit: PAGE_SIZE });
+            if (currentSearchTerm) params.set('search', currentSearchTerm);
+            if (cursor) params.set('after', cursor);
+            const result = await apiRequest(`/api/catalogs?${params}`);
             const catalogs = result.data || []; // Access 'data' field
+            nextPageCursor = (result.meta && result.meta.next_cursor) || null;
 
             ui.catalogTableBody.innerHTML = ''; // Clear table
 
             if (catalogs.length > 0) {
                 ui.noCatalogsMessage.style.display = 'none';
-                catalogs.forEach(catalog => {
-                    const row = ui.catalogTableBody.insertRow();
-                    row.setAttribute('data-id', catalog.catalog_id);
-                    row.innerHTML = `
-                        <td data-label="ID">${catalog.catalog_id}</td>
-                        <td data-label="Name">${catalog.catalog_name}</td>
-                        <td data-label="Description">${catalog.catalog_description}</td>
-                        <td data-label="Start Date">${catalog.start_date}</td>
-                        <td data-label="End Date">${catalog.end_date}</td>
-                        <td data-label="Status">${catalog.status}</td>
-                        <td class="actions">
-                            <button class="btn-small btn-edit-color" data-id="${catalog.catalog_id}">Edit</button>
-                            <button class="btn-small btn-danger-color" data-id="${catalog.catalog_id}">Delete</button>
-                        </td>
-                    `;
-                });
+                catalogs.forEach(appendCatalogRow);
             } else {
                 ui.noCatalogsMessage.style.display = 'block';
             }
+            await catchUpPage(result.meta && result.meta.change_token);
         } catch (error) {
             // Error already shown by apiRequest, just update UI state if needed
+            nextPageCursor = null;
             ui.noCatalogsMessage.style.display = 'block';
         }
+        updatePager();
     };
 
+    /** Fetches and displays the first page of catalogs, with optional search. */
+    const fetchAndDisplayAllCatalogs = async (searchTerm = '') => {
+        currentSearchTerm = searchTerm;
+        pageCursors = [null];
+        await fetchCatalogPage();
+    };
+
+    /** Reloads the page currently shown, e.g. after a create, update or delete. */
+    const refreshCurrentPage = () => fetchCatalogPage(pageCursors[pageCursors.length - 1]);
+
     /** Fetches a single catalog by ID and populates the form for editing. */
     const fetchCatalogForEdit = async (catalogId) => {
         try {
@@ -182,23 +269,11 @@ document.addEventListener('DOMContentLoaded', () => {
             const catalog = result.data; // Access 'data' field
             
             ui.catalogTableBody.innerHTML = ''; // Clear table
+            showingSingleCatalog = true;
 
             if (catalog) {
                 ui.noCatalogsMessage.style.display = 'none';
-                const row = ui.catalogTableBody.insertRow();
-                row.setAttribute('data-id', catalog.catalog_id);
-                row.innerHTML = `
-                    <td data-label="ID">${catalog.catalog_id}</td>
-                    <td data-label="Name">${catalog.catalog_name}</td>
-                    <td data-label="Description">${catalog.catalog_description}</td>
-                    <td data-label="Start Date">${catalog.start_date}</td>
-                    <td data-label="End Date">${catalog.end_date}</td>
-                    <td data-label="Status">${catalog.status}</td>
-                    <td class="actions">
-                        <button class="btn-small btn-edit-color" data-id="${catalog.catalog_id}">Edit</button>
-                        <button class="btn-small btn-danger-color" data-id="${catalog.catalog_id}">Delete</button>
-                    </td>
-                `;
+                appendCatalogRow(catalog);
                 showMessage(`Catalog ID ${catalogId} found and displayed.`, 'success');
             } else {
                 ui.noCatalogsMessage.style.display = 'block';
@@ -226,7 +301,7 @@ document.addEventListener('DOMContentLoaded', () => {
             showMessage(result.message, 'success');
             hideModal(ui.catalogModal);
             resetCatalogForm();
-            fetchAndDisplayAllCatalogs(); // Refresh table
+            if (!changeFeedConnected()) refreshCurrentPage(); // Otherwise the change feed updates the table
         } catch (error) {
             // Specific validation errors already handled by Flask & apiRequest, just update form errors
             if (error.message) {
@@ -256,7 +331,7 @@ document.addEventListener('DOMContentLoaded', () => {
         try {
             const result = await apiRequest(`/api/catalogs/${catalogId}`, { method: 'DELETE' });
             showMessage(result.message, 'success');
-            fetchAndDisplayAllCatalogs(); // Refresh table
+            if (!changeFeedConnected()) refreshCurrentPage(); // Otherwise the change feed updates the table
         } catch (error) {
             // Error already shown by apiRequest
         } finally {
@@ -317,6 +392,18 @@ document.addEventListener('DOMContentLoaded', () => {
 
     ui.viewAllCatalogsBtn.addEventListener('click', () => fetchAndDisplayAllCatalogs());
 
+    ui.nextPageBtn.addEventListener('click', () => {
+        if (!nextPageCursor) return;
+        pageCursors.push(nextPageCursor);
+        fetchCatalogPage(nextPageCursor);
+    });
+
+    ui.prevPageBtn.addEventListener('click', () => {
+        if (pageCursors.length <= 1) return;
+        pageCursors.pop();
+        refreshCurrentPage();
+    });
+
     ui.updateByIdBtn.addEventListener('click', () => {
         currentActionType = 'update';
         ui.actionByIdTitle.textContent = 'Enter Catalog ID to Update';
@@ -415,6 +502,50 @@ document.addEventListener('DOMContentLoaded', () => {
         ui.confirmMessage.textContent = "";
     });
 
+    // --- Change Feed ---
+
+    /**
+     * Subscribes to catalog changes and calls onReady once the feed has its starting token. Pages loaded
+     * after that point replay any changes between their own token and the feed's (see catchUpPage), so
+     * none fall between the list and the feed; the browser reconnects on its own and resumes from the
+     * last event it received.
+     */
+    const startChangeFeed = (onReady) => {
+        if (!window.EventSource) {
+            onReady();
+            return;
+        }
+        let ready = false;
+        changeFeed = new EventSource('/api/catalogs/stream');
+        changeFeed.addEventListener('ready', (event) => {
+            feedToken = BigInt(JSON.parse(event.data).token);
+            if (!ready) {
+                ready = true;
+                onReady();
+            }
+        });
+        changeFeed.addEventListener('changes', (event) => {
+            const result = JSON.parse(event.data);
+            applyCatalogChanges(result.changes);
+            feedToken = BigInt(result.token);
+        });
+        changeFeed.addEventListener('reset', () => {
+            // Our position in the change log has expired; start over from a fresh list
+            changeFeed.close();
+            startChangeFeed(refreshCurrentPage);
+        });
+        changeFeed.addEventListener('error', () => {
+            if (!ready) {
+                // No feed available; fall back to refetching the table after each change
+                ready = true;
+                changeFeed.close();
+                changeFeed = null;
+                feedToken = null;
+                onReady();
+            }
+        });
+    };
+
     // --- Initial Application Load ---
-    fetchAndDisplayAllCatalogs();
+    startChangeFeed(() => fetchAndDisplayAllCatalogs());
 });
\ No newline at end of file
@@ -0,0 +1,87 @@
+import pytest
+
+from utils.cache import BaseCache, CacheEntry, LocalCache, NullCache, create_cache
+
+def test_miss_loads_and_hit_reuses():
+    cache = LocalCache()
+    calls = []
+    first = cache.get_or_load('catalog:1', lambda: calls.append(1) or 'row')
+    second = cache.get_or_load('catalog:1', lambda: calls.append(1) or 'other')
+    assert second is first
+    assert calls == [1]
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['misses'] == 1
+
+def test_refresh_replaces_entry():
+    cache = LocalCache()
+    cache.get_or_load('catalog:1', lambda: 'old')
+    assert cache.get_or_load('catalog:1', lambda: 'new', refresh=True).value == 'new'
+    assert cache.get('catalog:1').value == 'new'
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr('utils.cache.time.monotonic', lambda: now[0])
+    cache = LocalCache(ttl=60)
+    cache.set('a', CacheEntry('a'))
+    cache.set('b', CacheEntry('b'), ttl=5)
+    now[0] += 10
+    assert cache.get('a') is not None
+    assert cache.get('b') is None
+    now[0] += 60
+    assert cache.get('a') is None
+    assert cache.stats()['expirations'] == 2
+
+def test_least_recently_used_entry_is_evicted():
+    cache = LocalCache(max_entries=2)
+    for key in ('a', 'b'):
+        cache.set(key, CacheEntry(key))
+    cache.get('a')
+    cache.set('c', CacheEntry('c'))
+    assert cache.get('b') is None
+    assert cache.get('a') is not None
+    assert cache.stats()['evictions'] == 1
+
+def test_value_loaded_across_an_invalidation_is_not_stored():
+    cache = LocalCache()
+
+    def load_then_write():
+        cache.delete('catalog:1') # A concurrent write commits while the old row is being loaded
+        return 'old row'
+    assert cache.get_or_load('catalog:1', load_then_write).value == 'old row'
+    assert cache.get('catalog:1') is None
+
+def test_list_keys_change_with_generation():
+    cache = LocalCache()
+    key = cache.list_key('page', 'summer', 50)
+    cache.bump_list_generation()
+    assert cache.list_key('page', 'summer', 50) != key
+
+def test_zero_ttl_is_not_stored():
+    cache = LocalCache()
+    cache.get_or_load('a', lambda: 1, ttl=0)
+    assert cache.get('a') is None
+
+def test_null_cache_still_builds_etags():
+    cache = NullCache()
+    entry = cache.get_or_load('a', lambda: {'x': 1})
+    assert entry.etag == CacheEntry({'x': 1}).etag
+    assert cache.get('a') is None
+    assert not cache.stores
+
+def test_backends_must_implement_every_method():
+    class Incomplete(BaseCache):
+        def get(self, key):
+            return None
+    with pytest.raises(TypeError):
+        Incomplete()
+
+def test_create_cache_from_config():
+    from configparser import ConfigParser
+    config = ConfigParser()
+    assert isinstance(create_cache(config), NullCache)
+    config.read_dict({'cache': {'enabled': 'true', 'backend': 'local', 'max_entries': '3', 'ttl': '5'}})
+    cache = create_cache(config)
+    assert isinstance(cache, LocalCache) and cache.max_entries == 3 and cache.ttl == 5
+    config['cache']['backend'] = 'memcached'
+    with pytest.raises(ValueError):
+        create_cache(config)
@@ -0,0 +1,136 @@
+import threading
+
+import mysql.connector
+import pytest
+
+import utils.db_get_connection as db
+from exception.catalog_exception import DatabaseConnectionError
+
+class FakeConnection:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.closed = False
+        self.rolled_back = False
+        self.unread_result = False
+        self.in_transaction = False
+        self.ping_error = None
+
+    def ping(self, reconnect=False):
+        if self.ping_error:
+            raise self.ping_error
+
+    def rollback(self):
+        self.rolled_back = True
+        self.in_transaction = False
+
+    def consume_results(self):
+        self.unread_result = False
+
+    def close(self):
+        self.closed = True
+
+@pytest.fixture
+def opened(monkeypatch):
+    connections = []
+
+    def connect(**kwargs):
+        conn = FakeConnection(**kwargs)
+        connections.append(conn)
+        return conn
+    monkeypatch.setattr(db.mysql.connector, 'connect', connect)
+    return connections
+
+def make_pool(**kwargs):
+    options = {'pool_size': 2, 'max_overflow': 1, 'timeout': 0.05, 'recycle': 3600.0, 'ping_interval': 30.0}
+    options.update(kwargs)
+    return db.ConnectionPool({'host': 'db', 'user': 'u', 'password': 'p', 'database': 'd'}, **options)
+
+def test_connections_autocommit(opened):
+    pool = make_pool()
+    pool.acquire()
+    assert opened[0].kwargs['autocommit'] is True
+    assert opened[0].kwargs['host'] == 'db'
+
+def test_released_connection_is_reused(opened):
+    pool = make_pool()
+    conn = pool.acquire()
+    pool.release(conn)
+    assert pool.acquire() is conn
+    assert len(opened) == 1
+    assert pool.stats()['checkouts'] == 2
+
+def test_overflow_connection_is_closed_on_release(opened):
+    pool = make_pool()
+    conns = [pool.acquire() for _ in range(3)]
+    assert pool.stats()['opened'] == 3
+    for conn in conns:
+        pool.release(conn)
+    stats = pool.stats()
+    assert stats['idle'] == 2
+    assert stats['opened'] == 2
+    assert [conn.closed for conn in conns] == [False, False, True]
+
+def test_checkout_times_out_when_exhausted(opened):
+    pool = make_pool(pool_size=1, max_overflow=0)
+    pool.acquire()
+    with pytest.raises(DatabaseConnectionError, match="Timed out"):
+        pool.acquire()
+    assert pool.stats()['timeouts'] == 1
+    assert pool.stats()['in_use'] == 1
+
+def test_waiting_checkout_gets_released_connection(opened):
+    pool = make_pool(pool_size=1, max_overflow=0, timeout=5.0)
+    conn = pool.acquire()
+    timer = threading.Timer(0.05, pool.release, args=(conn,))
+    timer.start()
+    try:
+        assert pool.acquire() is conn
+    finally:
+        timer.cancel()
+    assert pool.stats()['wait_time_max'] > 0
+
+def test_release_rolls_back_open_transaction(opened):
+    pool = make_pool()
+    conn = pool.acquire()
+    conn.in_transaction = True
+    conn.unread_result = True
+    pool.release(conn)
+    assert conn.rolled_back
+    assert not conn.unread_result
+    assert pool.stats()['idle'] == 1
+
+def test_discarded_connection_is_closed(opened):
+    pool = make_pool()
+    conn = pool.acquire()
+    pool.release(conn, discard=True)
+    assert conn.closed
+    assert pool.stats()['idle'] == 0
+    assert pool.stats()['opened'] == 0
+
+def test_old_connection_is_recycled(opened):
+    pool = make_pool(recycle=0.000001)
+    conn = pool.acquire()
+    pool.release(conn)
+    replacement = pool.acquire()
+    assert replacement is not conn
+    assert conn.closed
+    assert pool.stats()['reconnects'] == 1
+
+def test_failed_ping_reconnects(opened):
+    pool = make_pool(ping_interval=0)
+    conn = pool.acquire()
+    conn.ping_error = mysql.connector.Error("gone away")
+    pool.release(conn)
+    replacement = pool.acquire()
+    assert replacement is not conn
+    assert conn.closed
+
+def test_failed_connect_frees_the_slot(monkeypatch):
+    def connect(**kwargs):
+        raise mysql.connector.Error("refused")
+    monkeypatch.setattr(db.mysql.connector, 'connect', connect)
+    pool = make_pool(pool_size=1, max_overflow=0)
+    with pytest.raises(DatabaseConnectionError, match="Failed to connect"):
+        pool.acquire()
+    assert pool.stats()['opened'] == 0
+    assert pool.stats()['in_use'] == 0
@@ -0,0 +1,48 @@
+import csv
+import gzip
+import io
+import json
+from datetime import date
+
+from utils.export import csv_chunks, gzip_chunks, json_array_chunks, ndjson_chunks, row_encoder
+
+COLUMNS = ('catalog_id', 'catalog_name', 'catalog_description', 'start_date', 'end_date', 'status')
+ROWS = [
+    (1, 'Summer sale', 'Quotes " and \\ slashes', date(2030, 6, 1), date(2030, 7, 1), 'active'),
+    (2, 'Café picks', 'Unicode ✓', date(2030, 1, 2), date(2030, 1, 3), 'upcoming'),
+    (3, 'Nulls', None, None, date(2030, 1, 3), 'expired')
+]
+
+def expected(row: tuple) -> dict:
+    return {column: value.isoformat() if isinstance(value, date) else value for column, value in zip(COLUMNS, row)}
+
+def test_row_encoder_matches_json_dumps():
+    encode = row_encoder(COLUMNS)
+    for row in ROWS:
+        assert json.loads(encode(row)) == expected(row)
+
+def test_row_encoder_is_cached_per_column_set():
+    assert row_encoder(list(COLUMNS)) is row_encoder(COLUMNS)
+    assert json.loads(row_encoder(('catalog_id',))((7,))) == {'catalog_id': 7}
+
+def test_json_array_chunks():
+    text = ''.join(json_array_chunks(COLUMNS, ROWS, chunk_size=2))
+    assert json.loads(text) == [expected(row) for row in ROWS]
+    assert len(list(json_array_chunks(COLUMNS, ROWS, chunk_size=2))) == 3
+
+def test_json_array_chunks_of_nothing():
+    assert ''.join(json_array_chunks(COLUMNS, [])) == '[]'
+
+def test_ndjson_chunks():
+    text = ''.join(ndjson_chunks(COLUMNS, [ROWS[:2], ROWS[2:]]))
+    assert [json.loads(line) for line in text.splitlines()] == [expected(row) for row in ROWS]
+
+def test_csv_chunks_start_with_header():
+    text = ''.join(csv_chunks(COLUMNS, [ROWS[:1]]))
+    rows = list(csv.reader(io.StringIO(text)))
+    assert rows[0] == list(COLUMNS)
+    assert rows[1] == ['1', 'Summer sale', 'Quotes " and \\ slashes', '2030-06-01', '2030-07-01', 'active']
+
+def test_gzip_chunks_round_trip():
+    data = b''.join(gzip_chunks(['hello ', 'world']))
+    assert gzip.decompress(data) == b'hello world'
@@ -0,0 +1,50 @@
+import base64
+import json
+from datetime import date
+
+import pytest
+
+from exception.catalog_exception import ValidationError
+from utils.pagination import decode_cursor, encode_cursor
+
+def raw_cursor(*payload) -> str:
+    return base64.urlsafe_b64encode(json.dumps(list(payload)).encode('utf-8')).decode('ascii').rstrip('=')
+
+@pytest.mark.parametrize('sort, keyset', [
+    ('catalog_id', (42, 42)),
+    ('catalog_name', ('Summer sale', 7)),
+    ('start_date', (date(2030, 1, 31), 9)),
+    ('end_date', (date(2030, 12, 1), 3))
+])
+def test_round_trip(sort, keyset):
+    assert decode_cursor(encode_cursor(sort, 'asc', keyset), sort, 'asc') == keyset
+
+def test_empty_cursor_means_first_page():
+    assert decode_cursor('', 'catalog_id', 'asc') is None
+
+def test_cursor_for_another_ordering_is_rejected():
+    cursor = encode_cursor('catalog_name', 'asc', ('a', 1))
+    with pytest.raises(ValidationError, match="does not match"):
+        decode_cursor(cursor, 'catalog_name', 'desc')
+    with pytest.raises(ValidationError, match="does not match"):
+        decode_cursor(cursor, 'status', 'asc')
+
+@pytest.mark.parametrize('cursor', ['not base64!', raw_cursor('catalog_id', 'asc', 1), 'e30'])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(ValidationError):
+        decode_cursor(cursor, 'catalog_id', 'asc')
+
+@pytest.mark.parametrize('sort, value, catalog_id', [
+    ('catalog_id', '1', 1),
+    ('catalog_id', 1.5, 1),
+    ('catalog_name', ['a'], 1),
+    ('catalog_name', {'a': 1}, 1),
+    ('catalog_name', 5, 1),
+    ('start_date', '2030-13-01', 1),
+    ('start_date', 20300101, 1),
+    ('catalog_name', 'a', '1'),
+    ('catalog_name', 'a', True)
+])
+def test_wrongly_typed_values_are_rejected(sort, value, catalog_id):
+    with pytest.raises(ValidationError):
+        decode_cursor(raw_cursor(sort, 'asc', value, catalog_id), sort, 'asc')
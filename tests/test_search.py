@@ -0,0 +1,36 @@
+from utils.search import build_relevance_expression, build_search_condition, parse_stopwords, tokenize
+
+LIKE = "(catalog_name LIKE %s OR catalog_description LIKE %s)"
+MATCH = "MATCH(catalog_name, catalog_description) AGAINST (%s IN BOOLEAN MODE)"
+
+def test_tokenize_lowercases_and_deduplicates():
+    assert tokenize("Summer SALE, summer!") == ['summer', 'sale']
+
+def test_empty_search_has_no_condition():
+    assert build_search_condition('') == (None, ())
+
+def test_punctuation_only_search_uses_substring_match():
+    assert build_search_condition('!!') == (LIKE, ('%!!%', '%!!%'))
+
+def test_words_are_required_prefix_matches():
+    assert build_search_condition('summer sale') == (MATCH, ('+summer* +sale*',))
+
+def test_short_words_and_stopwords_use_like():
+    condition, params = build_search_condition('the summer go')
+    assert condition == " AND ".join([MATCH, LIKE, LIKE])
+    assert params == ('+summer*', '%the%', '%the%', '%go%', '%go%')
+
+def test_custom_stopwords():
+    assert build_search_condition('the sale', stopwords=frozenset()) == (MATCH, ('+the* +sale*',))
+    assert parse_stopwords(' Sale , winter,') == frozenset({'sale', 'winter'})
+    assert 'with' in parse_stopwords('default')
+
+def test_like_mode_escapes_wildcards():
+    condition, params = build_search_condition('off_50', mode='like')
+    assert condition == LIKE
+    assert params == ('%off\\_50%',) * 2
+
+def test_relevance_scores_only_indexed_words():
+    assert build_relevance_expression('summer the') == (MATCH, ('summer*',))
+    assert build_relevance_expression('the to') == ("0", ())
+    assert build_relevance_expression('summer', mode='like') == ("0", ())
@@ -0,0 +1,60 @@
+from datetime import date, timedelta
+
+import pytest
+
+from dto.catalog import Catalog
+from exception.catalog_exception import ValidationError
+from utils.validation import CatalogValidator, catalog_validator, validate_filter_date
+
+TODAY = date(2030, 6, 15)
+
+def payload(**overrides) -> dict:
+    data = {'name': 'Summer sale', 'description': 'Seasonal picks', 'start_date': '2030-06-15',
+            'end_date': '2030-07-01', 'status': ' Active '}
+    data.update(overrides)
+    return data
+
+def test_valid_payload_builds_catalog_with_dates():
+    catalog = catalog_validator.validate(payload(), TODAY)
+    assert isinstance(catalog, Catalog)
+    assert catalog.as_row()[1:6] == ('Summer sale', 'Seasonal picks', date(2030, 6, 15), date(2030, 7, 1), 'active')
+
+def test_single_digit_month_and_day_are_accepted():
+    catalog = catalog_validator.validate(payload(start_date='2030-6-15', end_date='2030-7-1'), TODAY)
+    assert catalog.end_date == date(2030, 7, 1)
+
+@pytest.mark.parametrize('overrides, message', [
+    ({'name': ''}, "Name cannot be empty."),
+    ({'name': 'x' * 31}, "Name cannot exceed 30 characters."),
+    ({'description': 'semi;colon'}, "Description must contain only"),
+    ({'start_date': '15/06/2030'}, "Invalid Start Date format"),
+    ({'start_date': '2030-02-30'}, "Invalid Start Date format"),
+    ({'start_date': '2030-06-14'}, "Start Date cannot be in the past."),
+    ({'end_date': '2030-06-01'}, "End Date cannot be in the past."),
+    ({'start_date': '2030-08-01'}, "End Date cannot be before Start Date."),
+    ({'status': 'archived'}, "Status must be one of"),
+    ({'name': 42}, "Catalog fields must be strings.")
+])
+def test_invalid_payloads(overrides, message):
+    with pytest.raises(ValidationError, match=message):
+        catalog_validator.validate(payload(**overrides), TODAY)
+
+def test_first_bad_field_in_schema_order_is_reported():
+    with pytest.raises(ValidationError, match="Name"):
+        catalog_validator.validate(payload(name='', status='bogus'), TODAY)
+
+def test_non_object_payload_is_rejected():
+    with pytest.raises(ValidationError, match="JSON object"):
+        catalog_validator.validate(['not', 'a', 'dict'], TODAY)
+
+def test_batch_returns_one_result_per_item():
+    tomorrow = (date.today() + timedelta(days=1)).isoformat()
+    results = CatalogValidator().validate_batch([payload(start_date=tomorrow, end_date=tomorrow), payload(name=''), None])
+    assert isinstance(results[0], Catalog)
+    assert isinstance(results[1], ValidationError)
+    assert isinstance(results[2], ValidationError)
+
+def test_filter_dates_may_be_in_the_past():
+    assert validate_filter_date(' 2000-01-02 ', "starts_after") == date(2000, 1, 2)
+    with pytest.raises(ValidationError, match="starts_after"):
+        validate_filter_date('yesterday', "starts_after")
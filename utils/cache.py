@@ -0,0 +1,304 @@
+import hashlib
+import pickle
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from configparser import ConfigParser
+from datetime import datetime, timezone
+
+def compute_etag(value) -> str:
+    """Returns a strong validator for a cached value, derived from its contents."""
+    return hashlib.blake2b(repr(value).encode('utf-8'), digest_size=16).hexdigest()
+
+class CacheEntry:
+    """
+    A cached value with the HTTP validators computed once when it was loaded,
+    so conditional requests can be answered without re-hashing the payload.
+    """
+    __slots__ = ('value', 'etag', 'last_modified')
+
+    def __init__(self, value, etag: str = None, last_modified: datetime = None):
+        self.value = value
+        self.etag = etag or compute_etag(value)
+        # HTTP dates have one-second resolution
+        self.last_modified = last_modified or datetime.now(timezone.utc).replace(microsecond=0)
+
+class BaseCache(ABC):
+    """
+    Common read-through logic for cache backends.
+    List results are keyed by a list generation that every write bumps, so one increment
+    invalidates all cached pages, searches and counts at once. Other keys count their deletions,
+    so a value loaded before a concurrent write deleted its key is never stored afterwards.
+    """
+    stores = True # False for backends that never keep anything
+    per_process = False # True when other processes' writes can't invalidate it directly
+    @abstractmethod
+    def get(self, key: str) -> CacheEntry:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry, invalidations: int = None, ttl: float = None) -> None:
+        """
+        Stores entry; with invalidations, only if invalidation_count(key) still returns that value.
+        ttl shortens the backend's ttl for this entry.
+        """
+        pass
+
+    @abstractmethod
+    def invalidation_count(self, key: str) -> int:
+        """Returns a number that changes whenever key is deleted."""
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def list_generation(self) -> int:
+        pass
+
+    @abstractmethod
+    def bump_list_generation(self) -> None:
+        pass
+
+    @abstractmethod
+    def stats(self) -> dict:
+        pass
+
+    def get_or_load(self, key: str, loader, refresh: bool = False, ttl: float = None) -> CacheEntry:
+        """
+        Returns the cached entry for key, calling loader() and caching its result on a miss.
+        refresh skips the cached entry and replaces it with a freshly loaded one; ttl caps how long
+        a loaded entry is kept.
+        """
+        entry = None if refresh else self.get(key)
+        if entry is None:
+            # Taken before loading: if a write deletes key meanwhile, the value may predate it
+            invalidations = self.invalidation_count(key)
+            entry = CacheEntry(loader())
+            if ttl is None or ttl > 0:
+                self.set(key, entry, invalidations, ttl)
+        return entry
+
+    def list_key(self, *parts) -> str:
+        """Builds a key for a list-style result that is invalidated by any write."""
+        return f"list:{self.list_generation()}:{parts!r}"
+
+class NullCache(BaseCache):
+    """Cache that never stores anything; entries are still built so ETags keep working."""
+    stores = False
+
+    def __init__(self):
+        self._misses = 0
+
+    def get(self, key: str) -> CacheEntry:
+        self._misses += 1
+        return None
+
+    def set(self, key: str, entry: CacheEntry, invalidations: int = None, ttl: float = None) -> None:
+        pass
+
+    def invalidation_count(self, key: str) -> int:
+        return 0
+
+    def delete(self, key: str) -> None:
+        pass
+
+    def list_generation(self) -> int:
+        return 0
+
+    def bump_list_generation(self) -> None:
+        pass
+
+    def stats(self) -> dict:
+        return {'backend': 'none', 'hits': 0, 'misses': self._misses, 'evictions': 0, 'entries': 0}
+
+class LocalCache(BaseCache):
+    """
+    Bounded in-process LRU cache with a per-entry TTL.
+    Each worker process has its own copy; use RedisCache to keep workers coherent.
+    One invalidation counter covers every key, which keeps it bounded; a load that overlaps
+    any write is returned uncached.
+    """
+    per_process = True
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 60.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (expires_at, entry), least recently used first
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    def get(self, key: str) -> CacheEntry:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                self._misses += 1
+                return None
+            expires_at, entry = item
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry
+
+    def set(self, key: str, entry: CacheEntry, invalidations: int = None, ttl: float = None) -> None:
+        with self._lock:
+            if invalidations is not None and invalidations != self._invalidations:
+                return
+            self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else min(self.ttl, ttl)), entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidation_count(self, key: str) -> int:
+        return self._invalidations
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._invalidations += 1
+
+    def list_generation(self) -> int:
+        return self._generation
+
+    def bump_list_generation(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self._invalidations += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'backend': 'local',
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'expirations': self._expirations,
+                'invalidations': self._invalidations,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries
+            }
+
+class RedisCache(BaseCache):
+    """
+    Cache shared by all worker processes through Redis. Eviction is left to the server's
+    maxmemory policy. Redis errors are counted and treated as misses so a cache outage
+    degrades to direct database reads; entries written meanwhile still expire after ttl.
+    """
+    def __init__(self, url: str, ttl: float = 60.0, key_prefix: str = 'catalog'):
+        try:
+            import redis
+        except ImportError:
+            raise ImportError("The redis cache backend requires the 'redis' package (pip install redis).")
+        self._redis_error = redis.RedisError
+        self._watch_error = redis.WatchError
+        self._client = redis.Redis.from_url(url)
+        self.ttl = ttl
+        self.key_prefix = key_prefix
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._errors = 0
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def get(self, key: str) -> CacheEntry:
+        try:
+            raw = self._client.get(f"{self.key_prefix}:{key}")
+        except self._redis_error:
+            self._count('_errors')
+            raw = None
+        if raw is None:
+            self._count('_misses')
+            return None
+        self._count('_hits')
+        return pickle.loads(raw)
+
+    def set(self, key: str, entry: CacheEntry, invalidations: int = None, ttl: float = None) -> None:
+        data = pickle.dumps(entry)
+        expire_ms = int((self.ttl if ttl is None else min(self.ttl, ttl)) * 1000)
+        try:
+            if invalidations is None:
+                self._client.set(f"{self.key_prefix}:{key}", data, px=expire_ms)
+                return
+            # WATCH makes the write fail if a delete bumps the counter between the check and the SET
+            with self._client.pipeline() as pipe:
+                counter = f"{self.key_prefix}:invalidations:{key}"
+                pipe.watch(counter)
+                if int(pipe.get(counter) or 0) != invalidations:
+                    return
+                pipe.multi()
+                pipe.set(f"{self.key_prefix}:{key}", data, px=expire_ms)
+                pipe.execute()
+        except self._watch_error:
+            pass
+        except self._redis_error:
+            self._count('_errors')
+
+    def invalidation_count(self, key: str) -> int:
+        try:
+            return int(self._client.get(f"{self.key_prefix}:invalidations:{key}") or 0)
+        except self._redis_error:
+            self._count('_errors')
+            return -1 # Never matches the counter, so nothing loaded during an outage is stored
+
+    def delete(self, key: str) -> None:
+        counter = f"{self.key_prefix}:invalidations:{key}"
+        try:
+            # The counter only has to outlive loads in flight; expiring it just skips a store
+            with self._client.pipeline() as pipe:
+                pipe.delete(f"{self.key_prefix}:{key}")
+                pipe.incr(counter)
+                pipe.pexpire(counter, int(self.ttl * 1000))
+                pipe.execute()
+        except self._redis_error:
+            self._count('_errors')
+
+    def list_generation(self) -> int:
+        try:
+            return int(self._client.get(f"{self.key_prefix}:list_generation") or 0)
+        except self._redis_error:
+            self._count('_errors')
+            return -1 # Never matches a stored generation, so lists bypass the cache during an outage
+
+    def bump_list_generation(self) -> None:
+        try:
+            self._client.incr(f"{self.key_prefix}:list_generation")
+        except self._redis_error:
+            self._count('_errors')
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'backend': 'redis', 'hits': self._hits, 'misses': self._misses, 'errors': self._errors}
+
+def create_cache(config: ConfigParser) -> BaseCache:
+    """Builds the cache backend described by the [cache] section of config.ini."""
+    if not config.getboolean('cache', 'enabled', fallback=False):
+        return NullCache()
+    backend = config.get('cache', 'backend', fallback='local')
+    ttl = config.getfloat('cache', 'ttl', fallback=60.0)
+    if backend == 'redis':
+        return RedisCache(config.get('cache', 'redis_url', fallback='redis://localhost:6379/0'), ttl,
+                          config.get('cache', 'key_prefix', fallback='catalog'))
+    if backend == 'local':
+        return LocalCache(config.getint('cache', 'max_entries', fallback=1024), ttl)
+    raise ValueError(f"Unknown cache backend '{backend}' in config.ini; expected 'local' or 'redis'.")
@@ -0,0 +1,51 @@
+import threading
+
+class ChangeNotifier:
+    """
+    Wakes change-feed listeners in this process as soon as a catalog write commits.
+    Writes made by other worker processes are only seen when listeners poll.
+    """
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def notify(self) -> None:
+        with self._cond:
+            self._version += 1
+            self._cond.notify_all()
+
+    def wait(self, seen_version: int, timeout: float) -> int:
+        """Blocks until a write commits after seen_version or timeout elapses; returns the current version."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._version != seen_version, timeout)
+            return self._version
+
+class StreamSlots:
+    """
+    Counts the change streams open in this process so they can be capped below the server's request
+    threads, and tells them to end when the worker shuts down.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._open = 0
+        self.closing = threading.Event()
+
+    @property
+    def open(self) -> int:
+        return self._open
+
+    def acquire(self, limit: int) -> bool:
+        """Takes a slot if fewer than limit streams are open and the process is not shutting down."""
+        with self._lock:
+            if self._open >= limit or self.closing.is_set():
+                return False
+            self._open += 1
+            return True
+
+    def release(self) -> None:
+        with self._lock:
+            self._open -= 1
@@ -1,27 +1,265 @@
 import mysql.connector
 from configparser import ConfigParser
 from exception.catalog_exception import DatabaseConnectionError
+from collections import deque
+import threading
+import time
 import os
 
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config', 'config.ini')
+
+_config = None
+_config_lock = threading.Lock()
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def load_config() -> ConfigParser:
+    """
+    Reads config.ini once per process and returns the cached parser.
+    Raises FileNotFoundError if the configuration file is missing.
+    """
+    global _config
+    if _config is None:
+        with _config_lock:
+            if _config is None:
+                if not os.path.exists(CONFIG_PATH):
+                    raise FileNotFoundError(f"Configuration file not found at: {CONFIG_PATH}")
+                config = ConfigParser()
+                config.read(CONFIG_PATH)
+                _config = config
+    return _config
+
+def _connect_args(config: ConfigParser, section: str = 'mysql') -> dict:
+    """
+    Builds mysql.connector.connect() keyword arguments from a server section, [mysql] by default.
+    Keys missing from another section (e.g. a replica's) are taken from [mysql].
+    """
+    args = {key: config.get(section, key, fallback=config.get('mysql', key))
+            for key in ('host', 'user', 'password', 'database')}
+    port = config.get(section, 'port', fallback=config.get('mysql', 'port', fallback=None))
+    if port:
+        args['port'] = int(port)
+    return args
+
 def get_connection() -> mysql.connector.connection.MySQLConnection:
     """
-    Establishes and returns a connection to the MySQL database.
+    Establishes and returns a new, unpooled connection to the MySQL database.
+    Prefer get_pool().acquire() for request handling; the caller owns and must close this connection.
     Raises FileNotFoundError or DatabaseConnectionError on failure.
     """
-    config = ConfigParser()
-    config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config', 'config.ini')
+    config = load_config()
+    try:
+        return mysql.connector.connect(**_connect_args(config))
+    except mysql.connector.Error as e:
+        raise DatabaseConnectionError(f"Failed to connect to the database: {e}")
+
+class ConnectionPool:
+    """
+    Thread-safe pool of MySQL connections for a single process.
+    Keeps up to pool_size idle connections, allows max_overflow extra connections under burst,
+    and makes callers wait up to timeout seconds for a connection before failing.
+    Connections autocommit, so a single query leaves no transaction open for release() to roll back;
+    multi-statement work must call start_transaction().
+    """
+    def __init__(self, connect_args: dict, pool_size: int = 5, max_overflow: int = 10, timeout: float = 30.0,
+                 recycle: float = 3600.0, ping_interval: float = 30.0):
+        self._connect_args = connect_args
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.timeout = timeout
+        self.recycle = recycle
+        self.ping_interval = ping_interval
+        self.pid = os.getpid()
 
-    if not os.path.exists(config_path):
-        raise FileNotFoundError(f"Configuration file not found at: {config_path}")
+        self._cond = threading.Condition()
+        self._idle = deque()  # (connection, created_at, last_used_at), most recently returned on the right
+        self._created_at = {}  # id(connection) -> created_at for connections currently checked out
+        self._opened = 0
+        self._in_use = 0
 
-    config.read(config_path)
+        self._checkouts = 0
+        self._timeouts = 0
+        self._reconnects = 0
+        self._connections_opened = 0
+        self._wait_time_total = 0.0
+        self._wait_time_max = 0.0
 
-    try:
-        return mysql.connector.connect(
-            host=config.get('mysql', 'host'),
-            user=config.get('mysql', 'user'),
-            password=config.get('mysql', 'password'),
-            database=config.get('mysql', 'database')
-        )
-    except mysql.connector.Error as e:
-        raise DatabaseConnectionError(f"Failed to connect to the database: {e}")
\ No newline at end of file
+    @property
+    def in_use(self) -> int:
+        """Connections currently checked out."""
+        return self._in_use
+
+    def _open(self) -> mysql.connector.connection.MySQLConnection:
+        try:
+            conn = mysql.connector.connect(autocommit=True, **self._connect_args)
+        except mysql.connector.Error as e:
+            raise DatabaseConnectionError(f"Failed to connect to the database: {e}")
+        with self._cond:
+            self._connections_opened += 1
+        return conn
+
+    @staticmethod
+    def _close_quietly(conn) -> None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _revive(self, conn, created_at: float, last_used_at: float):
+        """Replaces connections past their recycle age and pings ones that have sat idle for a while."""
+        now = time.monotonic()
+        if self.recycle and now - created_at > self.recycle:
+            self._close_quietly(conn)
+            with self._cond:
+                self._reconnects += 1
+            return self._open(), time.monotonic()
+        if self.ping_interval is not None and now - last_used_at > self.ping_interval:
+            try:
+                conn.ping(reconnect=False)
+            except mysql.connector.Error:
+                self._close_quietly(conn)
+                with self._cond:
+                    self._reconnects += 1
+                return self._open(), time.monotonic()
+        return conn, created_at
+
+    def acquire(self) -> mysql.connector.connection.MySQLConnection:
+        """
+        Borrows a connection, opening a new one if the pool has room.
+        Raises DatabaseConnectionError if none becomes available within the checkout timeout.
+        """
+        started = time.monotonic()
+        deadline = started + self.timeout
+        entry = None
+        with self._cond:
+            while True:
+                if self._idle:
+                    entry = self._idle.pop()
+                    break
+                if self._opened < self.pool_size + self.max_overflow:
+                    self._opened += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise DatabaseConnectionError(
+                        f"Timed out after {self.timeout:.1f}s waiting for a database connection "
+                        f"({self._in_use} in use, pool size {self.pool_size}, overflow {self.max_overflow}).")
+                self._cond.wait(remaining)
+            self._in_use += 1
+            waited = time.monotonic() - started
+            self._checkouts += 1
+            self._wait_time_total += waited
+            self._wait_time_max = max(self._wait_time_max, waited)
+
+        try:
+            if entry is None:
+                conn, created_at = self._open(), time.monotonic()
+            else:
+                conn, created_at = self._revive(*entry)
+        except Exception:
+            with self._cond:
+                self._opened -= 1
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+
+        with self._cond:
+            self._created_at[id(conn)] = created_at
+        return conn
+
+    def release(self, conn, discard: bool = False) -> None:
+        """
+        Returns a borrowed connection to the pool.
+        Open transactions and unread results are cleared; broken or surplus connections are closed.
+        """
+        if not discard:
+            try:
+                if conn.unread_result:
+                    conn.consume_results()
+                if conn.in_transaction:
+                    conn.rollback()
+            except mysql.connector.Error:
+                discard = True
+
+        with self._cond:
+            created_at = self._created_at.pop(id(conn), time.monotonic())
+            self._in_use -= 1
+            keep = not discard and len(self._idle) < self.pool_size
+            if keep:
+                self._idle.append((conn, created_at, time.monotonic()))
+            else:
+                self._opened -= 1
+            self._cond.notify()
+
+        if not keep:
+            self._close_quietly(conn)
+
+    def close(self) -> None:
+        """Closes all idle connections. Checked-out connections are closed as they are released."""
+        with self._cond:
+            idle = list(self._idle)
+            self._idle.clear()
+            self._opened -= len(idle)
+            self.pool_size = 0
+        for conn, _, _ in idle:
+            self._close_quietly(conn)
+
+    def stats(self) -> dict:
+        """Returns a snapshot of pool usage counters."""
+        with self._cond:
+            return {
+                'pool_size': self.pool_size,
+                'max_overflow': self.max_overflow,
+                'in_use': self._in_use,
+                'idle': len(self._idle),
+                'opened': self._opened,
+                'checkouts': self._checkouts,
+                'timeouts': self._timeouts,
+                'reconnects': self._reconnects,
+                'connections_opened': self._connections_opened,
+                'wait_time_total': self._wait_time_total,
+                'wait_time_max': self._wait_time_max,
+                'wait_time_avg': self._wait_time_total / self._checkouts if self._checkouts else 0.0
+            }
+
+def create_pool(config: ConfigParser, section: str = 'mysql') -> ConnectionPool:
+    """Builds a connection pool for the server described by `section`, sized by the [pool] section."""
+    return ConnectionPool(
+        _connect_args(config, section),
+        pool_size=config.getint('pool', 'pool_size', fallback=5),
+        max_overflow=config.getint('pool', 'max_overflow', fallback=10),
+        timeout=config.getfloat('pool', 'timeout', fallback=30.0),
+        recycle=config.getfloat('pool', 'recycle', fallback=3600.0),
+        ping_interval=config.getfloat('pool', 'ping_interval', fallback=30.0)
+    )
+
+def get_pool() -> ConnectionPool:
+    """
+    Returns the process-wide connection pool for the primary server, creating it from config.ini on first use.
+    A forked worker never reuses its parent's sockets; it builds a fresh pool instead.
+    """
+    global _pool
+    pool = _pool
+    if pool is None or pool.pid != os.getpid():
+        with _pool_lock:
+            if _pool is None or _pool.pid != os.getpid():
+                _pool = create_pool(load_config())
+            pool = _pool
+    return pool
+
+# Pools inherited across a fork. Their sockets are shared with the parent, and letting them be
+# garbage-collected would run MySQLSocket.__del__, whose shutdown() kills the parent's connections.
+_orphaned = []
+
+def _reset_pool_after_fork() -> None:
+    # Keep the inherited pool referenced but unused; never close it or send COM_QUIT from the child.
+    global _pool, _pool_lock
+    if _pool is not None:
+        _orphaned.append(_pool)
+    _pool = None
+    _pool_lock = threading.Lock()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_pool_after_fork)
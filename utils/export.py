@@ -0,0 +1,76 @@
+import csv
+import io
+import json
+import zlib
+from datetime import date
+from json.encoder import encode_basestring_ascii
+
+def _encode_value(value) -> str:
+    # Plain ints and strs skip json.dumps's per-call encoder setup; anything else falls back to it
+    cls = value.__class__
+    if cls is int:
+        return int.__repr__(value)
+    if cls is str:
+        return encode_basestring_ascii(value)
+    return json.dumps(value)
+
+def _column_encoder(column: str):
+    """Picks the JSON encoder for one column once; date columns get an isoformat fast path."""
+    if column in ('start_date', 'end_date'):
+        return lambda value: f'"{value.isoformat()}"' if isinstance(value, date) else json.dumps(value)
+    return _encode_value
+
+_row_encoders = {} # columns tuple -> compiled encoder; column sets come from a few fixed projections
+
+def row_encoder(columns) -> callable:
+    """
+    Returns a function that encodes one row tuple, in `columns` order, as a JSON object string.
+    Object keys and per-column encoders are resolved once per column set, so no dict is built per row.
+    """
+    columns = tuple(columns)
+    encoder = _row_encoders.get(columns)
+    if encoder is None:
+        template = '{' + ','.join(json.dumps(column).replace('%', '%%') + ':%s' for column in columns) + '}'
+        encoders = [_column_encoder(column) for column in columns]
+
+        def encoder(row: tuple) -> str:
+            return template % tuple([encode(value) for encode, value in zip(encoders, row)])
+        encoder = _row_encoders.setdefault(columns, encoder)
+    return encoder
+
+def json_array_chunks(columns: list, rows: list, chunk_size: int = 1000):
+    """Formats row tuples as a JSON array of objects, yielding one string per chunk_size rows."""
+    encode = row_encoder(columns)
+    separator = '['
+    for start in range(0, len(rows), chunk_size):
+        yield separator + ','.join(map(encode, rows[start:start + chunk_size]))
+        separator = ','
+    yield ']' if separator == ',' else '[]'
+
+def ndjson_chunks(columns: list, row_chunks):
+    """Formats chunks of row tuples as newline-delimited JSON objects, one string per chunk."""
+    encode = row_encoder(columns)
+    for rows in row_chunks:
+        yield ''.join([encode(row) + '\n' for row in rows])
+
+def csv_chunks(columns: list, row_chunks):
+    """Formats chunks of row tuples as CSV text, one string per chunk, starting with a header row."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerow(columns)
+    yield buffer.getvalue()
+    for rows in row_chunks:
+        buffer.seek(0)
+        buffer.truncate()
+        # csv writes dates with str(), which is already YYYY-MM-DD
+        writer.writerows(rows)
+        yield buffer.getvalue()
+
+def gzip_chunks(text_chunks):
+    """Compresses a stream of text chunks into a gzip stream on the fly."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) # wbits=31 writes a gzip header and trailer
+    for text in text_chunks:
+        data = compressor.compress(text.encode('utf-8'))
+        if data:
+            yield data
+    yield compressor.flush()
@@ -0,0 +1,298 @@
+import cProfile
+import io
+import json
+import logging
+import os
+import pstats
+import random
+import re
+import sys
+import threading
+import time
+from bisect import bisect_left
+from glob import glob
+from configparser import ConfigParser
+from utils.db_get_connection import load_config
+
+try:
+    import resource
+except ImportError: # Not available on Windows
+    resource = None
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+slow_query_logger = logging.getLogger('catalog.slow_query')
+profile_logger = logging.getLogger('catalog.profile')
+
+_settings = None
+_settings_lock = threading.Lock()
+_whitespace = re.compile(r'\s+')
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus style. Not thread-safe on its own."""
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1) # Last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def add(self, counts: list, total: float, count: int) -> None:
+        """Adds another process's observations, recorded with the same buckets."""
+        self.counts = [a + b for a, b in zip(self.counts, counts)]
+        self.sum += total
+        self.count += count
+
+def _escape_label(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _format_labels(labels: tuple, extra: str = '') -> str:
+    parts = [f'{key}="{_escape_label(value)}"' for key, value in labels]
+    if extra:
+        parts.append(extra)
+    return '{' + ','.join(parts) + '}' if parts else ''
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+def _format_values(descriptions: dict, values: dict) -> list:
+    lines = []
+    for name, (metric_type, help_text, _) in descriptions.items():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        for labels, value in values.get(name, {}).items():
+            if metric_type != 'histogram':
+                lines.append(f"{name}{_format_labels(labels)} {value}")
+                continue
+            cumulative = 0
+            for bound, count in zip(value.buckets, value.counts):
+                cumulative += count
+                bucket_labels = _format_labels(labels, 'le="%s"' % bound)
+                lines.append(f"{name}_bucket{bucket_labels} {cumulative}")
+            bucket_labels = _format_labels(labels, 'le="+Inf"')
+            lines.append(f"{name}_bucket{bucket_labels} {value.count}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {value.sum}")
+            lines.append(f"{name}_count{_format_labels(labels)} {value.count}")
+    return lines
+
+def _format_gauges(gauges: list) -> list:
+    lines = []
+    described = set()
+    for name, help_text, labels, value in gauges:
+        if name not in described:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            described.add(name)
+        lines.append(f"{name}{_format_labels(tuple(labels.items()))} {value}")
+    return lines
+
+class MetricsRegistry:
+    """
+    Process-local counters and histograms rendered in the Prometheus text format.
+    Labels are passed as keyword arguments; every update takes one short lock.
+    Gauges are produced at scrape time by collector callables.
+    With share_across_processes(), each process also writes snapshots to a shared directory and
+    render() merges them, so a scrape answered by any worker reports every worker: counters and
+    histograms are summed (including workers that have exited), gauges of live workers get a pid label.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._descriptions = {} # name -> (type, help, buckets), in registration order
+        self._values = {} # name -> {labels tuple: float or Histogram}
+        self._collectors = []
+        self._shared_dir = None
+
+    def describe(self, name: str, metric_type: str, help_text: str, buckets: tuple = LATENCY_BUCKETS) -> None:
+        """Registers a counter or histogram so it is rendered with HELP and TYPE lines."""
+        self._descriptions[name] = (metric_type, help_text, buckets)
+        self._values.setdefault(name, {})
+
+    def add_collector(self, collector) -> None:
+        """Registers collector() -> [(name, help, labels dict, value)], called on every scrape for gauges."""
+        self._collectors.append(collector)
+
+    def inc(self, name: str, amount: float = 1, **labels) -> None:
+        key = tuple(labels.items())
+        with self._lock:
+            series = self._values[name]
+            series[key] = series.get(key, 0) + amount
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        key = tuple(labels.items())
+        with self._lock:
+            series = self._values[name]
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram(self._descriptions[name][2])
+            histogram.observe(value)
+
+    def _collect_gauges(self) -> list:
+        gauges = []
+        for collector in self._collectors:
+            gauges.extend(collector())
+        return gauges
+
+    def share_across_processes(self, directory: str) -> None:
+        """Makes render() report every process that writes snapshots to directory; call before forking."""
+        self._shared_dir = directory
+
+    def write_snapshot(self) -> None:
+        """Writes this process's counters, histograms and gauges to the shared directory, if there is one."""
+        if self._shared_dir is None:
+            return
+        gauges = self._collect_gauges()
+        with self._lock:
+            values = {name: [[labels, [value.counts, value.sum, value.count]
+                                      if isinstance(value, Histogram) else value]
+                             for labels, value in series.items()]
+                      for name, series in self._values.items()}
+        pid = os.getpid()
+        path = os.path.join(self._shared_dir, f"{pid}.json")
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'pid': pid, 'values': values, 'gauges': gauges}, f)
+        os.replace(temp_path, path) # Readers never see a half-written snapshot
+
+    def start_snapshots(self, interval: float) -> None:
+        """Starts a daemon thread that writes a snapshot every interval seconds, so idle workers stay current."""
+        if self._shared_dir is None:
+            return
+
+        def write_periodically():
+            while True:
+                time.sleep(interval)
+                try:
+                    self.write_snapshot()
+                except OSError:
+                    pass
+
+        threading.Thread(target=write_periodically, name='metrics-snapshots', daemon=True).start()
+
+    def _merge_snapshots(self) -> tuple:
+        self.write_snapshot()
+        values = {name: {} for name in self._descriptions}
+        gauges = []
+        for path in glob(os.path.join(self._shared_dir, '*.json')):
+            try:
+                with open(path, encoding='utf-8') as f:
+                    snapshot = json.load(f)
+            except (OSError, ValueError):
+                continue
+            for name, series in snapshot['values'].items():
+                merged = values.get(name)
+                if merged is None:
+                    continue
+                for labels, value in series:
+                    key = tuple(tuple(pair) for pair in labels)
+                    if isinstance(value, list):
+                        if key not in merged:
+                            merged[key] = Histogram(self._descriptions[name][2])
+                        merged[key].add(*value)
+                    else:
+                        merged[key] = merged.get(key, 0) + value
+            pid = snapshot['pid']
+            if pid == os.getpid() or _process_alive(pid):
+                gauges.extend((name, help_text, {'pid': pid, **labels}, value)
+                              for name, help_text, labels, value in snapshot['gauges'])
+        gauges.sort(key=lambda gauge: gauge[0]) # Keeps each gauge's series together
+        return values, gauges
+
+    def render(self) -> str:
+        """Renders every metric in the Prometheus text exposition format (version 0.0.4)."""
+        if self._shared_dir is not None:
+            values, gauges = self._merge_snapshots()
+            return '\n'.join(_format_values(self._descriptions, values) + _format_gauges(gauges)) + '\n'
+        with self._lock:
+            lines = _format_values(self._descriptions, self._values)
+        return '\n'.join(lines + _format_gauges(self._collect_gauges())) + '\n'
+
+metrics = MetricsRegistry()
+metrics.describe('catalog_http_request_duration_seconds', 'histogram', "Time to produce an HTTP response, by route.")
+metrics.describe('catalog_http_requests_total', 'counter', "HTTP responses, by route and status code.")
+metrics.describe('catalog_db_query_duration_seconds', 'histogram', "Database query time, by operation and phase.")
+metrics.describe('catalog_db_queries_total', 'counter', "Database queries executed, by operation.")
+metrics.describe('catalog_db_rows_total', 'counter', "Rows fetched or affected, by operation.")
+metrics.describe('catalog_db_slow_queries_total', 'counter', "Queries slower than the slow-query threshold.")
+metrics.describe('catalog_serialization_duration_seconds', 'histogram', "Time to serialize API payloads, by route.")
+
+def _collect_process_gauges() -> list:
+    if resource is None:
+        return []
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    max_rss_bytes = max_rss if sys.platform == 'darwin' else max_rss * 1024
+    return [('catalog_process_max_rss_bytes', "Peak resident memory of this process.", {'pid': os.getpid()}, max_rss_bytes)]
+
+metrics.add_collector(_collect_process_gauges)
+
+def _load_settings() -> dict:
+    """Reads the [metrics] section once; defaults apply when config.ini is unavailable."""
+    global _settings
+    if _settings is None:
+        with _settings_lock:
+            if _settings is None:
+                try:
+                    config = load_config()
+                except FileNotFoundError:
+                    config = ConfigParser()
+                _settings = {
+                    'slow_query_seconds': config.getfloat('metrics', 'slow_query_ms', fallback=500.0) / 1000,
+                    'profile_sample_rate': config.getfloat('metrics', 'profile_sample_rate', fallback=0.0)
+                }
+    return _settings
+
+def describe_params(params) -> str:
+    """Summarizes query parameters by type only, e.g. '(int, str, str)', so values never reach the logs."""
+    if not params:
+        return '()'
+    names = [type(p).__name__ for p in params]
+    if len(names) > 10:
+        return f"({', '.join(names[:10])}, ... {len(names)} total)"
+    return f"({', '.join(names)})"
+
+def record_query(query: str, params, phases: dict, rows: int, elapsed: float) -> None:
+    """Records one query's phase timings and row count, logging it if it exceeded the slow-query threshold."""
+    operation = query.split(None, 1)[0].upper()
+    for phase, seconds in phases.items():
+        metrics.observe('catalog_db_query_duration_seconds', seconds, operation=operation, phase=phase)
+    metrics.observe('catalog_db_query_duration_seconds', elapsed, operation=operation, phase='total')
+    metrics.inc('catalog_db_queries_total', operation=operation)
+    if rows:
+        metrics.inc('catalog_db_rows_total', rows, operation=operation)
+    if elapsed >= _load_settings()['slow_query_seconds']:
+        metrics.inc('catalog_db_slow_queries_total', operation=operation)
+        slow_query_logger.warning(
+            "Slow query (%.1f ms; %s; rows=%d): %s params=%s", elapsed * 1000,
+            ', '.join(f"{phase}={seconds * 1000:.1f}ms" for phase, seconds in phases.items()), rows,
+            _whitespace.sub(' ', query).strip()[:500], describe_params(params))
+
+def start_request_profile():
+    """Starts a cProfile run for a random profile_sample_rate fraction of requests; returns it or None."""
+    rate = _load_settings()['profile_sample_rate']
+    if not rate or random.random() >= rate:
+        return None
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        return None # Another profiler is already active in this process
+    return profiler
+
+def finish_request_profile(profiler, label: str, limit: int = 25) -> None:
+    """Stops a request profile and logs its top functions by cumulative time."""
+    profiler.disable()
+    output = io.StringIO()
+    pstats.Stats(profiler, stream=output).sort_stats('cumulative').print_stats(limit)
+    profile_logger.info("Profile for %s:\n%s", label, output.getvalue())
@@ -0,0 +1,84 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import mysql.connector
+from utils.db_get_connection import get_connection
+from exception.catalog_exception import DatabaseConnectionError
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'migrations')
+
+def _split_statements(sql: str) -> list:
+    """Splits a migration file into statements, dropping '--' comment lines."""
+    lines = [line for line in sql.splitlines() if not line.strip().startswith('--')]
+    return [statement.strip() for statement in '\n'.join(lines).split(';') if statement.strip()]
+
+def pending_migrations(applied: set) -> list:
+    """Lists (version, path) for migration files not yet applied, in filename order."""
+    migrations = []
+    for filename in sorted(os.listdir(MIGRATIONS_DIR)):
+        version, ext = os.path.splitext(filename)
+        if ext == '.sql' and version not in applied:
+            migrations.append((version, os.path.join(MIGRATIONS_DIR, filename)))
+    return migrations
+
+def unapplied_migrations() -> list:
+    """
+    Lists the versions in migrations/ that the database has not recorded in schema_migrations,
+    without changing anything. Raises DatabaseConnectionError if the database is unreachable.
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+    try:
+        try:
+            cursor.execute("SELECT version FROM schema_migrations")
+            applied = {row[0] for row in cursor.fetchall()}
+        except mysql.connector.ProgrammingError as e:
+            if e.errno != 1146: # ER_NO_SUCH_TABLE: no migration has ever been applied
+                raise
+            applied = set()
+        return [version for version, _ in pending_migrations(applied)]
+    except mysql.connector.Error as e:
+        raise DatabaseConnectionError(f"Could not read schema_migrations: {e}")
+    finally:
+        cursor.close()
+        conn.close()
+
+def apply_migrations() -> list:
+    """
+    Applies every pending SQL file in migrations/ and records it in schema_migrations.
+    Returns the versions applied. Raises DatabaseConnectionError on failure.
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+    applied_now = []
+    try:
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version VARCHAR(255) PRIMARY KEY,
+                applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        cursor.execute("SELECT version FROM schema_migrations")
+        applied = {row[0] for row in cursor.fetchall()}
+        for version, path in pending_migrations(applied):
+            with open(path, encoding='utf-8') as f:
+                statements = _split_statements(f.read())
+            # MySQL DDL commits implicitly; a file that fails part-way has to be finished by hand
+            for statement in statements:
+                cursor.execute(statement)
+            cursor.execute("INSERT INTO schema_migrations (version) VALUES (%s)", (version,))
+            conn.commit()
+            applied_now.append(version)
+        return applied_now
+    except mysql.connector.Error as e:
+        conn.rollback()
+        raise DatabaseConnectionError(f"Migration failed after applying {applied_now or 'nothing'}: {e}")
+    finally:
+        cursor.close()
+        conn.close()
+
+if __name__ == '__main__':
+    versions = apply_migrations()
+    print(f"Applied migrations: {', '.join(versions)}" if versions else "Database schema is up to date.")
@@ -0,0 +1,42 @@
+import base64
+import json
+from datetime import date
+from exception.catalog_exception import ValidationError
+
+DATE_SORTS = ('start_date', 'end_date')
+
+def encode_cursor(sort: str, order: str, keyset: tuple) -> str:
+    """
+    Encodes the (sort value, catalog_id) keyset of the last row on a page into an opaque cursor.
+    The sort column and order are embedded so a cursor cannot be replayed against a different ordering.
+    """
+    value, catalog_id = keyset
+    if isinstance(value, date):
+        value = value.isoformat()
+    payload = json.dumps([sort, order, value, catalog_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor: str, sort: str, order: str) -> tuple:
+    """
+    Decodes an opaque cursor back into a (sort value, catalog_id) keyset.
+    Date sort values come back as dates. Raises ValidationError if the cursor is malformed, holds a value
+    of the wrong type for the sort column, or was issued for another ordering.
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        cursor_sort, cursor_order, value, catalog_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, TypeError):
+        raise ValidationError("Invalid pagination cursor.")
+    if cursor_sort != sort or cursor_order != order or type(catalog_id) is not int:
+        raise ValidationError("Pagination cursor does not match the requested sort order.")
+    if sort in DATE_SORTS:
+        try:
+            value = date.fromisoformat(value)
+        except (TypeError, ValueError):
+            raise ValidationError("Invalid pagination cursor.")
+    elif type(value) is not (int if sort == 'catalog_id' else str):
+        # Anything else would reach the driver as a query parameter
+        raise ValidationError("Invalid pagination cursor.")
+    return value, catalog_id
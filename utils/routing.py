@@ -0,0 +1,197 @@
+import itertools
+import os
+import threading
+import time
+import mysql.connector
+from configparser import ConfigParser
+from contextvars import ContextVar
+from utils.db_get_connection import ConnectionPool, create_pool, get_pool, load_config
+from exception.catalog_exception import DatabaseConnectionError
+
+PRIMARY = 'primary'
+REPLICA_SECTION_PREFIX = 'replica.'
+ROUTING_STRATEGIES = ('round_robin', 'least_load')
+
+_router = None
+_router_lock = threading.Lock()
+
+# Set per request; a fresh thread or request starts unpinned
+_primary_pinned = ContextVar('primary_pinned', default=False)
+
+def pin_reads_to_primary(pinned: bool) -> None:
+    """Sends the current request's reads to the primary, e.g. because its client has just written."""
+    _primary_pinned.set(pinned)
+
+def reads_pinned_to_primary() -> bool:
+    """True while the current request's reads are pinned to the primary."""
+    return _primary_pinned.get()
+
+class ReplicaState:
+    """Connection pool and last health-check result of one read replica."""
+    __slots__ = ('name', 'pool', 'healthy', 'lag_seconds', 'error', 'checked_at')
+
+    def __init__(self, name: str, pool: ConnectionPool):
+        self.name = name
+        self.pool = pool
+        self.healthy = False # Takes no reads until its first health check passes
+        self.lag_seconds = None
+        self.error = None
+        self.checked_at = None
+
+class ReplicaRouter:
+    """
+    Chooses the server for each query: read-only queries go to a healthy read replica, everything
+    else to the primary. Replicas are picked round-robin or by fewest checked-out connections
+    (least_load). A background thread checks every replica each check_interval seconds; one that
+    cannot be reached, has stopped replicating or lags more than max_lag seconds takes no reads
+    until a later check passes. With no healthy replica, reads fall back to the primary.
+    """
+    def __init__(self, primary: ConnectionPool, replicas: dict, strategy: str = 'round_robin',
+                 max_lag: float = 10.0, check_interval: float = 5.0, require_replication: bool = True):
+        if strategy not in ROUTING_STRATEGIES:
+            raise ValueError(f"Unknown routing strategy '{strategy}'; expected one of: {', '.join(ROUTING_STRATEGIES)}.")
+        self.primary = primary
+        self.replicas = {name: ReplicaState(name, pool) for name, pool in replicas.items()}
+        self.strategy = strategy
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.require_replication = require_replication
+        self.pid = os.getpid()
+
+        self._lock = threading.Lock()
+        self._rotation = itertools.count()
+        self._queries = dict.fromkeys([PRIMARY, *self.replicas], 0)
+        self._stopped = threading.Event()
+        if self.replicas:
+            threading.Thread(target=self._check_periodically, name='replica-health', daemon=True).start()
+
+    def read_pool(self) -> tuple[str, ConnectionPool]:
+        """Returns (node name, pool) for a read that may be served by a replica."""
+        if _primary_pinned.get():
+            return PRIMARY, self.primary
+        healthy = [replica for replica in self.replicas.values() if replica.healthy]
+        if not healthy:
+            return PRIMARY, self.primary
+        if self.strategy == 'least_load':
+            replica = min(healthy, key=lambda r: r.pool.in_use)
+        else:
+            replica = healthy[next(self._rotation) % len(healthy)]
+        return replica.name, replica.pool
+
+    def count_query(self, node: str) -> None:
+        with self._lock:
+            self._queries[node] += 1
+
+    def mark_unhealthy(self, name: str, error: Exception) -> None:
+        """Takes a replica out of rotation after a failed checkout, until its next health check passes."""
+        replica = self.replicas[name]
+        replica.healthy = False
+        replica.error = str(error)
+
+    def check_replicas(self) -> None:
+        """Runs one health and lag check against every replica."""
+        for replica in self.replicas.values():
+            replica.healthy, replica.lag_seconds, replica.error = self._check(replica)
+            replica.checked_at = time.time()
+
+    def _check(self, replica: ReplicaState) -> tuple[bool, float, str]:
+        try:
+            conn = replica.pool.acquire()
+        except DatabaseConnectionError as e:
+            return False, None, str(e)
+        discard = False
+        try:
+            cursor = conn.cursor(dictionary=True)
+            try:
+                status = self._replication_status(cursor)
+            finally:
+                cursor.close()
+        except mysql.connector.Error as e:
+            discard = True
+            return False, None, str(e)
+        finally:
+            replica.pool.release(conn, discard=discard)
+
+        if status is None:
+            if self.require_replication:
+                return False, None, "Server is not replicating from a source."
+            return True, 0, None
+        lag = status.get('Seconds_Behind_Source', status.get('Seconds_Behind_Master'))
+        if lag is None:
+            return False, None, "Replication is stopped."
+        if lag > self.max_lag:
+            return False, lag, f"Replica is {lag}s behind, over the {self.max_lag:g}s limit."
+        return True, lag, None
+
+    @staticmethod
+    def _replication_status(cursor) -> dict:
+        try:
+            cursor.execute("SHOW REPLICA STATUS")
+        except mysql.connector.ProgrammingError:
+            cursor.execute("SHOW SLAVE STATUS") # MySQL before 8.0.22
+        return cursor.fetchone()
+
+    def _check_periodically(self) -> None:
+        while True:
+            self.check_replicas()
+            if self._stopped.wait(self.check_interval):
+                return
+
+    def close(self) -> None:
+        """Stops health checks and closes the replicas' idle connections."""
+        self._stopped.set()
+        for replica in self.replicas.values():
+            replica.pool.close()
+
+    def stats(self) -> dict:
+        """Returns role, health, replication lag, queries served and connections in use for every node."""
+        with self._lock:
+            queries = dict(self._queries)
+        nodes = {PRIMARY: {'role': 'primary', 'healthy': True, 'lag_seconds': 0, 'queries': queries[PRIMARY],
+                           'in_use': self.primary.in_use, 'error': None}}
+        for name, replica in self.replicas.items():
+            nodes[name] = {'role': 'replica', 'healthy': replica.healthy, 'lag_seconds': replica.lag_seconds,
+                           'queries': queries[name], 'in_use': replica.pool.in_use, 'error': replica.error}
+        return nodes
+
+def create_router(config: ConfigParser) -> ReplicaRouter:
+    """
+    Builds a router from config.ini: the primary is [mysql] and every [replica.<name>] section is a
+    read replica. Routing options come from the [routing] section.
+    """
+    replicas = {section[len(REPLICA_SECTION_PREFIX):]: create_pool(config, section)
+                for section in config.sections() if section.startswith(REPLICA_SECTION_PREFIX)}
+    return ReplicaRouter(
+        get_pool(), replicas,
+        strategy=config.get('routing', 'strategy', fallback='round_robin'),
+        max_lag=config.getfloat('routing', 'max_lag_seconds', fallback=10.0),
+        check_interval=config.getfloat('routing', 'health_check_seconds', fallback=5.0),
+        require_replication=config.getboolean('routing', 'require_replication', fallback=True)
+    )
+
+def get_router() -> ReplicaRouter:
+    """Returns the process-wide router, creating it from config.ini on first use; forked workers build their own."""
+    global _router
+    router = _router
+    if router is None or router.pid != os.getpid():
+        with _router_lock:
+            if _router is None or _router.pid != os.getpid():
+                _router = create_router(load_config())
+            router = _router
+    return router
+
+# Routers inherited across a fork. Their replica pools share sockets with the parent, which
+# MySQLSocket.__del__ would shut down if the router were garbage-collected in the child.
+_orphaned = []
+
+def _reset_router_after_fork() -> None:
+    # The health-check thread does not survive a fork; the child starts its own router and keeps the
+    # inherited one referenced but unused
+    global _router, _router_lock
+    if _router is not None:
+        _orphaned.append(_router)
+    _router = None
+    _router_lock = threading.Lock()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_router_after_fork)
@@ -0,0 +1,76 @@
+import re
+from functools import lru_cache
+
+TOKEN_PATTERN = re.compile(r'\w+')
+FULLTEXT_COLUMNS = "catalog_name, catalog_description"
+# INFORMATION_SCHEMA.INNODB_FT_DEFAULT_STOPWORD, which InnoDB leaves out of FULLTEXT indexes by default
+INNODB_DEFAULT_STOPWORDS = frozenset((
+    'a', 'about', 'an', 'are', 'as', 'at', 'be', 'by', 'com', 'de', 'en', 'for', 'from', 'how', 'i', 'in',
+    'is', 'it', 'la', 'of', 'on', 'or', 'that', 'the', 'this', 'to', 'was', 'what', 'when', 'where', 'who',
+    'will', 'with', 'und', 'www'
+))
+
+def tokenize(search_term: str) -> list:
+    """Splits a search term into unique lowercase word tokens, preserving their order."""
+    terms = []
+    for token in TOKEN_PATTERN.findall(search_term.lower()):
+        if token not in terms:
+            terms.append(token)
+    return terms
+
+def _like_pattern(term: str) -> str:
+    escaped = term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f"%{escaped}%"
+
+@lru_cache(maxsize=8)
+def parse_stopwords(value: str) -> frozenset:
+    """Parses the [search] stopwords setting: 'default' for InnoDB's list, or comma-separated words."""
+    if value.strip().lower() == 'default':
+        return INNODB_DEFAULT_STOPWORDS
+    return frozenset(word.strip().lower() for word in value.split(',') if word.strip())
+
+def _indexed_terms(terms: list, mode: str, min_token_size: int, stopwords: frozenset) -> list:
+    # InnoDB indexes neither words shorter than innodb_ft_min_token_size nor stopwords, and a required
+    # (+) term it cannot find matches nothing, so those words must use LIKE
+    if mode != 'fulltext':
+        return []
+    return [term for term in terms if len(term) >= min_token_size and term not in stopwords]
+
+def build_search_condition(search_term: str, mode: str = 'fulltext', min_token_size: int = 3,
+                           stopwords: frozenset = INNODB_DEFAULT_STOPWORDS) -> tuple[str, tuple]:
+    """
+    Compiles a search term into a WHERE fragment over catalog name and description.
+    Every word must match. In 'fulltext' mode words are prefix-matched through the FULLTEXT index
+    (MATCH ... AGAINST in boolean mode); words too short for the index, stopwords, and everything in
+    'like' mode use substring LIKE instead. Returns (None, ()) for an empty search term.
+    """
+    terms = tokenize(search_term)
+    if not terms:
+        if not search_term:
+            return None, ()
+        # Punctuation-only input has no words; keep the old substring behavior for it
+        return "(catalog_name LIKE %s OR catalog_description LIKE %s)", (_like_pattern(search_term),) * 2
+
+    indexed = _indexed_terms(terms, mode, min_token_size, stopwords)
+    conditions = []
+    params = []
+    if indexed:
+        conditions.append(f"MATCH({FULLTEXT_COLUMNS}) AGAINST (%s IN BOOLEAN MODE)")
+        params.append(' '.join(f"+{term}*" for term in indexed))
+    for term in terms:
+        if term not in indexed:
+            conditions.append("(catalog_name LIKE %s OR catalog_description LIKE %s)")
+            params += [_like_pattern(term)] * 2
+    return " AND ".join(conditions), tuple(params)
+
+def build_relevance_expression(search_term: str, mode: str = 'fulltext', min_token_size: int = 3,
+                               stopwords: frozenset = INNODB_DEFAULT_STOPWORDS) -> tuple[str, tuple]:
+    """
+    Returns a SELECT expression scoring how well a row matches the search term.
+    Without indexed words every matching row scores 0, so ranking falls back to catalog_id.
+    """
+    indexed = _indexed_terms(tokenize(search_term), mode, min_token_size, stopwords)
+    if not indexed:
+        return "0", ()
+    return (f"MATCH({FULLTEXT_COLUMNS}) AGAINST (%s IN BOOLEAN MODE)",
+            (' '.join(f"{term}*" for term in indexed),))
@@ -1,20 +1,35 @@
-from datetime import datetime
+from datetime import date, datetime, time as day_start, timedelta
 import re
+import time
 from exception.catalog_exception import ValidationError
+from dto.catalog import Catalog
 
-def validate_date(value: str) -> str:
-    """
-    Validates a date string (YYYY-MM-DD) ensuring it's not empty or in the past.
-    """
-    if not value:
-        raise ValidationError("Date cannot be empty.")
-    try:
-        date_obj = datetime.strptime(value, "%Y-%m-%d")
-        if date_obj < datetime.today().replace(hour=0, minute=0, second=0, microsecond=0):
-            raise ValidationError("Date cannot be in the past.")
-        return value
-    except ValueError:
-        raise ValidationError("Invalid date format. Useレンダー-MM-DD.")
+STATUSES = ('active', 'inactive', 'upcoming', 'expired')
+
+_TEXT_PATTERN = re.compile(r'^[A-Za-z0-9\s.,!?-]+$')
+_DATE_PATTERN = re.compile(r'([0-9]{4})-([0-9]{1,2})-([0-9]{1,2})')
+
+class _Today:
+    """Today's local date, recomputed only when the day rolls over instead of on every validation."""
+    def __init__(self):
+        self._value = None
+        self._expires_at = 0.0
+
+    def __call__(self) -> date:
+        now = time.time()
+        if now >= self._expires_at:
+            self._value = datetime.fromtimestamp(now).date()
+            self._expires_at = datetime.combine(self._value + timedelta(days=1), day_start()).timestamp()
+        return self._value
+
+today = _Today()
+
+def _parse_date(value: str) -> date:
+    """Parses YYYY-MM-DD (single-digit months and days allowed, as with strptime); raises ValueError."""
+    match = _DATE_PATTERN.fullmatch(value)
+    if match is None:
+        raise ValueError(value)
+    return date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
 
 def validate_int(value: str) -> int:
     """
@@ -31,7 +46,7 @@ def validate_alphanumeric_string(value: str, field_name: str, max_length: int =
     """
     if not value:
         raise ValidationError(f"{field_name} cannot be empty.")
-    if not re.match(r'^[A-Za-z0-9\s.,!?-]+$', value):
+    if not _TEXT_PATTERN.match(value):
         raise ValidationError(f"{field_name} must contain only letters, numbers, spaces, and common punctuation (.,!?-).")
     if max_length and len(value) > max_length:
         raise ValidationError(f"{field_name} cannot exceed {max_length} characters.")
@@ -41,10 +56,136 @@ def validate_status(value: str) -> str:
     """
     Validates a status string against allowed values, case-insensitively.
     """
-    allowed = ['active', 'inactive', 'upcoming', 'expired']
     if not value:
         raise ValidationError("Status cannot be empty.")
     value_lower = value.strip().lower()
+    if value_lower not in STATUSES:
+        raise ValidationError(f"Status must be one of: {', '.join(STATUSES)}.")
+    return value_lower
+
+# Catalog payload fields: (key, label, kind, max_length). Order decides which error is reported first.
+CATALOG_SCHEMA = (
+    ('name', "Name", 'text', 30),
+    ('description', "Description", 'text', 50),
+    ('start_date', "Start Date", 'date', None),
+    ('end_date', "End Date", 'date', None),
+    ('status', "Status", 'status', None)
+)
+
+def _text_checker(label: str, max_length: int):
+    return lambda value, current_date: validate_alphanumeric_string(value, label, max_length)
+
+def _date_checker(label: str, max_length: int):
+    def check(value, current_date):
+        if not value:
+            raise ValidationError(f"{label} cannot be empty.")
+        try:
+            parsed = _parse_date(value)
+        except ValueError:
+            raise ValidationError(f"Invalid {label} format. Use YYYY-MM-DD.")
+        if parsed < current_date:
+            raise ValidationError(f"{label} cannot be in the past.")
+        return parsed
+    return check
+
+def _status_checker(label: str, max_length: int):
+    return lambda value, current_date: validate_status(value)
+
+_CHECKERS = {'text': _text_checker, 'date': _date_checker, 'status': _status_checker}
+
+class CatalogValidator:
+    """
+    Validates catalog payloads against a field schema compiled once into per-field checkers.
+    Every field is parsed exactly once (dates become date objects and are reused for the
+    start/end comparison), and today's date is looked up once per payload or batch.
+    """
+    def __init__(self, schema: tuple = CATALOG_SCHEMA):
+        self._fields = [(key, _CHECKERS[kind](label, max_length)) for key, label, kind, max_length in schema]
+
+    def validate(self, data: dict, current_date: date = None) -> Catalog:
+        """Validates one payload and builds the Catalog DTO; raises ValidationError on the first bad field."""
+        if not isinstance(data, dict):
+            raise ValidationError("Catalog data must be a JSON object.")
+        if current_date is None:
+            current_date = today()
+        try:
+            name, description, start_date, end_date, status = [
+                check(data.get(key), current_date) for key, check in self._fields]
+        except (TypeError, AttributeError):
+            raise ValidationError("Catalog fields must be strings.")
+        if start_date > end_date:
+            raise ValidationError("End Date cannot be before Start Date.")
+        return Catalog(name, description, start_date, end_date, status)
+
+    def validate_batch(self, items: list) -> list:
+        """
+        Validates a list of payloads against the same date, returning one result per item:
+        the Catalog DTO, or the ValidationError it failed with.
+        """
+        current_date = today()
+        results = []
+        for data in items:
+            try:
+                results.append(self.validate(data, current_date))
+            except ValidationError as e:
+                results.append(e)
+        return results
+
+catalog_validator = CatalogValidator()
+
+def validate_catalog_payload(data: dict) -> Catalog:
+    """
+    Validates a catalog payload (JSON object or parsed import record) and builds the Catalog DTO.
+    Dates in the DTO are date objects.
+    """
+    return catalog_validator.validate(data)
+
+def validate_limit(value: str, default: int, maximum: int) -> int:
+    """
+    Validates a page size, falling back to the default when absent and capping it at maximum.
+    """
+    if not value:
+        return default
+    if not value.isdigit() or int(value) <= 0:
+        raise ValidationError("Limit must be a positive integer.")
+    return min(int(value), maximum)
+
+def validate_choice(value: str, field_name: str, allowed: tuple, default: str) -> str:
+    """
+    Validates an optional value against a fixed set of choices, case-insensitively.
+    """
+    if not value:
+        return default
+    value_lower = value.strip().lower()
     if value_lower not in allowed:
-        raise ValidationError(f"Status must be one of: {', '.join(allowed)}.")
-    return value_lower
\ No newline at end of file
+        raise ValidationError(f"{field_name} must be one of: {', '.join(allowed)}.")
+    return value_lower
+
+def validate_fields(value: str, allowed: tuple) -> list:
+    """
+    Validates a comma-separated field projection, returning None when all fields are requested.
+    """
+    if not value:
+        return None
+    fields = [field.strip().lower() for field in value.split(',') if field.strip()]
+    unknown = [field for field in fields if field not in allowed]
+    if unknown:
+        raise ValidationError(f"Unknown field(s): {', '.join(unknown)}. Allowed: {', '.join(allowed)}.")
+    return fields or None
+
+def validate_change_token(value: str) -> int:
+    """
+    Validates a change-feed token, a non-negative integer issued by the changes API.
+    """
+    if not value or not value.strip().isdigit():
+        raise ValidationError("Change token must be a non-negative integer.")
+    return int(value)
+
+def validate_filter_date(value: str, field_name: str) -> date:
+    """
+    Validates a YYYY-MM-DD date used to filter lists. Unlike catalog dates, past dates are allowed.
+    """
+    try:
+        return _parse_date(value.strip())
+    except ValueError:
+        raise ValidationError(f"{field_name} must be a date in YYYY-MM-DD format.")